@@ -0,0 +1 @@
+"""Performance benchmarks for the Pig Dice Game package."""
@@ -0,0 +1,106 @@
+"""Run the benchmark suite and compare it with a stored baseline.
+
+``python -m bench`` writes results to ``bench_output.json`` and compares them
+with ``bench/baseline.json``; the exit status is 1 when any case is slower
+than the baseline by more than ``--threshold``. ``--save-baseline`` replaces
+the baseline with the current run.
+
+Start-up cases (``cli.startup[...]``) must also stay under an absolute
+budget, ``--startup-budget`` seconds per launch, whatever the baseline says.
+"""
+from __future__ import annotations
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .cases import all_cases
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+def run(selected: Optional[List[str]], sizes, min_time: float) -> Dict[str, float]:
+    """Run the cases matching ``selected`` (all if empty), printing each result."""
+    results: Dict[str, float] = {}
+    for name, case in all_cases(sizes).items():
+        if selected and not any(s in name for s in selected):
+            continue
+        results[name] = case(min_time)
+        print(f"{name:<36} {results[name]:>14,.0f} ops/s", flush=True)
+    return results
+
+
+def compare(
+    results: Dict[str, float], baseline: Dict[str, float], threshold: float
+) -> List[str]:
+    """Return a message for every case that regressed past ``threshold``."""
+    failures = []
+    for name, ops in results.items():
+        base = baseline.get(name)
+        if base and ops < base * (1 - threshold):
+            change = ops / base - 1
+            failures.append(
+                f"{name}: {ops:,.0f} ops/s vs baseline {base:,.0f} ({change:+.0%})"
+            )
+    return failures
+
+
+def over_budget(results: Dict[str, float], budget: float) -> List[str]:
+    """Return a message for every start-up case slower than ``budget`` seconds."""
+    return [
+        f"{name}: {1 / ops:.3f} s per launch, budget {budget:.3f} s"
+        for name, ops in results.items()
+        if name.startswith("cli.startup") and ops and 1 / ops > budget
+    ]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks; return 1 on a regression or a missed start-up budget."""
+    parser = argparse.ArgumentParser(description="Pig dice performance benchmarks.")
+    parser.add_argument(
+        "cases", nargs="*", help="only run cases whose name contains one of these"
+    )
+    parser.add_argument(
+        "--sizes", default="1000,100000,1000000", help="high-score table sizes"
+    )
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per case")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)"
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        default=0.3,
+        help="max seconds to the CLI prompt",
+    )
+    parser.add_argument("--output", default="bench_output.json")
+    parser.add_argument("--baseline", default=str(BASELINE))
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args(argv)
+
+    sizes = tuple(int(s) for s in args.sizes.split(",") if s)
+    results = run(args.cases, sizes, args.min_time)
+    report = {"python": platform.python_version(), "results": results}
+    text = json.dumps(report, indent=2) + "\n"
+    Path(args.output).write_text(text, encoding="utf-8")
+    if args.save_baseline:
+        Path(args.baseline).write_text(text, encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    slow = over_budget(results, args.startup_budget)
+    for line in slow:
+        print(f"OVER BUDGET {line}")
+    if not Path(args.baseline).exists():
+        print("No baseline to compare with; run with --save-baseline first.")
+        return 1 if slow else 0
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+    failures = compare(results, baseline, args.threshold)
+    for line in failures:
+        print(f"REGRESSION {line}")
+    return 1 if failures or slow else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,53 @@
+"""Compare the scalar :class:`~dice.game.Game` engine with batch simulation.
+
+Run with ``python -m bench.bench_simulate [games]``.
+"""
+from __future__ import annotations
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from dice.computer import Computer, Intelligence
+from dice.game import Game
+from dice.highscore import HighScore
+from dice.simulate import play_game, simulate_batch
+
+
+def scalar_games(n: int, seed: int = 1) -> float:
+    """Return the seconds needed to play ``n`` games through :class:`Game`."""
+    random.seed(seed)
+    with tempfile.TemporaryDirectory() as td:
+        hs = HighScore(path=str(Path(td) / "hs.json"))
+        start = time.perf_counter()
+        for _ in range(n):
+            bots = [
+                Computer("a", "A", Intelligence(20)),
+                Computer("b", "B", Intelligence(20)),
+            ]
+            game = Game(bots, highs=hs)
+            game.start()
+            play_game(game)
+        return time.perf_counter() - start
+
+
+def batch_games(n: int, seed: int = 1) -> float:
+    """Return the seconds needed to play ``n`` games with :func:`simulate_batch`."""
+    start = time.perf_counter()
+    simulate_batch([Intelligence(20), Intelligence(20)], n, rng=random.Random(seed))
+    return time.perf_counter() - start
+
+
+def main(argv: list[str]) -> None:
+    """Print games per second for both engines over ``argv[0]`` games."""
+    n = int(argv[0]) if argv else 20_000
+    scalar = scalar_games(n)
+    batch = batch_games(n)
+    print(f"scalar Game : {n / scalar:>10.0f} games/s ({scalar:.2f}s)")
+    print(f"batch       : {n / batch:>10.0f} games/s ({batch:.2f}s)")
+    print(f"speedup     : {scalar / batch:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
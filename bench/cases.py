@@ -0,0 +1,245 @@
+"""Benchmark cases. Each returns operations per second for one measurement.
+
+Cases that need files work inside a temporary directory, so nothing touches
+``public/``.
+"""
+from __future__ import annotations
+import contextlib
+import io
+import itertools
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator
+
+from dice.computer import Computer, Intelligence
+from dice.game import Game
+from dice.highscore import HighScore
+from dice.main import PigDiceGame, run_batch
+from dice.player import Player
+from dice.simulate import TurnSampler, play_game, simulate_batch
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def timed(op: Callable[[], object], min_time: float, repeat: int = 3) -> float:
+    """Return the best calls/second of ``repeat`` runs sharing ``min_time`` seconds."""
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        batch = 1
+        start = time.perf_counter()
+        while True:
+            for _ in range(batch):
+                op()
+            calls += batch
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time / repeat:
+                break
+            batch *= 2
+        best = max(best, calls / elapsed)
+    return best
+
+
+@contextlib.contextmanager
+def scratch_dir() -> Iterator[Path]:
+    """Run inside a fresh temporary working directory."""
+    old = os.getcwd()
+    with tempfile.TemporaryDirectory() as td:
+        os.chdir(td)
+        try:
+            yield Path(td)
+        finally:
+            os.chdir(old)
+
+
+def _game(td: Path, target: int) -> Game:
+    players = [Player("p1", "P1"), Player("p2", "P2")]
+    g = Game(players, target=target, highs=HighScore(str(td / "hs.json")))
+    g.start()
+    return g
+
+
+def game_roll(min_time: float) -> float:
+    """Measure rolls through the CLI's text path, target out of reach."""
+    random.seed(1)
+    with scratch_dir() as td:
+        return timed(_game(td, target=10**9).roll, min_time)
+
+
+def game_hold(min_time: float) -> float:
+    """Measure holds through the CLI's text path, target out of reach."""
+    with scratch_dir() as td:
+        return timed(_game(td, target=10**9).hold, min_time)
+
+
+def game_roll_result(min_time: float) -> float:
+    """Like ``game.roll`` but through the structured, message-free path."""
+    random.seed(1)
+    with scratch_dir() as td:
+        return timed(_game(td, target=10**9).roll_result, min_time)
+
+
+def game_hold_result(min_time: float) -> float:
+    """Like ``game.hold`` but through the structured, message-free path."""
+    with scratch_dir() as td:
+        return timed(_game(td, target=10**9).hold_result, min_time)
+
+
+def computer_games(min_time: float) -> float:
+    """Whole computer-vs-computer :class:`Game` instances per second."""
+    random.seed(1)
+    with scratch_dir() as td:
+        hs = HighScore(str(td / "hs.json"))
+
+        def one() -> None:
+            bots = [
+                Computer("a", "A", Intelligence(20)),
+                Computer("b", "B", Intelligence(20)),
+            ]
+            g = Game(bots, highs=hs)
+            g.start()
+            play_game(g)
+
+        return timed(one, min_time)
+
+
+def batch_games(min_time: float) -> float:
+    """Games per second through :func:`simulate_batch` with warm turn tables."""
+    brains = [TurnSampler(Intelligence(20), 100, 6) for _ in range(2)]
+    simulate_batch(brains, 2_000, rng=random.Random(0))  # warm the turn tables
+    rng = random.Random(1)
+    return 1_000 * timed(lambda: simulate_batch(brains, 1_000, rng=rng), min_time)
+
+
+def should_hold(min_time: float) -> float:
+    """Threshold decisions per second."""
+    brain = Intelligence(20)
+    return timed(lambda: brain.should_hold(12, 40, 55, 100), min_time)
+
+
+def _write_store(path: Path, players: int) -> None:
+    data = {
+        f"p{i:07d}": {
+            "name": f"P{i}",
+            "games": i % 50 + 1,
+            "wins": i % 37,
+            "turns": i % 500,
+            "points": i % 5000,
+        }
+        for i in range(players)
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def _populated_store(td: Path, players: int) -> HighScore:
+    _write_store(td / "hs.json", players)
+    hs = HighScore(str(td / "hs.json"))
+    hs.load()  # keep parsing out of the timed section
+    return hs
+
+
+def highscore_record_game(players: int) -> Callable[[float], float]:
+    """Amortised cost over two full compaction cycles of the journal."""
+
+    def case(min_time: float) -> float:  # noqa: ARG001 - fixed amount of work
+        with scratch_dir() as td:
+            hs = _populated_store(td, players)
+            rng = random.Random(1)
+            calls = 2 * hs.compact_every
+            start = time.perf_counter()
+            for _ in range(calls):
+                pid = f"p{rng.randrange(players):07d}"
+                hs.record_game(pid, "X", rng.random() < 0.5, 10, 80)
+            return calls / (time.perf_counter() - start)
+
+    return case
+
+
+def highscore_top(players: int) -> Callable[[float], float]:
+    """Leaderboard reads per second from a store of ``players`` rows."""
+
+    def case(min_time: float) -> float:
+        with scratch_dir() as td:
+            hs = _populated_store(td, players)
+            return timed(lambda: hs.top(10), min_time)
+
+    return case
+
+
+def cli_roundtrip(min_time: float) -> float:
+    """Shell commands per second, cycling show, roll, hold and highscore."""
+    random.seed(1)
+    commands = itertools.cycle(("show", "roll", "hold", "highscore"))
+    with scratch_dir(), contextlib.redirect_stdout(io.StringIO()) as out:
+        shell = PigDiceGame()
+
+        def one() -> None:
+            shell.onecmd(next(commands))
+            if shell.game.winner():
+                shell.onecmd("start")
+            out.seek(0)
+            out.truncate()
+
+        return timed(one, min_time)
+
+
+def cli_batch(min_time: float) -> float:
+    """Scripted games per second through ``run_batch``."""
+    script = ["start", "roll", "roll", "roll", "hold"]
+    games = itertools.count()
+    return timed(
+        lambda: run_batch(script, 1, io.StringIO(), seed=next(games)), min_time
+    )
+
+
+def cli_startup(players: int) -> Callable[[float], float]:
+    """Measure launches of ``python -m dice.main`` to the prompt (then ``quit``)."""
+
+    def case(min_time: float) -> float:
+        with scratch_dir() as td:
+            _write_store(td / "public" / "highscores.json", players)
+            env = dict(os.environ, PYTHONPATH=str(ROOT))
+            cmd = [sys.executable, "-m", "dice.main"]
+
+            def launch() -> None:
+                subprocess.run(
+                    cmd,
+                    input="quit\n",
+                    capture_output=True,
+                    text=True,
+                    env=env,
+                    check=True,
+                )
+
+            return timed(launch, min_time)
+
+    return case
+
+
+def all_cases(
+    sizes=(1_000, 100_000, 1_000_000),
+) -> Dict[str, Callable[[float], float]]:
+    """Return every case by name; sized cases get one entry per table size."""
+    cases: Dict[str, Callable[[float], float]] = {
+        "game.roll": game_roll,
+        "game.hold": game_hold,
+        "game.roll_result": game_roll_result,
+        "game.hold_result": game_hold_result,
+        "game.computer_vs_computer": computer_games,
+        "simulate.batch_games": batch_games,
+        "intelligence.should_hold": should_hold,
+        "cli.onecmd": cli_roundtrip,
+        "cli.batch_games": cli_batch,
+    }
+    for n in sizes:
+        cases[f"highscore.record_game[{n}]"] = highscore_record_game(n)
+        cases[f"highscore.top[{n}]"] = highscore_top(n)
+        cases[f"cli.startup[{n}]"] = cli_startup(n)
+    return cases
@@ -2,13 +2,35 @@
 
 
 Expose handy top-level imports for convenience when using the package as a module.
+
+
+The names below are resolved on first access, so ``import dice`` (and the
+start-up of ``python -m dice.main``) only loads the submodules actually used.
 """
-from .dice import Die
-from .dice_hand import DiceHand
-from .rules import Outcome, evaluate_roll, turn_points_gain
-from .player import Player
-from .computer import Intelligence, Computer
-from .game import Game
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+
+if TYPE_CHECKING:  # pragma: no cover
+   from .dice import Die
+   from .dice_hand import DiceHand
+   from .rules import Outcome, evaluate_roll, turn_points_gain
+   from .player import Player
+   from .computer import Intelligence, Computer
+   from .game import Game
+
+
+_LAZY = {
+   "Die": ".dice",
+   "DiceHand": ".dice_hand",
+   "Outcome": ".rules",
+   "evaluate_roll": ".rules",
+   "turn_points_gain": ".rules",
+   "Player": ".player",
+   "Intelligence": ".computer",
+   "Computer": ".computer",
+   "Game": ".game",
+}
 
 
 __all__ = [
@@ -22,3 +44,16 @@ __all__ = [
    "Computer",
    "Game",
 ]
+
+
+def __getattr__(name: str) -> Any:
+   module = _LAZY.get(name)
+   if module is None:
+       raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+   value = getattr(import_module(module, __name__), name)
+   globals()[name] = value
+   return value
+
+
+def __dir__() -> List[str]:
+   return sorted(set(globals()) | set(__all__))
@@ -26,6 +26,35 @@ class Intelligence:
 
 
 
+@dataclass
+class EndgameIntelligence(Intelligence):
+   """Threshold strategy that also looks at the opponent and the target.
+
+
+   The hold threshold moves by ``chase`` points for every 10 points the
+   opponent leads (down again when ahead), and once the opponent is within
+   ``race_at`` points of the target the player never holds short of winning.
+   """
+
+
+   chase: float = 0.0
+   race_at: int = 0
+
+
+   def should_hold(
+       self, turn_total: int, my_score: int, opp_score: int, target: int
+   ) -> bool:
+       """Hold at the shifted threshold; never hold short of winning in a race."""
+       if my_score + turn_total >= target:
+           return True
+       if self.race_at and opp_score >= target - self.race_at:
+           return False
+       shift = self.chase * (opp_score - my_score) / 10
+       return turn_total >= self.risk_threshold + shift
+
+
+
+
 class ComputerError(RuntimeError):
    """Raised when the Computer is used without a brain."""
 
@@ -1,8 +1,12 @@
 from __future__ import annotations
 import random
+from array import array
 from dataclasses import dataclass
 
 
+from .seeding import SeedLike, make_rng
+
+
 
 
 @dataclass
@@ -16,14 +20,36 @@ class Die:
        Number of sides on the die, default 6.
    rng: random.Random | None
        Optional random number generator, useful for testing.
+   seed: int | SeedSequence | None
+       Seed for a private generator, used when ``rng`` is not given.
    """
 
 
    sides: int = 6
    rng: random.Random | None = None
+   seed: SeedLike | None = None
+
+
+   def __post_init__(self) -> None:
+       """Derive ``rng`` from ``seed`` unless one was given."""
+       if self.rng is None:
+           self.rng = make_rng(self.seed)
 
 
    def roll(self) -> int:
        """Roll the die and return a value in ``[1, sides]``."""
        r = self.rng if self.rng is not None else random
        return r.randint(1, self.sides)
+
+
+   def roll_many(self, n: int) -> array:
+       """Roll the die ``n`` times and return the values as a compact array.
+
+       Uses one bulk ``choices`` call when the generator supports it and falls
+       back to ``randint`` per roll otherwise (e.g. scripted test doubles).
+       """
+       r = self.rng if self.rng is not None else random
+       typecode = "B" if self.sides < 256 else "H"
+       if hasattr(r, "choices"):
+           return array(typecode, r.choices(range(1, self.sides + 1), k=n))
+       return array(typecode, [r.randint(1, self.sides) for _ in range(n)])
@@ -1,25 +1,72 @@
 # dice/dice_hand.py
 """A small helper that rolls multiple dice at once."""
 from __future__ import annotations
-from typing import Tuple
+import random
+from array import array
+from typing import Iterator, Optional, Tuple
 from dataclasses import dataclass
 from .dice import Die
+from .seeding import SeedLike, make_rng
 
 
 
 
 @dataclass
 class DiceHand:
-   """A hand of N dice. Default is the two dice used in Pig variant."""
+   """A hand of N dice. Default is the two dice used in Pig variant.
+
+
+   With ``buffer > 0`` :meth:`roll` serves values from blocks of ``buffer``
+   rolls drawn in bulk by :meth:`roll_many` instead of one RNG call per die.
+
+
+   All dice share one generator: ``rng`` if given, else one derived from
+   ``seed`` (see :mod:`dice.seeding`), else the global ``random`` module.
+   """
 
 
    count: int = 2
+   buffer: int = 0
+   rng: Optional[random.Random] = None
+   seed: Optional[SeedLike] = None
 
 
    def __post_init__(self) -> None:
-       self._dice = [Die() for _ in range(self.count)]
+       if self.rng is None:
+           self.rng = make_rng(self.seed)
+       self._dice = [Die(rng=self.rng) for _ in range(self.count)]
+       self._stream: Optional[Iterator[Tuple[int, ...]]] = None
 
 
    def roll(self) -> Tuple[int, ...]:
        """Roll all dice and return a tuple of their values."""
+       if self.buffer > 0:
+           if self._stream is None:
+               self._stream = self.rolls(self.buffer)
+           return next(self._stream)
        return tuple(d.roll() for d in self._dice)
+
+
+   def roll_many(self, n: int) -> array:
+       """Roll the hand ``n`` times; return a flat row-major ``(n, count)`` array.
+
+
+       Row ``i`` is ``buf[i * count:(i + 1) * count]``. When all dice share a
+       generator the whole block is one bulk draw, so the sequence for a given
+       seed does not depend on how the rolls are chunked.
+       """
+       first = self._dice[0]
+       if all(d.rng is first.rng and d.sides == first.sides for d in self._dice):
+           return first.roll_many(n * self.count)
+       typecode = "B" if max(d.sides for d in self._dice) < 256 else "H"
+       out = array(typecode, [0]) * (n * self.count)
+       for col, d in enumerate(self._dice):
+           out[col::self.count] = array(typecode, d.roll_many(n))
+       return out
+
+
+   def rolls(self, chunk: int = 256) -> Iterator[Tuple[int, ...]]:
+       """Endless iterator of roll tuples, pre-drawn ``chunk`` rolls at a time."""
+       while True:
+           it = iter(self.roll_many(chunk))
+           yield from zip(*[it] * self.count)
@@ -0,0 +1,262 @@
+# dice/eventlog.py
+"""Append-only binary event log for games, and a streaming replay engine.
+
+Every record is four bytes, ``kind:u8 a:u8 b:u16`` (little endian):
+
+========== ============ ===================================================
+kind       a            b
+========== ============ ===================================================
+START      0            target; followed by one PLAYER record per seat
+PLAYER     seat         byte length of the pid; the UTF-8 pid follows,
+                        zero-padded to whole records
+ROLL       d1           d2
+BUST       seat         saved points lost
+AUTO_HOLD  seat         turn total banked by a single one
+HOLD       seat         turn total banked voluntarily
+WIN        seat         final score of the winner
+========== ============ ===================================================
+
+The replay engine re-applies ROLL and HOLD records through :mod:`dice.rules`
+and checks every derived record (BUST, AUTO_HOLD, WIN) against its own
+result. The log is read in fixed-size chunks, so its size does not matter.
+"""
+from __future__ import annotations
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .rules import Outcome, outcome_table
+
+
+START, PLAYER, ROLL, BUST, AUTO_HOLD, HOLD, WIN = range(1, 8)
+_RECORD = struct.Struct("<BBH")
+_CHUNK = 1 << 20
+
+
+class ReplayError(ValueError):
+    """Raised when a log does not match what the rules produce."""
+
+
+class EventLog:
+    """Buffered writer for the event stream of one or more games."""
+
+    def __init__(self, path: str, buffer_size: int = 1 << 16) -> None:
+        """Append to ``path``, writing once ``buffer_size`` bytes are waiting."""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._fh = open(path, "ab")
+        self._buf = bytearray()
+        self._limit = buffer_size
+
+    def emit(self, kind: int, a: int = 0, b: int = 0) -> None:
+        """Buffer one record."""
+        self._buf += _RECORD.pack(kind, a, b)
+        if len(self._buf) >= self._limit:
+            self.flush()
+
+    def game_start(self, target: int, pids: List[str]) -> None:
+        """Buffer the START record and one PLAYER record per seat."""
+        self.emit(START, 0, target)
+        for seat, pid in enumerate(pids):
+            raw = pid.encode("utf-8")
+            self.emit(PLAYER, seat, len(raw))
+            self._buf += raw + bytes(-len(raw) % _RECORD.size)
+
+    def flush(self) -> None:
+        """Write the buffered records to the file."""
+        if self._buf:
+            self._fh.write(self._buf)
+            self._buf.clear()
+        self._fh.flush()
+
+    def close(self) -> None:
+        """Flush and close the file."""
+        self.flush()
+        self._fh.close()
+
+    def __enter__(self) -> "EventLog":
+        """Use the log as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        """Close the log."""
+        self.close()
+
+
+def read_events(
+    path: str, chunk: int = _CHUNK
+) -> Iterator[Tuple[int, int, int, bytes]]:
+    """Stream ``(kind, a, b, payload)`` records; ``payload`` is a PLAYER's pid.
+
+    A torn trailing record (crash mid-write) is ignored.
+    """
+    chunk -= chunk % _RECORD.size
+    pack = _RECORD.pack
+    pending: Optional[Tuple[int, int, int]] = None
+    payload = bytearray()
+    words = 0
+    with open(path, "rb") as fh:
+        while True:
+            data = fh.read(chunk)
+            if not data:
+                return
+            if len(data) % _RECORD.size:
+                data = data[: len(data) - len(data) % _RECORD.size]
+            for rec in _RECORD.iter_unpack(data):
+                if words:
+                    payload += pack(*rec)
+                    words -= 1
+                    if not words:
+                        kind, seat, size = pending
+                        yield kind, seat, size, bytes(payload[:size])
+                        payload.clear()
+                    continue
+                if rec[0] == PLAYER:
+                    words = -(-rec[2] // _RECORD.size)
+                    if not words:
+                        yield PLAYER, rec[1], 0, b""
+                    pending = rec
+                    continue
+                yield rec[0], rec[1], rec[2], b""
+
+
+@dataclass
+class GameSummary:
+    """One replayed game; ``winner`` is a seat, or ``None`` if the log stops early."""
+
+    pids: List[str]
+    target: int
+    winner: Optional[int]
+    turns: int
+    scores: List[int]
+
+
+@dataclass
+class ReplayResult:
+    """Aggregates rebuilt from a log, in the shape of high-score records."""
+
+    events: int = 0
+    games: int = 0
+    totals: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def _add(self, pid: str, won: bool, turns: int, points: int) -> None:
+        rec = self.totals.setdefault(
+            pid, {"games": 0, "wins": 0, "turns": 0, "points": 0}
+        )
+        rec["games"] += 1
+        rec["wins"] += 1 if won else 0
+        rec["turns"] += turns
+        rec["points"] += points
+
+
+def replay(
+    path: str, on_game: Optional[Callable[[GameSummary], None]] = None
+) -> ReplayResult:
+    """Re-run a log through the rules, verifying it and rebuilding totals.
+
+    Raises :class:`ReplayError` at the first record that disagrees with the
+    rules. ``on_game`` receives every finished (or truncated) game.
+    """
+    table = outcome_table(6)
+    result = ReplayResult()
+    game: Optional[GameSummary] = None
+    seat = total = 0
+
+    def finish() -> None:
+        if game is None:
+            return
+        result.games += 1
+        if game.winner is not None:
+            for s, pid in enumerate(game.pids):
+                result._add(pid, s == game.winner, game.turns + 1, game.scores[s])
+        if on_game:
+            on_game(game)
+
+    n = 0
+    expect: Optional[Tuple[int, int, int]] = None
+    for kind, a, b, payload in read_events(path):
+        n += 1
+        result.events = n
+        if expect is not None:
+            if (kind, a, b) != expect:
+                raise ReplayError(f"event {n}: expected {expect}, got {(kind, a, b)}")
+            expect = None
+            if kind == WIN:
+                game.winner = a
+                continue
+            if kind == BUST or kind == AUTO_HOLD:
+                if kind == AUTO_HOLD and game.scores[seat] >= game.target:
+                    expect = (WIN, seat, game.scores[seat])
+                    continue
+                seat, total = 1 - seat, 0
+                game.turns += 1
+                continue
+        if kind == ROLL:
+            if game is None or game.winner is not None:
+                raise ReplayError(f"event {n}: roll outside a running game")
+            if 0 < a <= 6 and 0 < b <= 6:
+                outcome, gain = table[(a - 1) * 6 + b - 1]
+            else:
+                outcome = Outcome.AUTO_HOLD if 1 in (a, b) else Outcome.CONTINUE
+                gain = 0 if 1 in (a, b) else a + b
+            if outcome is Outcome.CONTINUE:
+                total += gain
+            elif outcome is Outcome.AUTO_HOLD:
+                expect = (AUTO_HOLD, seat, total)
+                game.scores[seat] += total
+            else:
+                expect = (BUST, seat, game.scores[seat])
+                game.scores[seat] = 0
+        elif kind == HOLD:
+            if game is None or game.winner is not None:
+                raise ReplayError(f"event {n}: hold outside a running game")
+            if (a, b) != (seat, total):
+                raise ReplayError(
+                    f"event {n}: hold ({a}, {b}) but replay has ({seat}, {total})"
+                )
+            game.scores[seat] += total
+            if game.scores[seat] >= game.target:
+                expect = (WIN, seat, game.scores[seat])
+            else:
+                seat, total = 1 - seat, 0
+                game.turns += 1
+        elif kind == START:
+            finish()
+            game = GameSummary([], b, None, 0, [0, 0])
+            seat = total = 0
+        elif kind == PLAYER:
+            game.pids.append(payload.decode("utf-8"))
+        else:
+            raise ReplayError(f"event {n}: unexpected kind {kind}")
+    if expect is not None:
+        raise ReplayError(f"log ends before expected event {expect}")
+    finish()
+    return result
+
+
+def verify_highscores(result: ReplayResult, highs) -> List[str]:
+    """Compare replayed totals with a high-score store; return mismatch messages."""
+    problems = []
+    for pid, totals in result.totals.items():
+        stats = highs.stats_for(pid)
+        for key, value in totals.items():
+            if stats.get(key) != value:
+                problems.append(
+                    f"{pid}: {key} is {stats.get(key)} in the store, {value} in the log"
+                )
+    return problems
+
+
+def scripted_rolls(path: str, game_index: int) -> List[Tuple[int, int]]:
+    """Return the rolls of the ``game_index``-th game, ready for ``Game.set_cheat``."""
+    rolls: List[Tuple[int, int]] = []
+    index = -1
+    for kind, a, b, _ in read_events(path):
+        if kind == START:
+            index += 1
+            if index > game_index:
+                break
+        elif kind == ROLL and index == game_index:
+            rolls.append((a, b))
+    return rolls
@@ -0,0 +1,205 @@
+# dice/expert.py
+"""Monte Carlo roll/hold decisions under a per-decision time budget.
+
+Once the current roll is known, a turn ends in one of a few ways: a bust
+(my score drops to 0) or a hold with some turn total. Every ending leaves
+the opponent to move from a start-of-turn state ``(mine, theirs)``. The
+chance of each ending is computed exactly, assuming the rest of the turn
+follows ``risk_threshold``. Only the win probability ``V(mine, theirs)``
+of those states is estimated, by random play-outs with
+:func:`~dice.simulate.play_out`. Threshold strategies play both sides of
+each play-out. So::
+
+    hold = V(my + turn_total)
+    roll = sum(P(ending a) * V(a))
+
+Play-outs run in small batches, and each batch is spread over the states
+in proportion to how much they move ``roll - hold``. Sampling stops once
+the difference is ``z`` standard errors away from zero or the time budget
+is spent. Estimates of ``V`` are kept for the rest of the turn: deciding
+whether to hold at 16 reuses the play-outs that rated "bank 16" (a
+single 1 later in the turn) while deciding at 8.
+"""
+from __future__ import annotations
+import math
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .computer import Intelligence
+from .simulate import BUST, TurnSampler, play_out, roll_distribution
+
+
+def turn_endings(
+    policy: Intelligence,
+    turn_total: int,
+    my_score: int,
+    opp_score: int,
+    target: int,
+    sides: int = 6,
+) -> Dict[int, float]:
+    """Return how the turn ends if the player rolls now, then follows ``policy``.
+
+    Keys are :data:`~dice.simulate.BUST` or the turn total banked (capped at
+    the points still needed to win), values are probabilities.
+    """
+    p_bust, p_auto, gains = roll_distribution(sides)
+    need = target - my_score
+    out: Dict[int, float] = {BUST: p_bust}
+    out[turn_total] = p_auto
+    pending: Dict[int, float] = {}
+    for gain, p in gains.items():
+        t = min(turn_total + gain, need)
+        pending[t] = pending.get(t, 0.0) + p
+    while pending:
+        t = min(pending)
+        p = pending.pop(t)
+        if t >= need or policy.should_hold(t, my_score, opp_score, target):
+            out[t] = out.get(t, 0.0) + p
+            continue
+        out[BUST] += p * p_bust
+        out[t] = out.get(t, 0.0) + p * p_auto
+        for gain, pg in gains.items():
+            nt = min(t + gain, need)
+            pending[nt] = pending.get(nt, 0.0) + p * pg
+    return out
+
+
+class _ThresholdSampler(TurnSampler):
+    """Turn tables for a plain :class:`Intelligence`.
+
+    Such a policy holds at ``min(risk_threshold, target - my_score)``, so
+    one table per distinct stop point serves every score pair and play-outs
+    do not stall building tables for states they visit for the first time.
+    """
+
+    def __init__(self, brain: Intelligence, target: int, sides: int) -> None:
+        """Start with no tables; they are built per stop point on demand."""
+        super().__init__(brain, target, sides)
+        self._by_stop: Dict[int, Tuple[List[float], List[int]]] = {}
+
+    def table(self, my_score: int, opp_score: int) -> Tuple[List[float], List[int]]:
+        """Return the shared table for the stop point at ``my_score``."""
+        stop = min(self.brain.risk_threshold, self.target - my_score)
+        tab = self._by_stop.get(stop)
+        if tab is None:
+            tab = self._by_stop[stop] = super().table(my_score, opp_score)
+        self.tables[(my_score, opp_score)] = tab
+        return tab
+
+
+@dataclass
+class RolloutIntelligence(Intelligence):
+    """``expert`` strategy: roll or hold, whichever wins more simulated games.
+
+    ``risk_threshold`` is the policy assumed for the rest of this turn and
+    for later turns; ``opponent_threshold`` models the opponent. Each
+    decision spends at most ``budget`` seconds of ``clock`` on play-outs.
+    """
+
+    risk_threshold: int = 20
+    opponent_threshold: int = 20
+    budget: float = 0.005
+    batch: int = 32
+    z: float = 2.0
+    sides: int = 6
+    seed: Optional[int] = None
+    clock: Callable[[], float] = field(
+        default=time.perf_counter, repr=False, compare=False
+    )
+    rollouts: int = field(default=0, init=False, repr=False, compare=False)
+    _rng: random.Random = field(init=False, repr=False, compare=False)
+    _samplers: Dict[int, List[TurnSampler]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _turn: Optional[Tuple[int, int, int]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _values: Dict[int, List[int]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _policy: Intelligence = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Seed the play-out generator and build the assumed policy."""
+        self._rng = random.Random(self.seed)
+        self._policy = Intelligence(self.risk_threshold)
+
+    def _sample(
+        self, mine: int, theirs: int, target: int, n: int, deadline: float
+    ) -> bool:
+        """Play up to ``n`` games from the opponent's turn; ``False`` if out of time."""
+        samplers = self._samplers.get(target)
+        if samplers is None:
+            samplers = self._samplers[target] = [
+                _ThresholdSampler(self._policy, target, self.sides),
+                _ThresholdSampler(
+                    Intelligence(self.opponent_threshold), target, self.sides
+                ),
+            ]
+        stat = self._values.setdefault(mine, [0, 0])
+        for _ in range(n):
+            winner, _turns = play_out(
+                samplers, [mine, theirs], 1, target, self._rng, 10_000
+            )
+            stat[0] += winner == 0
+            stat[1] += 1
+            self.rollouts += 1
+            if self.clock() >= deadline:
+                return False
+        return True
+
+    def _estimate(
+        self, coef: Dict[int, float], known: float
+    ) -> Optional[Tuple[float, float, int]]:
+        """Return ``(roll - hold, std error, play-outs)``, or ``None`` if unknown."""
+        diff, var, total = known, 0.0, 0
+        for a, c in coef.items():
+            wins, n = self._values.get(a, (0, 0))
+            if not n:
+                return None
+            # keeps the error estimate honest for 0 or n wins
+            p = (wins + 1) / (n + 2)
+            diff += c * wins / n
+            var += c * c * p * (1.0 - p) / n
+            total += n
+        return diff, math.sqrt(var), total
+
+    def should_hold(
+        self, turn_total: int, my_score: int, opp_score: int, target: int
+    ) -> bool:
+        """Hold when play-outs show holding wins more often, within the budget."""
+        if my_score + turn_total >= target:
+            return True
+        if turn_total == 0:
+            return False  # holding nothing just hands over the dice
+        if self._turn != (my_score, opp_score, target):
+            self._turn = (my_score, opp_score, target)
+            self._values.clear()
+        deadline = self.clock() + self.budget
+        # roll - hold = sum(coef[a] * V(a)); V is 1 once my score reaches the target
+        coef: Dict[int, float] = {my_score + turn_total: -1.0}
+        endings = turn_endings(
+            self._policy, turn_total, my_score, opp_score, target, self.sides
+        )
+        for t, p in endings.items():
+            a = 0 if t == BUST else my_score + t
+            coef[a] = coef.get(a, 0.0) + p
+        known = sum(c for a, c in coef.items() if a >= target)
+        coef = {a: c for a, c in coef.items() if a < target and abs(c) > 1e-12}
+        weight = sum(abs(c) for c in coef.values())
+        while True:
+            est = self._estimate(coef, known)
+            settled = est is not None and est[2] >= self.batch
+            if settled and abs(est[0]) > self.z * est[1]:
+                return est[0] < 0.0
+            if self.clock() >= deadline:
+                if est is None:
+                    policy = self._policy
+                    return policy.should_hold(turn_total, my_score, opp_score, target)
+                return est[0] < 0.0
+            for a, c in coef.items():
+                n = max(1, round(self.batch * abs(c) / weight))
+                if not self._sample(a, opp_score, target, n, deadline):
+                    break
@@ -6,16 +6,26 @@ This class contains no I/O; the CLI in ``main.py`` handles printing.
 """
 from __future__ import annotations
 import itertools as it
+import time
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
 
 from .dice_hand import DiceHand
 from .player import Player
 from .computer import Computer, Intelligence
-from .rules import evaluate_roll, turn_points_gain, Outcome
-from .highscore import HighScore
+from .rules import evaluate, Outcome
+from .highscore import HighScore, MemoryHighScore, default_highscore
+from .metrics import Metrics
+from .state import GameState
+from .rolls import QueueSource, RollSource
+from .results import HoldResult, RollResult
+from .eventlog import AUTO_HOLD, BUST, HOLD, ROLL, WIN, EventLog
+from .seeding import SeedLike
+
+
+_result = tuple.__new__  # builds a result tuple, skipping its keyword-parsing __new__
 
 
 
@@ -24,26 +34,61 @@ from .highscore import HighScore
 class Game:
    players: List[Player]
    target: int = 100
-   dice: DiceHand = field(default_factory=DiceHand)
+   dice: Optional[DiceHand] = None  # a buffered pair of dice unless given
    highs: Optional[HighScore] = None
+   metrics: Optional[Metrics] = None
+   events: Optional[EventLog] = None
+   seed: Optional[SeedLike] = None
 
 
    def __post_init__(self) -> None:
-       self.highs = self.highs or HighScore()
+       if self.dice is None:
+           # e.g. seed=SeedSequence(root).child(i) re-creates game i of a batch
+           self.dice = DiceHand(buffer=64, seed=self.seed)
+       elif self.seed is not None:
+           raise ValueError(
+               "pass either dice or seed, not both; seed the DiceHand itself instead"
+           )
+       self.highs = self.highs if self.highs is not None else default_highscore()
        self.turn_total = 0
        self.turns_taken = 0
        self._current_idx = 0
        self._winner: Optional[Player] = None
-       self._cheat_queue: List[Tuple[int, int]] = []
+       self._source: Optional[RollSource] = None
 
 
    # ---- lifecycle ----
    @classmethod
-   def vs_computer(cls, human_name: str = "You", ai_level: str = "medium", target: int = 100) -> "Game":
-       level = {"easy": 15, "medium": 20, "hard": 25}.get(ai_level, 20)
+   def vs_computer(
+       cls,
+       human_name: str = "You",
+       ai_level: str = "medium",
+       target: int = 100,
+       highs: Optional[HighScore] = None,
+       metrics: Optional[Metrics] = None,
+   ) -> "Game":
+       """Create a game of a human against the computer at ``ai_level``."""
+       if ai_level == "expert":
+           from .expert import RolloutIntelligence  # deferred to keep start-up fast
+           brain: Intelligence = RolloutIntelligence()
+       else:
+           threshold = {"easy": 15, "medium": 20, "hard": 25}.get(ai_level, 20)
+           brain = Intelligence(threshold)
        p1 = Player(str(uuid.uuid4()), human_name)
-       bot = Computer(str(uuid.uuid4()), "Computer", Intelligence(level))
-       return cls([p1, bot], target=target)
+       bot = Computer(str(uuid.uuid4()), "Computer", brain)
+       return cls([p1, bot], target=target, highs=highs, metrics=metrics)
+
+
+   @classmethod
+   def headless(cls, players: List[Player], target: int = 100, **kwargs) -> "Game":
+       """Create a game that never touches disk (see :class:`MemoryHighScore`).
+
+
+       Pass ``highs=`` to share one in-memory store across many games, then
+       write it out once with ``MemoryHighScore.flush_to``.
+       """
+       kwargs.setdefault("highs", MemoryHighScore())
+       return cls(players, target=target, **kwargs)
 
 
    def start(self) -> None:
@@ -53,7 +98,9 @@ class Game:
        self.turns_taken = 0
        self._current_idx = 0
        self._winner = None
-       self._cheat_queue.clear()
+       self.set_roll_source(None)
+       if self.events is not None:
+           self.events.game_start(self.target, [p.pid for p in self.players])
 
 
    # ---- properties ----
@@ -76,55 +123,252 @@ class Game:
 
 
    def set_cheat(self, next_rolls: List[Tuple[int, int]]) -> None:
-       self._cheat_queue = list(next_rolls)
+       self.set_roll_source(QueueSource(next_rolls))
+
+
+   def set_roll_source(self, source: Optional[RollSource]) -> None:
+       """Take scripted rolls from ``source`` (see :mod:`dice.rolls`) until it runs dry.
+
+       The source it replaces is closed, releasing e.g. a :class:`RollFile`'s mapping.
+       """
+       old = self._source
+       if old is not None and old is not source:
+           old.close()
+       self._source = source
+
+
+   def pending_rolls(self) -> List[Tuple[int, int]]:
+       """Return the scripted rolls still queued; streamed sources report none."""
+       return self._source.pending() if self._source is not None else []
+
+
+   # ---- snapshots ----
+   def snapshot(self) -> bytes:
+       """Serialize the game state into a few dozen bytes (see :mod:`dice.state`)."""
+       return GameState.from_game(self).to_bytes()
+
+
+   def restore(self, data: bytes) -> None:
+       """Load a :meth:`snapshot` into this game; seat the players the same way."""
+       GameState.from_bytes(data).apply(self)
 
 
    def _roll_dice(self) -> Tuple[int, int]:
-       if self._cheat_queue:
-           return self._cheat_queue.pop(0)
+       if self._source is not None:
+           roll = self._source.next_roll()
+           if roll is not None:
+               return roll
        d1, d2 = self.dice.roll()
        return int(d1), int(d2)
 
 
    # ---- actions ----
    def roll(self) -> Tuple[int, int, str]:
+       """Roll for the current player; return the dice and the text to show."""
+       if self.metrics is None:
+           return self._roll()
+       m = self.metrics
+       had_winner = self._winner is not None
+       start = time.perf_counter()
+       d1, d2, message = self._roll()
+       m.observe("game.roll", time.perf_counter() - start)
+       if not had_winner:
+           m.inc("game.rolls")
+           outcome = evaluate(d1, d2)[0]
+           if outcome is Outcome.BUST_ALL:
+               m.inc("game.busts")
+           elif outcome is Outcome.AUTO_HOLD:
+               m.inc("game.auto_holds")
+           if self._winner is not None:
+               m.inc("game.wins")
+       return d1, d2, message
+
+
+   def hold(self, auto: bool = False) -> str:
+       """Bank the turn total for the current player; return the text to show."""
+       if self.metrics is None:
+           return self._hold(auto)
+       m = self.metrics
+       had_winner = self._winner is not None
+       start = time.perf_counter()
+       msg = self._hold(auto)
+       m.observe("game.hold", time.perf_counter() - start)
+       if not had_winner:
+           m.inc("game.holds")
+           if self._winner is not None:
+               m.inc("game.wins")
+       return msg
+
+
+   def roll_result(self) -> RollResult:
+       """Roll for the current player; like :meth:`roll` but no text is formatted."""
+       if self.metrics is None:
+           return self._roll_result()
+       m = self.metrics
+       start = time.perf_counter()
+       res = self._roll_result()
+       m.observe("game.roll", time.perf_counter() - start)
+       if res.outcome is not None:
+           m.inc("game.rolls")
+           if res.outcome is Outcome.BUST_ALL:
+               m.inc("game.busts")
+           elif res.outcome is Outcome.AUTO_HOLD:
+               m.inc("game.auto_holds")
+           if res.winner is not None:
+               m.inc("game.wins")
+       return res
+
+
+   def hold_result(self, auto: bool = False) -> HoldResult:
+       """Bank the turn total; like :meth:`hold` but no text is formatted."""
+       if self.metrics is None:
+           return self._hold_result(auto)
+       m = self.metrics
+       start = time.perf_counter()
+       res = self._hold_result(auto)
+       m.observe("game.hold", time.perf_counter() - start)
+       if not res.over:
+           m.inc("game.holds")
+           if res.winner is not None:
+               m.inc("game.wins")
+       return res
+
+
+   def decide_hold(self) -> bool:
+       """Ask the current (computer) player whether to hold its turn total."""
+       me, opp = self.current_player(), self.opponent()
+       if self.metrics is None:
+           return me.decide_hold(self.turn_total, me.score, opp.score, self.target)
+       start = time.perf_counter()
+       decision = me.decide_hold(self.turn_total, me.score, opp.score, self.target)
+       self.metrics.observe("game.decide_hold", time.perf_counter() - start)
+       return decision
+
+
+   # The text and structured paths below make the same moves; the text one
+   # formats as it goes so the CLI pays for no intermediate result object.
+   def _roll(self) -> Tuple[int, int, str]:
        if self._winner:
            return (0, 0, f"Game over. {self._winner.name} already won.")
 
 
        d1, d2 = self._roll_dice()
-       outcome = evaluate_roll(d1, d2)
+       outcome, gain = evaluate(d1, d2)
        message = ""
+       if self.events is not None:
+           self.events.emit(ROLL, d1, d2)
 
 
        if outcome is Outcome.CONTINUE:
-           gain = turn_points_gain(d1, d2)
            self.turn_total += gain
-           message = "\n"f"Rolled {d1}+{d2} → +{gain} this turn (total {self.turn_total})."
+           message = (
+               "\n"f"Rolled {d1}+{d2} → +{gain} this turn "
+               f"(total {self.turn_total})."
+           )
        elif outcome is Outcome.AUTO_HOLD:
            message = "\n"f"Rolled {d1}+{d2} (single 1) → auto-hold {self.turn_total}."
-           self.hold(auto=True)
+           self._hold(auto=True)
        else:  # BUST_ALL
-           self.current_player().reset_score()
+           self._bust()
            message = "\n"f"Rolled {d1}+{d2} (double ones) → lose all saved points!"
-           self._next_player()
-           self.turns_taken += 1
        return d1, d2, message
 
 
-   def hold(self, auto: bool = False) -> str:
+   def _hold(self, auto: bool = False) -> str:
        if self._winner:
            return "\n"f"Game over. {self._winner.name} already won."
        player = self.current_player()
        player.add_points(self.turn_total)
        msg = f"{player.name} holds {self.turn_total}. New score: {player.score}."
+       if self.events is not None:
+           kind = AUTO_HOLD if auto else HOLD
+           self.events.emit(kind, self._current_idx, self.turn_total)
        if player.score >= self.target:
-           self._winner = player
+           self._win(player)
            msg += "\n"f" \n{player.name} wins!"
-           # update highscores
-           if self.highs:
-               self.highs.record_game(player.pid, player.name, True, self.turns_taken + 1, player.score)
-               self.highs.record_game(self.opponent().pid, self.opponent().name, False, self.turns_taken + 1, self.opponent().score)
        self._next_player()
        self.turns_taken += 1
        return msg
+
+
+   def _roll_result(self) -> RollResult:
+       seat = self._current_idx
+       players = self.players
+       player = players[seat]
+       if self._winner:
+           s0, s1 = players[0].score, players[1].score
+           fields = (0, 0, None, 0, self.turn_total, seat, s0, s1, player, self._winner)
+           return _result(RollResult, fields)
+
+
+       d1, d2 = self._roll_dice()
+       outcome, gain = evaluate(d1, d2)
+       total = self.turn_total
+       if self.events is not None:
+           self.events.emit(ROLL, d1, d2)
+
+
+       if outcome is Outcome.CONTINUE:
+           total = self.turn_total = total + gain
+       elif outcome is Outcome.AUTO_HOLD:
+           self._bank(seat, player, True)
+       else:  # BUST_ALL
+           self._bust()
+       s0, s1 = players[0].score, players[1].score
+       fields = (d1, d2, outcome, gain, total, seat, s0, s1, player, self._winner)
+       return _result(RollResult, fields)
+
+
+   def _hold_result(self, auto: bool = False) -> HoldResult:
+       seat = self._current_idx
+       players = self.players
+       player = players[seat]
+       if self._winner:
+           s0, s1 = players[0].score, players[1].score
+           fields = (player, 0, seat, s0, s1, self._winner, auto, True)
+           return _result(HoldResult, fields)
+       points = self.turn_total
+       player.add_points(points)
+       if self.events is not None:
+           self.events.emit(AUTO_HOLD if auto else HOLD, seat, points)
+       if player.score >= self.target:
+           self._win(player)
+       self._current_idx = 1 - seat
+       self.turn_total = 0
+       self.turns_taken += 1
+       s0, s1 = players[0].score, players[1].score
+       fields = (player, points, seat, s0, s1, self._winner, auto, False)
+       return _result(HoldResult, fields)
+
+
+   def _bank(self, seat: int, player: Player, auto: bool) -> None:
+       """Auto-hold for :meth:`_roll_result`; :meth:`_hold_result` inlines it."""
+       points = self.turn_total
+       player.add_points(points)
+       if self.events is not None:
+           self.events.emit(AUTO_HOLD if auto else HOLD, seat, points)
+       if player.score >= self.target:
+           self._win(player)
+       self._current_idx = 1 - seat
+       self.turn_total = 0
+       self.turns_taken += 1
+
+
+   def _bust(self) -> None:
+       if self.events is not None:
+           self.events.emit(BUST, self._current_idx, self.current_player().score)
+       self.current_player().reset_score()
+       self._next_player()
+       self.turns_taken += 1
+
+
+   def _win(self, player: Player) -> None:
+       self._winner = player
+       if self.events is not None:
+           self.events.emit(WIN, self._current_idx, player.score)
+       # update highscores
+       if self.highs:
+           turns = self.turns_taken + 1
+           loser = self.opponent()
+           self.highs.record_game(player.pid, player.name, True, turns, player.score)
+           self.highs.record_game(loser.pid, loser.name, False, turns, loser.score)
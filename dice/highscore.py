@@ -1,63 +1,733 @@
-"""Simple JSON-backed high-score store keyed by player id (pid)."""
+"""Simple JSON-backed high-score store keyed by player id (pid).
+
+Changes are applied in memory and appended to a journal of small JSON lines
+next to the snapshot (``<path>.journal``). The journal is folded back into the
+snapshot every ``compact_every`` entries and on :meth:`HighScore.close`; on
+load the snapshot is read first and the journal tail is replayed on top, so
+a crash loses at most the entries that were not yet flushed.
+
+Every journal starts with a header line carrying a random generation id. A
+compacted snapshot remembers the generation it absorbed under the reserved
+``"_folded"`` key, so a crash between writing the snapshot and removing the
+journal never replays the same entries twice.
+
+Several processes may share one store. Journal appends and compactions run
+under an advisory lock on ``<path>.lock`` (:mod:`fcntl`; without it, e.g. on
+Windows, the store assumes a single writer). A compaction re-reads the
+snapshot and the whole journal from disk before writing, so it folds in the
+entries other processes appended instead of overwriting them, and it seals
+the journal first so a writer that races a crashed compaction can tell
+whether those entries already made it into the snapshot. Snapshots are
+written to a temporary file and renamed into place; a snapshot that no
+longer parses is moved aside to ``<path>.corrupt-<time>`` rather than
+silently reset.
+
+With ``shard=True`` a process appends to its own ``<path>.shard.<pid>.<id>``
+file without taking the lock. Any compaction folds the shards into the
+snapshot, e.g. :func:`merge_shards` or a :class:`ShardMerger` thread. The
+snapshot records how far each shard has been read under ``"_shards"``, and
+a shard is deleted once its owner has closed it (or died) and it is fully
+merged.
+
+With ``flush_every`` above 1 or a ``flush_interval``, entries wait in memory
+until a batch is due. There is no timer: the interval is only checked when
+the next entry is written, so an idle store keeps its batch until then, an
+explicit :meth:`HighScore.flush` or :meth:`HighScore.close`. An :mod:`atexit`
+hook flushes whatever is still waiting when the interpreter exits normally.
+
+Nothing is read from disk until the first call that needs the data, so
+creating a store (e.g. at CLI start-up) is free. :func:`default_highscore`
+returns one process-wide store for callers that do not bring their own.
+
+The leaderboard order ``(-wins, -win_rate, -points)`` is kept in a sorted key
+list that is patched with :mod:`bisect` whenever a record changes, so
+:meth:`HighScore.top` only touches the rows it returns and
+:meth:`HighScore.rank_of` is a binary search.
+"""
 from __future__ import annotations
+import atexit
+import glob
 import json
+import os
+import threading
+from bisect import bisect_left, insort
+import time
+import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, IO, Iterable, Iterator, List, Mapping, Optional, Tuple
+
+from .metrics import Metrics
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no advisory locks on this platform
+    fcntl = None  # type: ignore[assignment]
+
+
+_SEAL = b'{"sealed":true}\n'   # last journal line once a compaction has started
+_CLOSED = b'{"closed":true}\n'  # last shard line once its owner is done
+
+_TOTALS = ("games", "wins", "turns", "points")
+_RankKey = Tuple[int, float, int, int, str]  # -wins, -win_rate, -points, seq, pid
+
+
+def _alive(pid: int) -> bool:
+    """Whether process ``pid`` still exists (assumed so where it cannot be checked)."""
+    if os.name == "nt" or pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        pass
+    return True
+
+
+def aggregate_results(
+    results: Iterable[Mapping[str, Any]],
+    totals: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Fold game results into per-player totals for :meth:`HighScore.apply_totals`.
+
+    Each result has the fields of :meth:`HighScore.record_game`: ``pid``,
+    ``name``, ``won``, ``turns`` and ``points``. Pass ``totals`` to keep
+    adding to an earlier aggregate; memory grows with players, not games.
+    """
+    totals = {} if totals is None else totals
+    get = totals.get
+    for r in results:
+        pid = r["pid"]
+        rec = get(pid)
+        if rec is None:
+            rec = totals[pid] = {
+                "name": r["name"], "games": 0, "wins": 0, "turns": 0, "points": 0
+            }
+        else:
+            rec["name"] = r["name"]
+        rec["games"] += 1
+        if r["won"]:
+            rec["wins"] += 1
+        turns, points = int(r["turns"]), int(r["points"])
+        if turns > 0:
+            rec["turns"] += turns
+        if points > 0:
+            rec["points"] += points
+    return totals
 
 
 @dataclass
 class HighScore:
     path: str = "public/highscores.json"
+    flush_every: int = 1
+    flush_interval: Optional[float] = None
+    compact_every: int = 1000
+    metrics: Optional[Metrics] = field(default=None, repr=False, compare=False)
+    shard: bool = False
     _data: Dict[str, Dict[str, Any]] = field(default_factory=dict, init=False)
+    _pending: List[Dict[str, Any]] = field(default_factory=list, init=False, repr=False)
+    _journaled: int = field(default=0, init=False, repr=False)
+    _last_flush: float = field(default=0.0, init=False, repr=False)
+    _gen: Optional[str] = field(default=None, init=False, repr=False)
+    _order: List[_RankKey] = field(default_factory=list, init=False, repr=False)
+    _keys: Dict[str, _RankKey] = field(default_factory=dict, init=False, repr=False)
+    _loaded: bool = field(default=False, init=False, repr=False)
+    _offsets: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _shard_path: Optional[Path] = field(default=None, init=False, repr=False)
+    _seen: int = field(default=0, init=False, repr=False)
+    _snap: Optional[Tuple[int, int, int]] = field(default=None, init=False, repr=False)
+    _at_exit: bool = field(default=False, init=False, repr=False)
+
+    def load(self) -> None:
+        """Load the snapshot and replay the journal; runs on first use by itself."""
+        if self._loaded:
+            return
+        self._loaded = True
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        with self._locked():
+            self._read()
+        self._last_flush = time.monotonic()
+
+    def refresh(self) -> None:
+        """Flush, then pick up the results other processes have written since."""
+        self.flush()
+        self.load()
+        with self._locked():
+            self._sync()
+            self._replay_shards()
 
-    def __post_init__(self) -> None:
+    # ---- persistence helpers ----
+    @property
+    def journal_path(self) -> Path:
+        """Path of the append-only journal beside the snapshot."""
+        return Path(self.path + ".journal")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold the store's exclusive advisory lock (a no-op without :mod:`fcntl`)."""
+        if fcntl is None:
+            yield
+            return
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)  # releases the lock
+
+    def _read(self) -> None:
+        """Rebuild the table from snapshot, journal and every shard (lock held)."""
         p = Path(self.path)
+        data: Dict[str, Any] = {}
         if p.exists():
             try:
-                self._data = json.loads(p.read_text(encoding="utf-8"))
+                data = json.loads(p.read_text(encoding="utf-8"))
             except json.JSONDecodeError:
-                self._data = {}
+                os.replace(p, f"{self.path}.corrupt-{time.strftime('%Y%m%d%H%M%S')}")
+        if not p.exists():
+            self._write_snapshot({})
+        folded = data.pop("_folded", None)
+        self._offsets = data.pop("_shards", {})
+        self._data = data
+        self._keys = {pid: self._rank_key(pid, i) for i, pid in enumerate(self._data)}
+        self._order = sorted(self._keys.values())
+        self._gen = None
+        self._seen = 0
+        self._journaled = self._replay(folded)
+        self._replay_shards()
+        self._snap = self._stat()
+
+    def _stat(self) -> Optional[Tuple[int, int, int]]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    def _sync(self) -> None:
+        """Bring the table up to date with what other processes wrote (lock held).
+
+        Free when this process wrote last; applies only the new journal lines
+        when the journal merely grew; re-reads everything after another
+        process compacted. Pending entries are kept on top.
+        """
+        if self._stat() == self._snap:
+            try:
+                size: Optional[int] = os.stat(self.path + ".journal").st_size
+            except FileNotFoundError:
+                size = None
+            if (self._gen is None and size is None) or (
+                self._gen is not None and size == self._seen
+            ):
+                return
+            if self._gen is not None and size is not None and self._catch_up():
+                return
+        self._read()
+        for entry in self._pending:
+            self._apply(entry)
+
+    def _catch_up(self) -> bool:
+        """Apply journal lines past ``_seen``; ``False`` if the journal is not ours."""
+        with self.journal_path.open("r+b") as fh:
+            try:
+                gen = json.loads(fh.readline())["gen"]
+            except (ValueError, KeyError, TypeError):
+                return False
+            if gen != self._gen:
+                return False
+            fh.seek(self._seen)
+            self._journaled += self._apply_tail(fh)
+        return True
+
+    def _write_snapshot(self, data: Dict[str, Any]) -> None:
+        tmp = Path(f"{self.path}.tmp.{os.getpid()}")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def _save(self, folded: Optional[str] = None) -> None:
+        start = time.perf_counter()
+        data = dict(self._data)
+        if folded:
+            data["_folded"] = folded
+        if self._offsets:
+            data["_shards"] = self._offsets
+        self._write_snapshot(data)
+        self._snap = self._stat()
+        if self.metrics is not None:
+            self.metrics.observe("highscore.save", time.perf_counter() - start)
+
+    def _replay(self, folded: Optional[str]) -> int:
+        """Apply journal entries on top of the snapshot; return how many were read.
+
+        A journal whose generation is ``folded`` is already part of the
+        snapshot and is skipped. A torn last line (crash mid-append) is ignored.
+        """
+        jp = self.journal_path
+        if not jp.exists():
+            return 0
+        count = 0
+        with jp.open("r+b") as fh:
+            try:
+                gen = json.loads(fh.readline())["gen"]
+            except (ValueError, KeyError, TypeError):
+                gen = None
+            if gen is not None and gen != folded:
+                self._gen = gen
+                count = self._apply_tail(fh)
+        if self._gen is None:  # stale or unreadable journal, start a fresh one
+            jp.unlink()
+        return count
+
+    def _apply_tail(self, fh: IO[bytes]) -> int:
+        """Apply journal entries from the current position; return how many.
+
+        Reading stops at a torn line (crash mid-append) or at the seal of a
+        compaction that never wrote its snapshot; both are truncated away so
+        later appends stay readable.
+        """
+        good = fh.tell()
+        count = 0
+        for line in fh:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                break
+            if not line.endswith(b"\n") or "pid" not in entry:
+                break
+            self._apply(entry)
+            count += 1
+            good += len(line)
+        fh.truncate(good)
+        self._seen = good
+        return count
+
+    def _shard_paths(self) -> List[Path]:
+        return sorted(Path(p) for p in glob.glob(glob.escape(self.path) + ".shard.*"))
+
+    def _replay_shards(self) -> List[Path]:
+        """Apply shard lines past the recorded offsets; return finished shards.
+
+        Only complete lines are read, so a shard its owner is appending to
+        right now is simply picked up further next time.
+        """
+        offsets: Dict[str, int] = {}
+        done = []
+        for sp in self._shard_paths():
+            start = self._offsets.get(sp.name, 0)
+            with sp.open("rb") as fh:
+                fh.seek(start)
+                chunk = fh.read()
+                end = chunk.rfind(b"\n") + 1
+                fh.seek(max(0, start + end - len(_CLOSED)))
+                closed = fh.read(len(_CLOSED)) == _CLOSED
+            for line in chunk[:end].splitlines():
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if "pid" in entry:
+                    self._apply(entry)
+            offsets[sp.name] = start + end
+            owner = sp.name.rsplit(".", 2)[-2]
+            orphaned = owner.isdigit() and not _alive(int(owner))
+            if sp != self._shard_path and (closed or orphaned):
+                done.append(sp)
+        self._offsets = offsets
+        return done
+
+    def _rank_key(self, pid: str, seq: int) -> _RankKey:
+        """Sort key for the leaderboard; ``seq`` keeps ties in insertion order."""
+        rec = self._data[pid]
+        rate = (rec["wins"] / rec["games"]) if rec["games"] else 0.0
+        return (-rec["wins"], -rate, -rec["points"], seq, pid)
+
+    def _reindex(self, pid: str) -> None:
+        old = self._keys.get(pid)
+        new = self._rank_key(pid, len(self._keys) if old is None else old[3])
+        if new == old:
+            return
+        if old is not None:
+            del self._order[bisect_left(self._order, old)]
+        insort(self._order, new)
+        self._keys[pid] = new
+
+    def _apply(self, entry: Dict[str, Any]) -> None:
+        pid = entry["pid"]
+        rec = self._data.setdefault(
+            pid, {"name": entry["name"], "games": 0, "wins": 0, "turns": 0, "points": 0}
+        )
+        rec["name"] = entry["name"]
+        op = entry.get("op")
+        if op == "game":
+            rec["games"] += 1
+            rec["wins"] += 1 if entry["won"] else 0
+            rec["turns"] += entry["turns"]
+            rec["points"] += entry["points"]
+        elif op == "add":
+            for key in ("games", "wins", "turns", "points"):
+                rec[key] += entry[key]
+        if op in ("game", "add") or pid not in self._keys:
+            self._reindex(pid)
+
+    def _log(self, entry: Dict[str, Any]) -> None:
+        self.load()
+        self._apply(entry)
+        self._pending.append(entry)
+        if len(self._pending) >= self.flush_every or (
+            self.flush_interval is not None
+            and time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self.flush()
+        elif not self._at_exit:
+            atexit.register(self.flush)  # a waiting batch must not die with the process
+            self._at_exit = True
+
+    def flush(self) -> None:
+        """Append pending entries to the journal, compacting when it grows large.
+
+        In shard mode the entries go to this process's shard instead, without
+        locking, and compaction is left to :func:`merge_shards`.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        if self.shard:
+            self._write_pending()
+            return
+        with self._locked():
+            self._write_pending()
+        if self._journaled >= self.compact_every:
+            self.compact()
+
+    def _write_pending(self) -> None:
+        start = time.perf_counter()
+        lines = "".join(
+            json.dumps(e, separators=(",", ":")) + "\n" for e in self._pending
+        ).encode("utf-8")
+        if self.shard:
+            if self._shard_path is None:
+                tag = f"{os.getpid()}.{uuid.uuid4().hex[:8]}"
+                self._shard_path = Path(f"{self.path}.shard.{tag}")
+            with self._shard_path.open("ab") as fh:
+                fh.write(lines)
+            # already applied by _log: replays of our own shard start past them
+            name = self._shard_path.name
+            self._offsets[name] = self._offsets.get(name, 0) + len(lines)
         else:
-            p.parent.mkdir(parents=True, exist_ok=True)
-            p.write_text("{}", encoding="utf-8")
+            self._sync()
+            if self._gen is None:
+                self._gen = uuid.uuid4().hex
+                lines = json.dumps({"gen": self._gen}).encode("utf-8") + b"\n" + lines
+                self._seen = 0
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+            fd = os.open(self.path + ".journal", flags, 0o644)
+            try:
+                view = memoryview(lines)
+                while view:
+                    view = view[os.write(fd, view):]
+            finally:
+                os.close(fd)
+            self._seen += len(lines)
+            self._journaled += len(self._pending)
+        if self.metrics is not None:
+            self.metrics.observe("highscore.flush", time.perf_counter() - start)
+            self.metrics.inc("highscore.journal_entries", len(self._pending))
+        self._pending.clear()
 
-    # ---- persistence helpers ----
-    def _save(self) -> None:
-        Path(self.path).write_text(json.dumps(self._data, indent=2), encoding="utf-8")
+    def compact(self) -> None:
+        """Fold the journal and every shard into a fresh snapshot.
+
+        Runs under the lock and rebuilds the table from disk first, so results
+        other processes wrote since this one loaded are merged, not lost.
+        """
+        self.load()
+        with self._locked():
+            self._sync()  # re-read first; pending entries are kept on top
+            if self._pending:
+                self._write_pending()
+            done = self._replay_shards()
+            if self._gen is not None:
+                with self.journal_path.open("ab") as fh:
+                    fh.write(_SEAL)
+            self._save(folded=self._gen)
+            self.journal_path.unlink(missing_ok=True)
+            for sp in done:
+                sp.unlink(missing_ok=True)
+            self._gen = None
+            self._seen = 0
+            self._journaled = 0
+        self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush everything and fold the journal into the snapshot.
+
+        A shard store marks its shard as finished instead; the next merge
+        folds and deletes it.
+        """
+        if self._at_exit:
+            atexit.unregister(self.flush)
+            self._at_exit = False
+        self.flush()
+        if self.shard:
+            if self._shard_path is not None:
+                with self._shard_path.open("ab") as fh:
+                    fh.write(_CLOSED)
+                self._shard_path = None
+        elif self._journaled:
+            self.compact()
+
+    def __enter__(self) -> "HighScore":
+        """Use the store as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the store."""
+        self.close()
 
     # ---- public API ----
     def ensure(self, pid: str, name: str) -> None:
-        rec = self._data.setdefault(pid, {"name": name, "games": 0, "wins": 0, "turns": 0, "points": 0})
+        self.load()
+        rec = self._data.get(pid)
         # Keep latest name but never lose stats
-        rec["name"] = name
-        self._save()
+        if rec is None or rec["name"] != name:
+            self._log({"op": "name", "pid": pid, "name": name})
 
     def record_game(self, pid: str, name: str, won: bool, turns: int, total_points: int) -> None:
-        self.ensure(pid, name)
-        rec = self._data[pid]
-        rec["games"] += 1
-        rec["wins"] += 1 if won else 0
-        rec["turns"] += max(0, int(turns))
-        rec["points"] += max(0, int(total_points))
-        self._save()
+        self._log(
+            {
+                "op": "game",
+                "pid": pid,
+                "name": name,
+                "won": bool(won),
+                "turns": max(0, int(turns)),
+                "points": max(0, int(total_points)),
+            }
+        )
+
+    def record_games(self, results: Iterable[Mapping[str, Any]]) -> int:
+        """Record many games (see :func:`aggregate_results`) at once; return a count."""
+        totals = aggregate_results(results)
+        self.apply_totals(totals.items())
+        return sum(rec["games"] for rec in totals.values())
+
+    def apply_totals(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Add pre-aggregated ``(pid, stats)`` totals and write them in one batch.
+
+        ``stats`` holds ``name``, ``games``, ``wins``, ``turns`` and ``points``,
+        e.g. the :meth:`items` of a :class:`MemoryHighScore`.
+        """
+        self.load()
+        for pid, rec in records:
+            entry = {"op": "add", "pid": pid, "name": rec["name"]}
+            entry.update((k, max(0, int(rec[k]))) for k in _TOTALS)
+            self._apply(entry)
+            self._pending.append(entry)
+        self.flush()
 
     def rename(self, pid: str, new_name: str) -> None:
+        self.load()
         if pid in self._data:
-            self._data[pid]["name"] = new_name
-            self._save()
+            self._log({"op": "name", "pid": pid, "name": new_name})
 
     def stats_for(self, pid: str) -> Dict[str, Any]:
+        self.load()
         return dict(self._data.get(pid, {}))
 
+    def items(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """Iterate over ``(pid, stats)`` pairs, e.g. to migrate the store."""
+        self.load()
+        for pid, rec in self._data.items():
+            yield pid, dict(rec)
+
     def top(self, n: int = 10) -> List[Dict[str, Any]]:
-        rows = [
-            {
-                "pid": pid,
-                **rec,
-                "win_rate": (rec["wins"] / rec["games"]) if rec["games"] else 0.0,
-            }
-            for pid, rec in self._data.items()
-        ]
-        rows.sort(key=lambda r: (-r["wins"], -r["win_rate"], -r["points"]))
-        return rows[:n]
\ No newline at end of file
+        self.load()
+        rows = []
+        for key in self._order[: max(0, n)]:
+            rec = self._data[key[4]]
+            rows.append(
+                {
+                    "pid": key[4],
+                    **rec,
+                    "win_rate": (rec["wins"] / rec["games"]) if rec["games"] else 0.0,
+                }
+            )
+        return rows
+
+    def rank_of(self, pid: str) -> Optional[int]:
+        """Return the 1-based leaderboard position of ``pid``, or ``None``."""
+        self.load()
+        key = self._keys.get(pid)
+        if key is None:
+            return None
+        return bisect_left(self._order, key) + 1
+
+
+@dataclass
+class MemoryHighScore(HighScore):
+    """A :class:`HighScore` that lives only in memory and never touches disk.
+
+    Use it for simulations and tests; at the end of a run hand the totals to
+    a real store in one batch with :meth:`flush_to`.
+    """
+
+    path: str = ":memory:"
+
+    def load(self) -> None:
+        """Nothing to load; the store starts empty."""
+        self._loaded = True
+
+    def refresh(self) -> None:
+        """Nothing to pick up; no other process can write here."""
+
+    def _log(self, entry: Dict[str, Any]) -> None:
+        self._apply(entry)
+
+    def flush(self) -> None:
+        """Drop pending entries; they are already applied."""
+        self._pending.clear()
+
+    def compact(self) -> None:
+        """Nothing to compact."""
+
+    def flush_to(self, store: HighScore) -> None:
+        """Add everything recorded so far to ``store`` and start over empty."""
+        store.apply_totals(self.items())
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget every record."""
+        self._data.clear()
+        self._order.clear()
+        self._keys.clear()
+
+
+class NullHighScore:
+    """High-score sink that discards everything, for pure simulation."""
+
+    metrics: Optional[Metrics] = None
+
+    def ensure(self, pid: str, name: str) -> None:
+        """Discard the player."""
+
+    def record_game(
+        self, pid: str, name: str, won: bool, turns: int, total_points: int
+    ) -> None:
+        """Discard the game."""
+
+    def record_games(self, results: Iterable[Mapping[str, Any]]) -> int:
+        """Discard the games; return how many there were."""
+        return sum(1 for _ in results)
+
+    def apply_totals(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Discard the totals."""
+
+    def rename(self, pid: str, new_name: str) -> None:
+        """Discard the new name."""
+
+    def stats_for(self, pid: str) -> Dict[str, Any]:
+        """Return no stats."""
+        return {}
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Return an empty leaderboard."""
+        return []
+
+    def rank_of(self, pid: str) -> Optional[int]:
+        """Return no rank."""
+        return None
+
+    def flush(self) -> None:
+        """Nothing to flush."""
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
+def merge_shards(path: str = "public/highscores.json") -> None:
+    """Fold the journal and every shard of the store at ``path`` into its snapshot."""
+    HighScore(path).compact()
+
+
+def read_store(path: str = "public/highscores.json") -> MemoryHighScore:
+    """Read the store at ``path`` into memory without changing any of its files.
+
+    The snapshot, the journal (unless already folded) and the unread part of
+    every shard are applied as a load would, but a torn line or a seal only
+    ends the read: nothing is truncated, sealed, unlinked or rewritten, so the
+    store can stay in use while it is copied, e.g. by a migration.
+    """
+    view = MemoryHighScore()
+    p = Path(path)
+    data: Dict[str, Any] = {}
+    if p.exists():
+        data = json.loads(p.read_text(encoding="utf-8"))
+    folded = data.pop("_folded", None)
+    offsets: Dict[str, int] = data.pop("_shards", {})
+    for pid, rec in data.items():
+        view._apply({"pid": pid, "op": "add", **rec})
+    jp = Path(path + ".journal")
+    if jp.exists():
+        with jp.open("rb") as fh:
+            try:
+                gen = json.loads(fh.readline())["gen"]
+            except (ValueError, KeyError, TypeError):
+                gen = None
+            if gen is not None and gen != folded:
+                for line in fh:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        break
+                    if not line.endswith(b"\n") or "pid" not in entry:
+                        break
+                    view._apply(entry)
+    for sp in sorted(glob.glob(glob.escape(path) + ".shard.*")):
+        with open(sp, "rb") as fh:
+            fh.seek(offsets.get(Path(sp).name, 0))
+            chunk = fh.read()
+        for line in chunk[: chunk.rfind(b"\n") + 1].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            if "pid" in entry:
+                view._apply(entry)
+    return view
+
+
+class ShardMerger(threading.Thread):
+    """Background thread that runs :func:`merge_shards` every ``interval`` seconds."""
+
+    def __init__(
+        self, path: str = "public/highscores.json", interval: float = 5.0
+    ) -> None:
+        """Prepare a daemon thread; call :meth:`start` to begin merging."""
+        super().__init__(name="highscore-merger", daemon=True)
+        self.path = path
+        self.interval = interval
+        self._stopped = threading.Event()
+
+    def run(self) -> None:
+        """Merge every ``interval`` seconds until stopped."""
+        while not self._stopped.wait(self.interval):
+            merge_shards(self.path)
+
+    def stop(self) -> None:
+        """Stop the thread and run one last merge."""
+        self._stopped.set()
+        if self.is_alive():
+            self.join()
+        merge_shards(self.path)
+
+
+_DEFAULT: Optional[HighScore] = None
+
+
+def default_highscore() -> HighScore:
+    """Return the shared store at the default path, created on first call."""
+    global _DEFAULT
+    if _DEFAULT is None:
+        _DEFAULT = HighScore()
+    return _DEFAULT
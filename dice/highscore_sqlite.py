@@ -0,0 +1,213 @@
+"""SQLite-backed high-score store with the same API as :class:`HighScore`.
+
+Every player is one row; a composite index on ``(wins, win_rate, points)``
+serves the leaderboard order directly, so :meth:`SQLiteHighScore.top` reads
+only the requested rows and :meth:`SQLiteHighScore.stats_for` is a primary
+key lookup. Writes are grouped into transactions of ``batch_size`` changes
+and the database runs in WAL mode so readers never wait for a writer.
+"""
+from __future__ import annotations
+import sqlite3
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .highscore import aggregate_results, read_store
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    pid      TEXT PRIMARY KEY,
+    name     TEXT NOT NULL,
+    games    INTEGER NOT NULL DEFAULT 0,
+    wins     INTEGER NOT NULL DEFAULT 0,
+    turns    INTEGER NOT NULL DEFAULT 0,
+    points   INTEGER NOT NULL DEFAULT 0,
+    win_rate REAL NOT NULL DEFAULT 0.0
+);
+CREATE INDEX IF NOT EXISTS players_rank
+    ON players (wins DESC, win_rate DESC, points DESC);
+"""
+
+_RECORD = """
+INSERT INTO players (pid, name, games, wins, turns, points, win_rate)
+VALUES (:pid, :name, 1, :wins, :turns, :points, :wins)
+ON CONFLICT (pid) DO UPDATE SET
+    name = excluded.name,
+    games = games + 1,
+    wins = wins + excluded.wins,
+    turns = turns + excluded.turns,
+    points = points + excluded.points,
+    win_rate = CAST(wins + excluded.wins AS REAL) / (games + 1)
+"""
+
+_ADD = """
+INSERT INTO players (pid, name, games, wins, turns, points, win_rate)
+VALUES (
+    :pid, :name, :games, :wins, :turns, :points, CAST(:wins AS REAL) / MAX(:games, 1)
+)
+ON CONFLICT (pid) DO UPDATE SET
+    name = excluded.name,
+    games = games + excluded.games,
+    wins = wins + excluded.wins,
+    turns = turns + excluded.turns,
+    points = points + excluded.points,
+    win_rate = CAST(wins + excluded.wins AS REAL) / MAX(games + excluded.games, 1)
+"""
+
+_COLUMNS = "pid, name, games, wins, turns, points, win_rate"
+_TOTALS = ("games", "wins", "turns", "points")
+_PARAMS = ", ".join("?" * len(_COLUMNS.split(", ")))
+_ORDER = "wins DESC, win_rate DESC, points DESC, rowid"
+
+
+@dataclass
+class SQLiteHighScore:
+    """High scores in one SQLite table, written in batches of ``batch_size``."""
+
+    path: str = "public/highscores.db"
+    batch_size: int = 1
+    _conn: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _dirty: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Open (creating if needed) the database and its schema."""
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        # Callers serialise access themselves; allow use from a worker thread.
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    # ---- persistence helpers ----
+    def _wrote(self) -> None:
+        self._dirty += 1
+        if self._dirty >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit the open transaction."""
+        self._conn.commit()
+        self._dirty = 0
+
+    def close(self) -> None:
+        """Commit and close the connection."""
+        self.flush()
+        self._conn.close()
+
+    def __enter__(self) -> "SQLiteHighScore":
+        """Use the store as a context manager that closes it on exit."""
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        """Close the store."""
+        self.close()
+
+    def migrate_json(self, json_path: str = "public/highscores.json") -> int:
+        """Import a JSON store (snapshot, journal, shards) once; return rows added.
+
+        The JSON files are only read (see :func:`~dice.highscore.read_store`).
+        Players that already have a row keep it unchanged; their JSON totals
+        are not added on top. The database remembers the migration, so later
+        calls return 0.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version or not Path(json_path).exists():
+            return 0
+        rows = [
+            (pid, rec["name"], rec["games"], rec["wins"], rec["turns"], rec["points"],
+             rec["wins"] / rec["games"] if rec["games"] else 0.0)
+            for pid, rec in read_store(json_path).items()
+        ]
+        insert = f"INSERT OR IGNORE INTO players ({_COLUMNS}) VALUES ({_PARAMS})"
+        with self._conn:
+            cur = self._conn.executemany(insert, rows)
+            self._conn.execute("PRAGMA user_version = 1")
+        self._dirty = 0
+        return cur.rowcount
+
+    # ---- public API ----
+    def ensure(self, pid: str, name: str) -> None:
+        """Create an empty row for ``pid``, or update its name."""
+        cur = self._conn.execute(
+            "INSERT INTO players (pid, name) VALUES (?, ?) "
+            "ON CONFLICT (pid) DO UPDATE SET name = excluded.name "
+            "WHERE name != excluded.name",
+            (pid, name),
+        )
+        if cur.rowcount:
+            self._wrote()
+
+    def record_game(
+        self, pid: str, name: str, won: bool, turns: int, total_points: int
+    ) -> None:
+        """Add one finished game to ``pid``'s totals."""
+        self._conn.execute(
+            _RECORD,
+            {
+                "pid": pid,
+                "name": name,
+                "wins": 1 if won else 0,
+                "turns": max(0, int(turns)),
+                "points": max(0, int(total_points)),
+            },
+        )
+        self._wrote()
+
+    def record_games(self, results: Iterable[Mapping[str, Any]]) -> int:
+        """Record many games in a single transaction; return how many."""
+        totals = aggregate_results(results)
+        self.apply_totals(totals.items())
+        return sum(rec["games"] for rec in totals.values())
+
+    def apply_totals(self, records: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+        """Add pre-aggregated ``(pid, stats)`` totals in a single transaction."""
+        rows = (
+            {
+                "pid": pid,
+                "name": rec["name"],
+                **{k: max(0, int(rec[k])) for k in _TOTALS},
+            }
+            for pid, rec in records
+        )
+        with self._conn:
+            self._conn.executemany(_ADD, rows)
+        self._dirty = 0
+
+    def rename(self, pid: str, new_name: str) -> None:
+        """Change the display name of an existing player."""
+        cur = self._conn.execute(
+            "UPDATE players SET name = ? WHERE pid = ?", (new_name, pid)
+        )
+        if cur.rowcount:
+            self._wrote()
+
+    def stats_for(self, pid: str) -> Dict[str, Any]:
+        """Return ``pid``'s totals, or an empty dict for an unknown player."""
+        row = self._conn.execute(
+            "SELECT name, games, wins, turns, points FROM players WHERE pid = ?", (pid,)
+        ).fetchone()
+        return dict(row) if row else {}
+
+    def rank_of(self, pid: str) -> Optional[int]:
+        """Return the 1-based leaderboard position of ``pid``, or ``None``."""
+        row = self._conn.execute(
+            "SELECT wins, win_rate, points, rowid FROM players WHERE pid = ?", (pid,)
+        ).fetchone()
+        if row is None:
+            return None
+        ahead = self._conn.execute(
+            "SELECT COUNT(*) FROM players WHERE wins > :w OR (wins = :w AND ("
+            "win_rate > :r OR (win_rate = :r AND ("
+            "points > :p OR (points = :p AND rowid < :id)))))",
+            {"w": row[0], "r": row[1], "p": row[2], "id": row[3]},
+        ).fetchone()[0]
+        return ahead + 1
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Return the ``n`` best rows in leaderboard order."""
+        cur = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM players ORDER BY {_ORDER} LIMIT ?", (n,)
+        )
+        return [dict(r) for r in cur]
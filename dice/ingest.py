@@ -0,0 +1,125 @@
+# dice/ingest.py
+"""Stream JSON-lines game results into a high-score store.
+
+Each line is one game result for one player, with the fields of
+``record_game``::
+
+    {"pid": "p1", "name": "Ann", "won": true, "turns": 12, "points": 104}
+
+Files are read in large blocks and every block is parsed with a single
+``json.loads`` call. Results are folded into per-player totals, so memory
+depends on the number of distinct players, not on the file size. The
+totals are applied to the store in one batch, or in one batch per
+``max_players`` players for very wide files.
+
+Run it with ``python -m dice.ingest results.jsonl --store public/highscores.json``;
+a ``.db`` store is opened with :class:`~dice.highscore_sqlite.SQLiteHighScore`.
+"""
+from __future__ import annotations
+import argparse
+import json
+import sys
+import time
+from typing import IO, Any, Dict, Iterator, List, Optional
+
+from .highscore import HighScore, aggregate_results
+
+
+def _bad_line(lines: List[str], first: int) -> ValueError:
+    """Return the error for the first line in ``lines`` that is not one JSON object."""
+    for lineno, line in enumerate(lines, first):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError as exc:
+            return ValueError(f"line {lineno}: {exc}")
+        if not isinstance(value, dict):
+            kind = type(value).__name__
+            return ValueError(f"line {lineno}: expected one JSON object, got {kind}")
+    return ValueError(f"lines {first}-{first + len(lines) - 1}: malformed block")
+
+
+def read_batches(
+    fh: IO[str], block_bytes: int = 1 << 23
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield lists of parsed results, about ``block_bytes`` of input at a time.
+
+    Blank lines are skipped. A line that is not exactly one JSON object
+    raises :class:`ValueError` that names its line number.
+    """
+    lineno = 0
+    while True:
+        lines = fh.readlines(block_bytes)
+        if not lines:
+            return
+        rows = [ln for ln in lines if ln.strip()]
+        try:
+            batch = json.loads("[" + ",".join(rows) + "]")
+        except ValueError:
+            batch = None
+        # e.g. '{...},{...}' on one line parses as two results: recheck line by line
+        if (
+            batch is None
+            or len(batch) != len(rows)
+            or not all(type(r) is dict for r in batch)
+        ):
+            raise _bad_line(lines, lineno + 1)
+        yield batch
+        lineno += len(lines)
+
+
+def import_jsonl(store: Any, fh: IO[str], max_players: int = 1_000_000) -> int:
+    """Aggregate every result in ``fh`` and apply it to ``store``; return games read."""
+    totals: Dict[str, Dict[str, Any]] = {}
+    games = 0
+    for batch in read_batches(fh):
+        aggregate_results(batch, totals)
+        games += len(batch)
+        if len(totals) >= max_players:
+            store.apply_totals(totals.items())
+            totals.clear()
+    if totals:
+        store.apply_totals(totals.items())
+    store.flush()
+    return games
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Import the files named on the command line and print the rate."""
+    parser = argparse.ArgumentParser(
+        description="Import JSON-lines game results into a high-score store."
+    )
+    parser.add_argument("files", nargs="+", help="result files ('-' for stdin)")
+    parser.add_argument(
+        "--store", default="public/highscores.json", help=".json or .db store"
+    )
+    parser.add_argument(
+        "--max-players",
+        type=int,
+        default=1_000_000,
+        help="players held in memory per batch",
+    )
+    args = parser.parse_args(argv)
+    if args.store.endswith(".db"):
+        from .highscore_sqlite import SQLiteHighScore
+
+        store: Any = SQLiteHighScore(args.store)
+    else:
+        store = HighScore(args.store)
+    start = time.perf_counter()
+    games = 0
+    with store:
+        for name in args.files:
+            if name == "-":
+                games += import_jsonl(store, sys.stdin, args.max_players)
+            else:
+                with open(name, encoding="utf-8") as fh:
+                    games += import_jsonl(store, fh, args.max_players)
+    elapsed = time.perf_counter() - start
+    rate = games / elapsed if elapsed else 0
+    print(f"Imported {games:,} results in {elapsed:.1f}s ({rate:,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+# dice/loadgen.py
+"""Load generator for :mod:`dice.server`.
+
+Opens ``concurrency`` connections at a time until ``sessions`` sessions have
+played a short scripted game each, then reports sessions per second and
+command latency percentiles. With ``--spawn`` it starts a throw-away server
+in the same process first.
+
+    python -m dice.loadgen --spawn --sessions 2000 --concurrency 200
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from .highscore import HighScore
+from .server import END, GameServer
+
+
+SCRIPT = ("start", "roll", "roll", "hold", "show", "roll", "hold", "highscore", "quit")
+
+
+@dataclass
+class LoadReport:
+    """Outcome of one load run: sessions, wall time and command latencies."""
+
+    sessions: int
+    seconds: float
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def sessions_per_sec(self) -> float:
+        """Finished sessions per second of wall time."""
+        return self.sessions / self.seconds if self.seconds else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the ``q`` quantile of the command latencies in seconds."""
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def format(self) -> str:
+        """One-line summary for the terminal."""
+        p50, p99 = 1e3 * self.percentile(0.5), 1e3 * self.percentile(0.99)
+        return (
+            f"{self.sessions} sessions in {self.seconds:.2f}s "
+            f"({self.sessions_per_sec:,.0f} sessions/s), "
+            f"{len(self.latencies)} commands, p50 {p50:.2f} ms, p99 {p99:.2f} ms"
+        )
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> List[str]:
+    lines = []
+    while True:
+        raw = await reader.readline()
+        if not raw:
+            raise ConnectionError("server closed the connection")
+        line = raw.decode("utf-8").rstrip("\n")
+        if line == END:
+            return lines
+        lines.append(line)
+
+
+async def play_session(
+    host: str, port: int, script: Sequence[str], latencies: List[float]
+) -> None:
+    """Play ``script`` over one connection, appending each command's latency."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        await _read_reply(reader)  # greeting
+        for command in script:
+            start = time.perf_counter()
+            writer.write(f"{command}\n".encode("utf-8"))
+            await writer.drain()
+            await _read_reply(reader)
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def run_load(
+    host: str,
+    port: int,
+    sessions: int,
+    concurrency: int,
+    script: Sequence[str] = SCRIPT,
+) -> LoadReport:
+    """Play ``sessions`` sessions, at most ``concurrency`` at a time."""
+    latencies: List[float] = []
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with sem:
+            await play_session(host, port, script, latencies)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(sessions)))
+    return LoadReport(sessions, time.perf_counter() - start, latencies)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a load test from the command line and print the report."""
+    parser = argparse.ArgumentParser(description="Load test a Pig dice server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument(
+        "--spawn", action="store_true", help="start an in-process server on a free port"
+    )
+    args = parser.parse_args(argv)
+
+    async def run() -> LoadReport:
+        if not args.spawn:
+            return await run_load(args.host, args.port, args.sessions, args.concurrency)
+        with tempfile.TemporaryDirectory() as td:
+            server = GameServer(args.host, 0, HighScore(str(Path(td) / "hs.json")))
+            await server.start()
+            try:
+                return await run_load(
+                    args.host, server.port, args.sessions, args.concurrency
+                )
+            finally:
+                await server.close()
+
+    print(asyncio.run(run()).format())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,28 @@
 # dice/main.py
-"""Text-based UI using cmd.Cmd. Keeps commands tiny & friendly."""
+"""Text-based UI using cmd.Cmd. Keeps commands tiny & friendly.
+
+
+``python -m dice.main`` starts the interactive shell;
+``python -m dice.main --batch script.txt --games 1000`` replays a command
+script non-interactively and prints one JSON line per finished game.
+"""
 from __future__ import annotations
+import argparse
 import cmd
+import io
+import itertools
+import json
 import shlex
-from typing import List, Tuple
+import sys
+import time
+from typing import IO, Any, Dict, List, Optional, Tuple
+from .computer import Intelligence
+from .dice_hand import DiceHand
 from .game import Game
-from .highscore import HighScore
+from .highscore import HighScore, MemoryHighScore, default_highscore
+from .metrics import Metrics
+from .rolls import RollFile
+from .seeding import SeedSequence
 
 
 
@@ -49,24 +66,59 @@ def render(game: Game) -> str:
 
 
 
+def format_leaderboard(rows: List[dict]) -> List[str]:
+   """Return the printable lines of a high-score table."""
+   if not rows:
+       return ["No games recorded yet."]
+   lines = ["Leaderboard (wins, games, win%, points):"]
+   for i, r in enumerate(rows, 1):
+       pct = f"{100*r['win_rate']:.0f}%"
+       lines.append(
+           f" {i:>2}. {r['name']:<15}  {r['wins']:>3}/{r['games']:<3}  {pct:>4}"
+           f"  {r['points']:>5}"
+       )
+   return lines
+
+
+
+
 class PigDiceGame(cmd.Cmd):
    """Command-line shell for the Pig Dice game."""
    intro = BANNER
    prompt = "(pig) "
 
 
-   def __init__(self) -> None:
-       super().__init__()
-       self.highs = HighScore()
-       self.game = Game.vs_computer()
+   def __init__(
+       self,
+       highs: Optional[HighScore] = None,
+       metrics: Optional[Metrics] = None,
+       stdin: Optional[IO[str]] = None,
+       stdout: Optional[IO[str]] = None,
+       render_board: bool = True,
+   ) -> None:
+       """Shell on ``stdin``/``stdout`` recording into ``highs`` and ``metrics``."""
+       super().__init__(stdin=stdin, stdout=stdout)
+       self.render_board = render_board
+       self.metrics = metrics if metrics is not None else Metrics()
+       if highs is None:
+           highs = default_highscore()  # shared with Game; nothing is read until needed
+           if highs.metrics is None:
+               highs.metrics = self.metrics
+       self.highs = highs
+       self.game = Game.vs_computer(highs=self.highs, metrics=self.metrics)
        self.game.start()
 
 
    # ---- helpers ----
+   def _board(self) -> str:
+       """Return the board after an action, or nothing when rendering is off."""
+       return render(self.game) if self.render_board else ""
+
+
    def _println(self, *parts: str) -> None:
        for p in parts:
            if p is not None and p != "":
-               print(p)
+               self.stdout.write(f"{p}\n")
 
 
    # ---- commands ----
@@ -83,7 +135,7 @@ class PigDiceGame(cmd.Cmd):
 
 
    def do_start(self, arg: str) -> None:
-       """start [target] [ai=easy|medium|hard] — start/restart a game."""
+       """start [target] [ai=easy|medium|hard|expert] — start/restart a game."""
        try:
            target = 100
            ai = "medium"
@@ -92,9 +144,11 @@ class PigDiceGame(cmd.Cmd):
                    ai = token.split("=", 1)[1]
                else:
                    target = int(token)
-           self.game = Game.vs_computer(ai_level=ai, target=target)
+           self.game = Game.vs_computer(
+               ai_level=ai, target=target, highs=self.highs, metrics=self.metrics
+           )
            self.game.start()
-           self._println("", "New game started!", render(self.game))
+           self._println("", "New game started!", self._board())
        except Exception as exc:  # pragma: no cover - resilience only
            self._println(f"Could not start: {exc}")
 
@@ -107,7 +161,7 @@ class PigDiceGame(cmd.Cmd):
            return
        self.game.players[0].rename(name)
        self.highs.ensure(self.game.players[0].pid, self.game.players[0].name)
-       self._println("\n"f"Hello, {self.game.players[0].name}!", render(self.game))
+       self._println("\n"f"Hello, {self.game.players[0].name}!", self._board())
 
 
    def do_roll(self, arg: str) -> None:  # noqa: ARG002
@@ -127,7 +181,7 @@ class PigDiceGame(cmd.Cmd):
            self._println(msg)        # show the roll result
            self._ai_turn()           # AI will render its own turn header/output
        else:
-           self._println(msg, render(self.game))
+           self._println(msg, self._board())
 
 
        if self.game.winner():
@@ -153,16 +207,12 @@ class PigDiceGame(cmd.Cmd):
        acted = False
        while self.game.winner() is None and self.game.current_player() is self.game.players[1]:
            acted = True
-           my = self.game.players[1]
-           opp = self.game.players[0]
-
-
            # Always show the current state before the AI acts
-           self._println(render(self.game))
+           self._println(self._board())
 
 
            # decide whether to hold
-           if getattr(my, "decide_hold")(self.game.turn_total, my.score, opp.score, self.game.target):
+           if self.game.decide_hold():
                msg = self.game.hold()
                self._println(f"Computer: {msg}")  # one-line
                break
@@ -180,28 +230,30 @@ class PigDiceGame(cmd.Cmd):
 
        # Show the board once more after the AI finishes (if no winner)
        if acted and not self.game.winner():
-           self._println(render(self.game))
+           self._println(self._board())
 
 
    def do_highscore(self, arg: str) -> None:  # noqa: ARG002
        """Show high-score table (top 10)."""
-       rows = self.highs.top(10)
-       if not rows:
-           self._println("No games recorded yet.")
-           return
-       self._println("Leaderboard (wins, games, win%, points):")
-       for i, r in enumerate(rows, 1):
-           pct = f"{100*r['win_rate']:.0f}%"
-           self._println(f" {i:>2}. {r['name']:<15}  {r['wins']:>3}/{r['games']:<3}  {pct:>4}  {r['points']:>5}")
+       self._println(*format_leaderboard(self.highs.top(10)))
 
 
    def do_cheat(self, arg: str) -> None:
-       """cheat <d1> <d2> [; <d1> <d2> ...] — queue up future rolls.
+       """cheat <d1> <d2> [; <d1> <d2> ...] | cheat file <path> — queue up future rolls.
 
 
        Example: cheat 6 6; 6 6; 1 1
+       A roll file (see dice.rolls.write_roll_file) is streamed, not loaded.
        """
        try:
+           kind, _, path = arg.strip().partition(" ")
+           if kind == "file":
+               source = RollFile(path.strip())
+               self.game.set_roll_source(source)
+               self._println(
+                   "\n"f"Streaming {len(source)} scripted rolls from {source.path}."
+               )
+               return
            batches: List[Tuple[int, int]] = []
            for chunk in arg.split(";"):
                parts = [p for p in chunk.strip().split() if p]
@@ -216,6 +268,62 @@ class PigDiceGame(cmd.Cmd):
            self._println("\n"f"Cheat parse error: {exc}")
 
 
+   def do_stats(self, arg: str) -> None:
+       """stats [prom] — show counters and latencies (Prometheus text with 'prom')."""
+       if arg.strip() == "prom":
+           self._println(self.metrics.to_prometheus())
+           return
+       snap = self.metrics.snapshot()
+       self._println("Counters:")
+       for name, value in sorted(snap["counters"].items()):
+           self._println(f"  {name:<28} {value:>8}")
+       self._println("Latency (count, mean, p50, p99 in µs):")
+       for name, h in sorted(snap["latency"].items()):
+           mean, p50, p99 = (1e6 * h[k] for k in ("mean", "p50", "p99"))
+           self._println(
+               f"  {name:<28} {h['count']:>8}  {mean:>8.1f}  {p50:>8.1f}  {p99:>8.1f}"
+           )
+
+
+   def do_odds(self, arg: str) -> None:
+       """odds [threshold] — your chance to win holding at <threshold> (default 20).
+
+
+       The first call for a threshold takes a moment to precompute; later ones are
+       instant.
+       """
+       try:
+           threshold = int(arg) if arg.strip() else 20
+       except ValueError:
+           self._println("\n""Usage: odds [threshold]")
+           return
+       g = self.game
+       if g.winner():
+           self._println("\n"f"Game over. {g.winner().name} already won.")
+           return
+       from .expert import RolloutIntelligence  # deferred to keep start-up fast
+       from .odds import odds_table
+
+
+       you, bot = g.players
+       brain = bot.brain
+       note = ""
+       if isinstance(brain, RolloutIntelligence):
+           # rollout decisions are random and budgeted:
+           # tabulate the policy they assume instead
+           brain = Intelligence(brain.risk_threshold)
+           note = f" (approximating {bot.name} as holding at {brain.risk_threshold})"
+       table = odds_table(Intelligence(threshold), brain, g.target)
+       seat = 0 if g.current_player() is you else 1
+       me, opp = g.current_player(), g.opponent()
+       p = table.probability(me.score, opp.score, g.turn_total, seat)
+       p_you = p if seat == 0 else 1.0 - p
+       self._println(
+           "\n"f"{you.name} wins {100 * p_you:.1f}% of the time holding at {threshold}"
+           f" vs {bot.name}{note}."
+       )
+
+
    def do_show(self, arg: str) -> None:  # noqa: ARG002
        """Show current state."""
        self._println(render(self.game))
@@ -236,11 +344,13 @@ class PigDiceGame(cmd.Cmd):
            "highscore   → display the high-score leaderboard",
            "hold        → hold your current turn total and save points",
            "name        → change your player name (write the word 'name' and the your name)",
+           "odds        → show your exact chance to win (optional hold threshold)",
            "quit        → exit the game",
            "roll        → roll the dice for your turn",
            "rules       → show the game rules",
            "show        → display the current game state",
            "start       → start or restart a new game",
+           "stats       → show game and high-score performance metrics",
            "",
            "\n"
            "Tip: type a command and press Enter (example: roll)",
@@ -249,6 +359,7 @@ class PigDiceGame(cmd.Cmd):
 
    def do_quit(self, arg: str) -> bool:  # noqa: ARG002
        """Quit the game shell."""
+       self.highs.close()
        self._println("", "\n" "Bye!")
        return True
 
@@ -260,8 +371,131 @@ class PigDiceGame(cmd.Cmd):
 
 
 
+def run_batch(
+   commands: List[str],
+   games: int = 1,
+   out: Optional[IO[str]] = None,
+   echo: Optional[IO[str]] = None,
+   highs: Optional[HighScore] = None,
+   max_commands: int = 10_000,
+   seed: Optional[int] = None,
+) -> int:
+   """Play ``games`` games from a command script; return how many were played.
+
+
+   Each game runs the script's leading ``start`` line (or a plain ``start``)
+   and then cycles through the remaining commands until someone wins,
+   ``max_commands`` is reached or a ``quit`` is met. Board rendering is
+   skipped; each command's output is buffered and written to ``echo`` in one
+   piece (or dropped). One JSON object per game is written to ``out``
+   (``sys.stdout`` as it is when called, so redirection applies).
+   """
+   out = out if out is not None else sys.stdout
+   commands = [
+       c.strip() for c in commands if c.strip() and not c.lstrip().startswith("#")
+   ]
+   head = commands[0] if commands and commands[0].split()[0] == "start" else "start"
+   body = commands[1:] if commands and head is commands[0] else commands
+   if not body:
+       raise ValueError("the script has no commands to play")
+   root = SeedSequence(seed) if seed is not None else None
+   buf = io.StringIO()
+   shell = PigDiceGame(
+       highs=highs if highs is not None else MemoryHighScore(),
+       stdout=buf,
+       render_board=False,
+   )
+
+
+   def run(line: str) -> bool:
+       stop = shell.onecmd(line)
+       if echo is not None:
+           echo.write(f"{shell.prompt}{line}\n{buf.getvalue()}")
+       buf.seek(0)
+       buf.truncate()
+       return bool(stop)
+
+
+   played = 0
+   for n in range(games):
+       start = time.perf_counter()
+       stop = run(head)
+       if root is not None:
+           dice = shell.game.dice
+           shell.game.dice = DiceHand(dice.count, dice.buffer, seed=root.child(n))
+       count = 1
+       for line in itertools.cycle(body):
+           if stop or shell.game.winner() is not None or count >= max_commands:
+               break
+           stop = run(line)
+           count += 1
+       g = shell.game
+       winner = g.winner()
+       result: Dict[str, Any] = {
+           "game": n,
+           "winner": winner.name if winner else None,
+           "winner_seat": g.players.index(winner) if winner else None,
+           "scores": [p.score for p in g.players],
+           "turns": g.turns_taken,
+           "commands": count,
+           "seconds": round(time.perf_counter() - start, 6),
+       }
+       out.write(json.dumps(result) + "\n")
+       played += 1
+       if stop:
+           break
+   shell.highs.close()
+   return played
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+   """Start the interactive shell, or play ``--batch`` scripted games."""
+   parser = argparse.ArgumentParser(
+       description="Pig dice: interactive shell or scripted batch games."
+   )
+   parser.add_argument(
+       "--batch", metavar="SCRIPT", help="command script to replay ('-' for stdin)"
+   )
+   parser.add_argument(
+       "--games", type=int, default=1, help="games to play with the script"
+   )
+   parser.add_argument(
+       "--results", default="-", help="JSON-lines output file ('-' for stdout)"
+   )
+   parser.add_argument(
+       "--echo", action="store_true", help="copy each command's output to stderr"
+   )
+   parser.add_argument(
+       "--highscores", help="record results in this JSON store (default: memory only)"
+   )
+   parser.add_argument("--max-commands", type=int, default=10_000, help="per game")
+   parser.add_argument("--seed", type=int, help="root seed for reproducible dice")
+   args = parser.parse_args(argv)
+   if args.batch is None:
+       PigDiceGame().cmdloop()
+       return
+   if args.batch == "-":
+       commands = sys.stdin.read().splitlines()
+   else:
+       with open(args.batch, encoding="utf-8") as fh:
+           commands = fh.read().splitlines()
+   highs = HighScore(args.highscores, flush_every=1024) if args.highscores else None
+   if args.results == "-":
+       out = sys.stdout
+   else:
+       out = open(args.results, "w", encoding="utf-8")
+   echo = sys.stderr if args.echo else None
+   try:
+       run_batch(
+           commands, args.games, out, echo, highs, args.max_commands, args.seed
+       )
+   finally:
+       if out is not sys.stdout:
+           out.close()
+
+
 if __name__ == "__main__":
-   PigDiceGame().cmdloop()
+   main()
 
 
 
@@ -0,0 +1,116 @@
+# dice/metrics.py
+"""Tiny in-process counters and latency histograms for the game hot paths.
+
+Instrumented classes hold an optional :class:`Metrics`; when it is ``None``
+the only cost is one attribute check per call.
+"""
+from __future__ import annotations
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+
+# Latency bucket upper bounds in seconds: 1µs .. ~1s, doubling.
+BUCKETS: Tuple[float, ...] = tuple(1e-6 * 2 ** i for i in range(21))
+
+
+@dataclass
+class Histogram:
+    """Fixed-bucket latency histogram (Prometheus-style, non-cumulative storage)."""
+
+    bounds: Tuple[float, ...] = BUCKETS
+    counts: List[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        """Start with an empty bucket per bound plus one overflow bucket."""
+        if not self.counts:
+            self.counts = [0] * (len(self.bounds) + 1)
+
+    def observe(self, seconds: float) -> None:
+        """Count one latency sample."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, n in zip(self.bounds, self.counts):
+            seen += n
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+
+@dataclass
+class Metrics:
+    """Named counters and latency histograms, created on first use."""
+
+    counters: Dict[str, int] = field(default_factory=dict)
+    histograms: Dict[str, Histogram] = field(default_factory=dict)
+
+    def inc(self, name: str, n: int = 1) -> None:
+        """Add ``n`` to counter ``name``."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name: str, seconds: float) -> None:
+        """Record a latency sample in histogram ``name``."""
+        hist = self.histograms.get(name)
+        if hist is None:
+            hist = self.histograms[name] = Histogram()
+        hist.observe(seconds)
+
+    def merge(self, other: "Metrics") -> "Metrics":
+        """Add ``other``'s counts into this one (histograms must share bounds)."""
+        for name, n in other.counters.items():
+            self.counters[name] = self.counters.get(name, 0) + n
+        for name, h in other.histograms.items():
+            mine = self.histograms.get(name)
+            if mine is None:
+                mine = self.histograms[name] = Histogram(h.bounds)
+            mine.counts = [a + b for a, b in zip(mine.counts, h.counts)]
+            mine.total += h.total
+            mine.count += h.count
+        return self
+
+    def reset(self) -> None:
+        """Drop every counter and histogram."""
+        self.counters.clear()
+        self.histograms.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Plain-dict view: counters plus count/mean/p50/p99 per histogram."""
+        return {
+            "counters": dict(self.counters),
+            "latency": {
+                name: {
+                    "count": h.count,
+                    "mean": h.total / h.count if h.count else 0.0,
+                    "p50": h.quantile(0.5),
+                    "p99": h.quantile(0.99),
+                }
+                for name, h in self.histograms.items()
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "pig_") -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        for name, value in sorted(self.counters.items()):
+            metric = prefix + name.replace(".", "_") + "_total"
+            lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+        for name, h in sorted(self.histograms.items()):
+            metric = prefix + name.replace(".", "_") + "_seconds"
+            lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, n in zip(h.bounds, h.counts):
+                cumulative += n
+                lines.append(f'{metric}_bucket{{le="{bound:.6g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{le="+Inf"}} {h.count}')
+            lines += [f"{metric}_sum {h.total:.9g}", f"{metric}_count {h.count}"]
+        return "\n".join(lines) + "\n"
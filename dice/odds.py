@@ -0,0 +1,168 @@
+# dice/odds.py
+"""Exact win probabilities when both players follow fixed policies.
+
+Fixing both policies turns the game into a Markov chain. The chance of each
+way a turn can end (bust, or banking ``k`` points) is computed once per
+distinct run of roll/hold decisions, which reduces the chain to start-of-turn
+states only; iterating that small system to a fixed point gives
+``P(mover wins)`` for every ``(my_score, opp_score)``. Mid-turn queries then
+solve a single turn-total column on top of it.
+
+Tables are cached per policy pair, so only the first query pays the
+precompute::
+
+    odds = odds_table(Intelligence(20), Intelligence(25))
+    odds.probability(my_score=40, opp_score=55, turn_total=12)
+"""
+from __future__ import annotations
+from array import array
+from operator import mul
+from typing import Dict, List, Sequence, Tuple
+
+from .computer import Intelligence
+from .simulate import roll_distribution
+from .solver import SolverError
+
+
+def _turn_distribution(holds: Tuple[bool, ...], sides: int) -> List[Tuple[int, float]]:
+    """How a turn ends given a hold decision per turn total below the win line.
+
+    Returns ``(banked, p)`` pairs; ``banked`` is ``-1`` for a bust. Totals at
+    or beyond ``len(holds)`` are always banked.
+    """
+    p_bust, p_auto, gains = roll_distribution(sides)
+    limit = len(holds)
+    pending = [0.0] * (limit + max(gains) + 1)
+    pending[0] = 1.0
+    result: Dict[int, float] = {-1: 0.0}
+    for t, p in enumerate(pending):
+        if not p:
+            continue
+        if t >= limit or holds[t]:
+            result[t] = result.get(t, 0.0) + p
+            continue
+        result[-1] += p * p_bust
+        result[t] = result.get(t, 0.0) + p * p_auto
+        for gain, pg in gains.items():
+            pending[t + gain] += p * pg
+    return [(k, p) for k, p in result.items() if p]
+
+
+class OddsTable:
+    """Win probabilities for ``policies[0]`` against ``policies[1]``.
+
+    Seat ``0`` plays ``policies[0]``. Turn totals that reach the target are
+    always banked, whatever the policy says.
+    """
+
+    def __init__(
+        self,
+        policies: Sequence[Intelligence],
+        target: int = 100,
+        sides: int = 6,
+        tol: float = 1e-10,
+        max_sweeps: int = 10_000,
+    ) -> None:
+        """Solve the whole table now; :class:`SolverError` if it does not converge."""
+        self.policies = list(policies)
+        self.target = target
+        self.sides = sides
+        # win[seat][i * target + j]: seat to move with i points, opponent has j.
+        self.win = [array("d", [0.5]) * (target * target) for _ in range(2)]
+        self._columns: Dict[Tuple[int, int, int], List[float]] = {}
+        self.sweeps = self._solve(tol, max_sweeps)
+
+    def _holds(self, seat: int, i: int, j: int) -> Tuple[bool, ...]:
+        should_hold = self.policies[seat].should_hold
+        return tuple(should_hold(k, i, j, self.target) for k in range(self.target - i))
+
+    def _solve(self, tol: float, max_sweeps: int) -> int:
+        t = self.target
+        cache: Dict[Tuple[bool, ...], List[Tuple[int, float]]] = {}
+        # Per state: value = base - sum(p * opponent_win[k]) over its moves.
+        chain = []
+        states = sorted(
+            ((i, j) for i in range(t) for j in range(t)), key=lambda s: -(s[0] + s[1])
+        )
+        for i, j in states:
+            for seat in (0, 1):
+                holds = self._holds(seat, i, j)
+                dist = cache.get(holds)
+                if dist is None:
+                    dist = cache[holds] = _turn_distribution(holds, self.sides)
+                ps, ks = [], []
+                for banked, p in dist:
+                    mine = 0 if banked < 0 else i + banked
+                    if mine < t:
+                        ps.append(p)
+                        ks.append(j * t + mine)
+                base = sum(p for _, p in dist)
+                other = self.win[1 - seat].__getitem__
+                chain.append((self.win[seat], other, i * t + j, base, ps, ks))
+        for sweep in range(1, max_sweeps + 1):
+            delta = 0.0
+            for mine, other, idx, base, ps, ks in chain:
+                value = base - sum(map(mul, ps, map(other, ks)))
+                diff = abs(value - mine[idx])
+                if diff > delta:
+                    delta = diff
+                mine[idx] = value
+            if delta < tol:
+                return sweep
+        raise SolverError(
+            f"odds did not converge in {max_sweeps} sweeps (delta={delta:.3g})"
+        )
+
+    def _column(self, seat: int, i: int, j: int) -> List[float]:
+        key = (seat, i, j)
+        col = self._columns.get(key)
+        if col is not None:
+            return col
+        t = self.target
+        p_bust, p_auto, gains = roll_distribution(self.sides)
+        other = self.win[1 - seat]
+        holds = self._holds(seat, i, j)
+        limit = len(holds)
+        col = [1.0] * (limit + max(gains) + 1)
+        bust = p_bust * (1.0 - other[j * t])
+        for k in range(limit - 1, -1, -1):
+            hold = 1.0 - other[j * t + i + k]
+            if holds[k]:
+                col[k] = hold
+            else:
+                roll = bust + p_auto * hold
+                for gain, pg in gains.items():
+                    roll += pg * col[k + gain]
+                col[k] = roll
+        self._columns[key] = col
+        return col
+
+    def probability(
+        self, my_score: int, opp_score: int, turn_total: int = 0, seat: int = 0
+    ) -> float:
+        """P(the player to move wins); ``seat`` says which policy is moving."""
+        t = self.target
+        if my_score + turn_total >= t:
+            return 1.0
+        if opp_score >= t:
+            return 0.0
+        if turn_total == 0:
+            return self.win[seat][my_score * t + opp_score]
+        return self._column(seat, my_score, opp_score)[turn_total]
+
+
+_TABLES: Dict[Tuple[str, str, int, int], OddsTable] = {}
+
+
+def odds_table(
+    first: Intelligence, second: Intelligence, target: int = 100, sides: int = 6
+) -> OddsTable:
+    """Return the (cached) :class:`OddsTable` for a policy pair.
+
+    Policies are keyed by ``repr``, so equal dataclass strategies share a table.
+    """
+    key = (repr(first), repr(second), target, sides)
+    table = _TABLES.get(key)
+    if table is None:
+        table = _TABLES[key] = OddsTable((first, second), target, sides)
+    return table
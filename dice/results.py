@@ -0,0 +1,112 @@
+# dice/results.py
+"""Structured outcomes of :meth:`Game.roll_result` and :meth:`Game.hold_result`.
+
+Both are named tuples holding the numbers of what just happened; the
+human-readable text is only built when :attr:`message` is read, and derived
+views (``scores``, a roll's auto-``hold``) only when asked for. ``score0`` /
+``score1`` are the players' scores *after* the action, ``seat`` is the
+player who acted and ``winner`` is set once the game is won (or already was).
+"""
+from __future__ import annotations
+from typing import TYPE_CHECKING, NamedTuple, Optional, Tuple
+
+from .rules import Outcome
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .player import Player
+
+
+class HoldResult(NamedTuple):
+    """A hold: ``points`` banked by ``player``; ``over`` if the game had ended."""
+
+    player: "Player"
+    points: int
+    seat: int
+    score0: int
+    score1: int
+    winner: Optional["Player"] = None
+    auto: bool = False
+    over: bool = False
+
+    @property
+    def scores(self) -> Tuple[int, int]:
+        """Both scores after the hold."""
+        return self.score0, self.score1
+
+    @property
+    def won(self) -> bool:
+        """Whether this hold won the game."""
+        return not self.over and self.winner is self.player
+
+    @property
+    def message(self) -> str:
+        """The text :meth:`Game.hold` returns for this hold."""
+        if self.over:
+            return "\n"f"Game over. {self.winner.name} already won."
+        name = self.player.name
+        score = self.score1 if self.seat else self.score0
+        msg = f"{name} holds {self.points}. New score: {score}."
+        if self.winner is self.player:
+            msg += "\n"f" \n{name} wins!"
+        return msg
+
+
+class RollResult(NamedTuple):
+    """A roll of ``d1`` and ``d2`` by ``player``.
+
+    ``outcome`` is ``None`` when the game had already ended (the dice are
+    then 0). ``turn_total`` is the running total after a scoring roll and
+    the points banked by an auto-hold (:attr:`hold` has the details). On
+    double ones it is the running total reached before the roll, which is
+    forfeited; the saved score lost with it is not kept (the roller's score
+    is then 0).
+    """
+
+    d1: int
+    d2: int
+    outcome: Optional[Outcome]
+    gain: int
+    turn_total: int
+    seat: int
+    score0: int
+    score1: int
+    player: "Player"
+    winner: Optional["Player"] = None
+
+    @property
+    def scores(self) -> Tuple[int, int]:
+        """Both scores after the roll."""
+        return self.score0, self.score1
+
+    @property
+    def hold(self) -> Optional[HoldResult]:
+        """The automatic hold a single 1 triggered, else ``None``."""
+        if self.outcome is not Outcome.AUTO_HOLD:
+            return None
+        return HoldResult(
+            self.player,
+            self.turn_total,
+            self.seat,
+            self.score0,
+            self.score1,
+            self.winner,
+            True,
+        )
+
+    @property
+    def message(self) -> str:
+        """The text :meth:`Game.roll` returns for this roll."""
+        outcome = self.outcome
+        if outcome is None:
+            return f"Game over. {self.winner.name} already won."
+        if outcome is Outcome.CONTINUE:
+            return (
+                "\n"f"Rolled {self.d1}+{self.d2} → +{self.gain} this turn "
+                f"(total {self.turn_total})."
+            )
+        if outcome is Outcome.AUTO_HOLD:
+            return (
+                "\n"f"Rolled {self.d1}+{self.d2} (single 1) → "
+                f"auto-hold {self.turn_total}."
+            )
+        return "\n"f"Rolled {self.d1}+{self.d2} (double ones) → lose all saved points!"
@@ -0,0 +1,126 @@
+# dice/rolls.py
+"""Scripted roll sources for :class:`~dice.game.Game`.
+
+A source hands out predetermined ``(d1, d2)`` rolls until it runs dry, after
+which the game goes back to its real dice. Three kinds are provided:
+
+* :class:`QueueSource` — an in-memory queue (what ``Game.set_cheat`` uses);
+* :class:`IteratorSource` — pulls lazily from any iterable or generator;
+* :class:`RollFile` — a memory-mapped binary file of two bytes per roll,
+  written by :func:`write_roll_file`, so hundreds of millions of rolls cost
+  no more memory than the pages currently being read.
+"""
+from __future__ import annotations
+import mmap
+import struct
+from array import array
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+Roll = Tuple[int, int]
+
+MAGIC = b"PIGR"
+VERSION = 1
+_HEADER = struct.Struct("<4sH")  # magic, version; then d1, d2 as u8 per roll
+
+
+class RollSource:
+    """Base class: override :meth:`next_roll`."""
+
+    def next_roll(self) -> Optional[Roll]:
+        """Return the next scripted roll, or ``None`` once the source is exhausted."""
+        return None
+
+    def pending(self) -> List[Roll]:
+        """Return the rolls still queued (kept in snapshots); streams report none."""
+        return []
+
+    def close(self) -> None:
+        """Release whatever the source holds open."""
+
+
+class QueueSource(RollSource):
+    """Rolls from an in-memory queue."""
+
+    def __init__(self, rolls: Iterable[Roll] = ()) -> None:
+        """Queue ``rolls`` in order."""
+        self._queue = deque((int(a), int(b)) for a, b in rolls)
+
+    def __len__(self) -> int:
+        """Return the number of rolls left."""
+        return len(self._queue)
+
+    def extend(self, rolls: Iterable[Roll]) -> None:
+        """Queue more rolls after the current ones."""
+        self._queue.extend((int(a), int(b)) for a, b in rolls)
+
+    def next_roll(self) -> Optional[Roll]:
+        """Pop the next roll, or ``None`` once the queue is empty."""
+        return self._queue.popleft() if self._queue else None
+
+    def pending(self) -> List[Roll]:
+        """Return the queued rolls."""
+        return list(self._queue)
+
+
+class IteratorSource(RollSource):
+    """Rolls pulled lazily from an iterable."""
+
+    def __init__(self, rolls: Iterable[Roll]) -> None:
+        """Pull from ``rolls`` one roll at a time."""
+        self._it: Iterator[Roll] = iter(rolls)
+
+    def next_roll(self) -> Optional[Roll]:
+        """Return the next roll, or ``None`` once the iterable is exhausted."""
+        roll = next(self._it, None)
+        return None if roll is None else (int(roll[0]), int(roll[1]))
+
+
+def write_roll_file(path: str, rolls: Iterable[Roll], chunk: int = 1 << 16) -> int:
+    """Write ``rolls`` to a roll file in chunks; return how many were written."""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    it = iter(rolls)
+    count = 0
+    with open(path, "wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION))
+        while True:
+            block = array("B", [v for roll in islice(it, chunk) for v in roll])
+            if not block:
+                return count
+            fh.write(block.tobytes())
+            count += len(block) // 2
+
+
+class RollFile(RollSource):
+    """Read-only, memory-mapped roll file; ``position`` is the next roll index."""
+
+    def __init__(self, path: str, position: int = 0) -> None:
+        """Map ``path``; ``ValueError`` if it is not a roll file."""
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self._mm)
+        if size < _HEADER.size or _HEADER.unpack_from(self._mm, 0) != (MAGIC, VERSION):
+            self._mm.close()
+            raise ValueError(f"{path} is not a roll file")
+        self.path = path
+        self.count = (size - _HEADER.size) // 2
+        self.position = position
+
+    def __len__(self) -> int:
+        """Return the number of rolls left."""
+        return max(0, self.count - self.position)
+
+    def next_roll(self) -> Optional[Roll]:
+        """Read the roll at ``position`` and advance, or ``None`` at the end."""
+        i = self.position
+        if i >= self.count:
+            return None
+        self.position = i + 1
+        off = _HEADER.size + 2 * i
+        return self._mm[off], self._mm[off + 1]
+
+    def close(self) -> None:
+        """Unmap the file."""
+        self._mm.close()
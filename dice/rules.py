@@ -8,7 +8,10 @@ Rules summary (this module encodes only *outcomes* of a roll):
 - Otherwise: add sum to turn total and continue.
 """
 from __future__ import annotations
+from array import array
 from enum import Enum, auto
+from functools import lru_cache
+from typing import Iterable, List, Tuple
 
 
 
@@ -48,4 +51,59 @@ def turn_points_gain(d1: int, d2: int) -> int:
 
    Zero on BUST or AUTO_HOLD, otherwise the sum of the dice.
    """
-   return 0 if 1 in (d1, d2) else d1 + d2
\ No newline at end of file
+   return 0 if 1 in (d1, d2) else d1 + d2
+
+
+
+@lru_cache(maxsize=None)
+def outcome_table(sides: int = 6) -> Tuple[Tuple[Outcome, int], ...]:
+   """Precomputed ``(Outcome, gain)`` for every roll of two ``sides``-sided dice.
+
+
+   Entry ``(d1 - 1) * sides + (d2 - 1)`` belongs to the roll ``(d1, d2)``.
+   """
+   return tuple(
+       (evaluate_roll(d1, d2), turn_points_gain(d1, d2))
+       for d1 in range(1, sides + 1)
+       for d2 in range(1, sides + 1)
+   )
+
+
+
+
+_TABLE = outcome_table(6)
+
+
+
+
+def evaluate(d1: int, d2: int, sides: int = 6) -> Tuple[Outcome, int]:
+   """Return ``(outcome, gain)`` for a roll with a single table lookup.
+
+
+   Values outside ``1..sides`` (e.g. scripted cheat rolls) use the scalar rules.
+   """
+   if 0 < d1 <= sides and 0 < d2 <= sides:
+       table = _TABLE if sides == 6 else outcome_table(sides)
+       return table[(d1 - 1) * sides + d2 - 1]
+   return evaluate_roll(d1, d2), turn_points_gain(d1, d2)
+
+
+
+
+def evaluate_many(rolls: Iterable[int], sides: int = 6) -> Tuple[List[Outcome], array]:
+   """Classify a flat ``d1, d2, d1, d2, ...`` buffer of rolls in one pass.
+
+
+   Accepts the output of :meth:`dice.dice_hand.DiceHand.roll_many`. Returns
+   the outcome of every roll and an ``array`` of the matching gains. Like
+   :func:`evaluate`, values outside ``1..sides`` use the scalar rules.
+   """
+   table = outcome_table(sides)
+   it = iter(rolls)
+   rows = [
+       table[(d1 - 1) * sides + d2 - 1]
+       if 0 < d1 <= sides and 0 < d2 <= sides
+       else (evaluate_roll(d1, d2), turn_points_gain(d1, d2))
+       for d1, d2 in zip(it, it)
+   ]
+   return [r[0] for r in rows], array("H", [r[1] for r in rows])
@@ -0,0 +1,73 @@
+# dice/seeding.py
+"""Hierarchical seeds for reproducible, independent random streams.
+
+Modelled on NumPy's ``SeedSequence``: a root seed plus a *spawn key* (the
+path of child indices that led to it) is hashed into the seed of a
+:class:`random.Random`. Children never share state with their parent or
+each other, so a tournament can hand ``root.child(worker)`` to each process
+and ``worker_seq.child(game)`` to each game, and any single game can be
+re-created later from ``(root, spawn key)`` alone::
+
+    root = SeedSequence(2024)
+    rng = root.child(41_337).random()   # the stream of game #41337
+"""
+from __future__ import annotations
+import hashlib
+import random
+import secrets
+import struct
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
+
+
+@dataclass
+class SeedSequence:
+    """A node in a tree of seeds; ``entropy`` is the root seed."""
+
+    entropy: Optional[int] = None
+    spawn_key: Tuple[int, ...] = ()
+    _spawned: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Draw fresh entropy when none is given."""
+        if self.entropy is None:
+            self.entropy = secrets.randbits(128)
+        if self.entropy < 0:
+            raise ValueError("entropy must be non-negative")
+        self.spawn_key = tuple(self.spawn_key)
+
+    def child(self, index: int) -> "SeedSequence":
+        """Return the ``index``-th child; an index always gives the same stream."""
+        return SeedSequence(self.entropy, self.spawn_key + (index,))
+
+    def spawn(self, n: int) -> List["SeedSequence"]:
+        """Return ``n`` new children, continuing after those spawned before."""
+        start = self._spawned
+        self._spawned += n
+        return [self.child(i) for i in range(start, start + n)]
+
+    def digest(self) -> bytes:
+        """Return the 32-byte hash of the root seed and spawn key."""
+        size = (self.entropy.bit_length() + 7) // 8 or 1
+        entropy = self.entropy.to_bytes(size, "little")
+        key = struct.pack(f"<{len(self.spawn_key)}Q", *self.spawn_key)
+        h = hashlib.blake2b(digest_size=32, person=b"pig-dice-seed")
+        h.update(struct.pack("<I", len(entropy)) + entropy + key)
+        return h.digest()
+
+    def random(self) -> random.Random:
+        """Return a fresh generator for this node's stream."""
+        return random.Random(int.from_bytes(self.digest(), "little"))
+
+
+SeedLike = Union[int, SeedSequence]
+
+
+def as_seed_sequence(seed: SeedLike) -> SeedSequence:
+    """Return ``seed`` itself, or the root :class:`SeedSequence` of an int."""
+    return seed if isinstance(seed, SeedSequence) else SeedSequence(seed)
+
+
+def make_rng(seed: Optional[SeedLike]) -> Optional[random.Random]:
+    """Return a generator for ``seed``; ``None`` (the global module) when unseeded."""
+    return None if seed is None else as_seed_sequence(seed).random()
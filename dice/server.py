@@ -0,0 +1,257 @@
+# dice/server.py
+"""Asyncio TCP server hosting many independent games in one process.
+
+The protocol is line based: the client sends one command per line (``start``,
+``roll``, ``hold``, ``name``, ``show``, ``highscore`` or ``quit``, with the
+same arguments as the CLI) and the server answers with the text the CLI
+would print, followed by a line holding a single ``.``.
+
+Each connection gets its own :class:`~dice.main.PigDiceGame`. All high-score
+access runs on one dedicated thread, so a slow disk delays only that thread
+and never the event loop; failed writes are logged and counted as
+``server.highscore_errors``. Commands in a game against the ``expert`` AI,
+whose turns spend milliseconds per decision on play-outs, run on a separate
+worker pool. Sessions idle for longer than ``idle_timeout`` seconds are
+disconnected.
+
+Start it with ``python -m dice.server --port 7777``.
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import io
+import logging
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .expert import RolloutIntelligence
+from .highscore import HighScore, default_highscore
+from .main import PigDiceGame, format_leaderboard
+from .metrics import Metrics
+
+log = logging.getLogger(__name__)
+
+
+COMMANDS = frozenset({"start", "roll", "hold", "name", "show", "highscore", "quit"})
+END = "."
+
+
+class OffloadedHighScore:
+    """High-score proxy whose writes run on ``executor`` without waiting.
+
+    Reads block on the executor and must not be called from the event loop;
+    the server awaits them with ``run_in_executor`` instead. A write that
+    raises is logged and kept in ``errors``.
+    """
+
+    def __init__(self, highs: HighScore, executor: Executor) -> None:
+        """Wrap ``highs``, running every call on ``executor``."""
+        self.highs = highs
+        self.executor = executor
+        self.errors: List[BaseException] = []
+
+    def _submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        self.executor.submit(fn, *args).add_done_callback(self._check)
+
+    def _check(self, fut: Future) -> None:
+        exc = fut.exception()
+        if exc is not None:
+            self.errors.append(exc)
+            log.error("high-score write failed", exc_info=exc)
+
+    def ensure(self, pid: str, name: str) -> None:
+        """Queue :meth:`HighScore.ensure`."""
+        self._submit(self.highs.ensure, pid, name)
+
+    def record_game(
+        self, pid: str, name: str, won: bool, turns: int, total_points: int
+    ) -> None:
+        """Queue :meth:`HighScore.record_game`."""
+        self._submit(self.highs.record_game, pid, name, won, turns, total_points)
+
+    def rename(self, pid: str, new_name: str) -> None:
+        """Queue :meth:`HighScore.rename`."""
+        self._submit(self.highs.rename, pid, new_name)
+
+    def stats_for(self, pid: str) -> Dict[str, Any]:
+        """Return :meth:`HighScore.stats_for`, waiting for queued writes first."""
+        return self.executor.submit(self.highs.stats_for, pid).result()
+
+    def top(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Return :meth:`HighScore.top`, waiting for queued writes first."""
+        return self.executor.submit(self.highs.top, n).result()
+
+    def close(self) -> None:
+        """Close the wrapped store once queued writes are done."""
+        self.executor.submit(self.highs.close).result()
+
+
+class Session:
+    """One connected player: a CLI shell writing into a private buffer.
+
+    The shell records into its own ``metrics``, which the server folds into
+    the shared ones on the event loop, so a command may run on any thread.
+    """
+
+    def __init__(self, highs: OffloadedHighScore, now: float) -> None:
+        """Start a session at loop time ``now``."""
+        self.out = io.StringIO()
+        self.metrics = Metrics()
+        self.shell = PigDiceGame(highs=highs, metrics=self.metrics, stdout=self.out)
+        self.last_seen = now
+        self.writer: Optional[asyncio.StreamWriter] = None
+
+    @property
+    def slow(self) -> bool:
+        """Whether the opponent is the Monte Carlo ``expert``."""
+        brain = getattr(self.shell.game.players[1], "brain", None)
+        return isinstance(brain, RolloutIntelligence)
+
+    def run(self, line: str) -> str:
+        """Run one command line and return what the shell printed."""
+        self.shell.onecmd(line)
+        text = self.out.getvalue()
+        self.out.seek(0)
+        self.out.truncate()
+        return text
+
+
+class GameServer:
+    """Serve one :class:`Session` per connection (port 0 picks a free port)."""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7777,
+        highs: Optional[HighScore] = None,
+        idle_timeout: float = 300.0,
+    ) -> None:
+        """Set up the executors; nothing listens until :meth:`start`."""
+        self.host = host
+        self.port = port
+        self.idle_timeout = idle_timeout
+        self.metrics = Metrics()
+        self._io = ThreadPoolExecutor(max_workers=1, thread_name_prefix="highscore")
+        self._ai = ThreadPoolExecutor(thread_name_prefix="expert")
+        store = highs if highs is not None else default_highscore()
+        self.highs = OffloadedHighScore(store, self._io)
+        self.sessions: Set[Session] = set()
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        """Start listening and the idle-session reaper."""
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._reaper = asyncio.create_task(self._evict_idle())
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled, starting first if needed."""
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """Stop serving, drop every session and close the high-score store."""
+        if self._reaper:
+            self._reaper.cancel()
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for s in list(self.sessions):
+            if s.writer:
+                s.writer.close()
+        self._ai.shutdown(wait=True)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(self._io, self.highs.highs.close)
+        self._io.shutdown(wait=True)
+        if self.highs.errors:
+            log.error("%d high-score writes failed", len(self.highs.errors))
+
+    async def _evict_idle(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(max(0.01, self.idle_timeout / 4))
+            cutoff = loop.time() - self.idle_timeout
+            for s in [s for s in self.sessions if s.last_seen < cutoff]:
+                self.metrics.inc("server.evicted")
+                if s.writer:
+                    s.writer.close()
+                self.sessions.discard(s)
+
+    async def _reply(self, writer: asyncio.StreamWriter, text: str) -> None:
+        writer.write(f"{text.rstrip()}\n{END}\n".encode("utf-8"))
+        await writer.drain()
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        session = Session(self.highs, loop.time())
+        session.writer = writer
+        self.sessions.add(session)
+        self.metrics.inc("server.sessions")
+        try:
+            greeting = "Welcome to Pig Dice Game! Type 'start' to begin."
+            await self._reply(writer, greeting)
+            while True:
+                raw = await reader.readline()
+                if not raw:
+                    break
+                session.last_seen = loop.time()
+                line = raw.decode("utf-8", "replace").strip()
+                word = line.split(" ", 1)[0]
+                if word == "quit":
+                    await self._reply(writer, "Bye!")
+                    break
+                if word not in COMMANDS:
+                    text = f"Unknown command: {line}"
+                elif word == "highscore":
+                    top = self.highs.highs.top
+                    rows = await loop.run_in_executor(self._io, top, 10)
+                    text = "\n".join(format_leaderboard(rows))
+                elif session.slow:
+                    text = await loop.run_in_executor(self._ai, session.run, line)
+                else:
+                    text = session.run(line)
+                self.metrics.merge(session.metrics)
+                session.metrics.reset()
+                errors = len(self.highs.errors)
+                if errors:
+                    self.metrics.counters["server.highscore_errors"] = errors
+                await self._reply(writer, text)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.sessions.discard(session)
+            writer.close()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the server from the command line until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve Pig dice games over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7777)
+    parser.add_argument("--highscores", default="public/highscores.json")
+    parser.add_argument("--idle-timeout", type=float, default=300.0)
+    args = parser.parse_args(argv)
+
+    async def run() -> None:
+        highs = HighScore(args.highscores)
+        server = GameServer(args.host, args.port, highs, args.idle_timeout)
+        await server.start()
+        print(f"Serving Pig dice on {args.host}:{server.port}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:  # pragma: no cover - interactive only
+        pass
+
+
+if __name__ == "__main__":
+    main()
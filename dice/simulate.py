@@ -0,0 +1,288 @@
+# dice/simulate.py
+"""Batch simulation of whole games between computer strategies.
+
+:class:`~dice.game.Game` plays one roll at a time and asks the random module
+for every die. For win-rate estimates we only care about how each *turn*
+ends, so this module precomputes, per strategy and score situation, the
+probability of every turn outcome (bust, or hold with ``k`` points) from the
+rules in :mod:`dice.rules`, and then samples a whole turn with a single
+random number. The result follows exactly the same distribution as driving
+:class:`Game` with :class:`~dice.computer.Computer` players.
+
+Pass a :class:`~dice.stats.SimStats` to collect turn, margin, bust and hold
+distributions on the way, or let :func:`simulate_until` keep playing until
+an estimate is as precise as requested.
+"""
+from __future__ import annotations
+import math
+import random
+from functools import lru_cache
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence, Tuple, Union
+
+from .computer import Intelligence
+from .rules import Outcome, outcome_table
+from .seeding import SeedLike, as_seed_sequence
+from .stats import SimStats
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .game import Game
+    from .player import Player
+
+
+BUST = -1
+"""Turn result meaning the player rolled double ones and lost all points."""
+
+
+@lru_cache(maxsize=None)
+def roll_distribution(sides: int = 6) -> Tuple[float, float, Dict[int, float]]:
+    """Return ``(p_bust, p_auto_hold, {gain: p})`` for one roll of two dice."""
+    p = 1.0 / (sides * sides)
+    bust = auto = 0.0
+    gains: Dict[int, float] = {}
+    for outcome, gain in outcome_table(sides):
+        if outcome is Outcome.BUST_ALL:
+            bust += p
+        elif outcome is Outcome.AUTO_HOLD:
+            auto += p
+        else:
+            gains[gain] = gains.get(gain, 0.0) + p
+    return bust, auto, gains
+
+
+def turn_outcomes(
+    brain: Intelligence, my_score: int, opp_score: int, target: int, sides: int = 6
+) -> Dict[int, float]:
+    """Return the distribution of how a turn ends for ``brain``.
+
+    Keys are :data:`BUST` or the number of points banked by the hold
+    (voluntary or automatic), values are probabilities summing to one.
+    """
+    p_bust, p_auto, gains = roll_distribution(sides)
+    steps = list(gains.items())
+    pending = [1.0]
+    result: Dict[int, float] = {BUST: 0.0}
+    t = 0
+    while t < len(pending):
+        p = pending[t]
+        if p:
+            if brain.should_hold(t, my_score, opp_score, target):
+                result[t] = result.get(t, 0.0) + p
+            else:
+                result[BUST] += p * p_bust
+                if p_auto:
+                    result[t] = result.get(t, 0.0) + p * p_auto
+                for gain, pg in steps:
+                    if t + gain >= len(pending):
+                        pending.extend([0.0] * (t + gain + 1 - len(pending)))
+                    pending[t + gain] += p * pg
+        t += 1
+    return result
+
+
+@dataclass
+class BatchResult:
+    """Per-game results of :func:`simulate_batch`.
+
+    ``winners`` holds the winning seat (0 or 1, or -1 when the game hit
+    ``max_turns``), ``turns`` the number of turns played and ``scores0`` /
+    ``scores1`` the final scores of each seat.
+    """
+
+    winners: array = field(default_factory=lambda: array("b"))
+    turns: array = field(default_factory=lambda: array("I"))
+    scores0: array = field(default_factory=lambda: array("H"))
+    scores1: array = field(default_factory=lambda: array("H"))
+
+    def __len__(self) -> int:
+        """Return the number of games played."""
+        return len(self.winners)
+
+    def wins(self, seat: int) -> int:
+        """Return how many games ``seat`` won."""
+        return self.winners.count(seat)
+
+    def win_rate(self, seat: int) -> float:
+        """Return the fraction of the games ``seat`` won."""
+        return self.wins(seat) / len(self) if len(self) else 0.0
+
+
+class TurnSampler:
+    """Cached cumulative turn-outcome tables for one strategy.
+
+    Tables are built lazily per ``(my_score, opp_score)``; keep a sampler
+    around and pass it to :func:`simulate_batch` instead of the brain to reuse
+    them across batches.
+    """
+
+    def __init__(self, brain: Intelligence, target: int, sides: int) -> None:
+        """Sample turns of ``brain`` racing to ``target`` with ``sides``-sided dice."""
+        self.brain = brain
+        self.target = target
+        self.sides = sides
+        self.tables: Dict[Tuple[int, int], Tuple[List[float], List[int]]] = {}
+
+    def table(self, my_score: int, opp_score: int) -> Tuple[List[float], List[int]]:
+        """Cumulative probabilities and the turn results they lead to."""
+        key = (my_score, opp_score)
+        tab = self.tables.get(key)
+        if tab is None:
+            dist = turn_outcomes(
+                self.brain, my_score, opp_score, self.target, self.sides
+            )
+            results = sorted(dist)
+            cum: List[float] = []
+            acc = 0.0
+            for r in results:
+                acc += dist[r]
+                cum.append(acc)
+            cum[-1] = 2.0  # guard against rounding: any u < 1 lands in range
+            tab = self.tables[key] = (cum, results)
+        return tab
+
+
+def play_out(
+    samplers: Sequence[TurnSampler],
+    scores: List[int],
+    current: int,
+    target: int,
+    rng: random.Random,
+    max_turns: int,
+    stats: Optional[SimStats] = None,
+) -> Tuple[int, int]:
+    """Finish a game from the start of ``current``'s turn.
+
+    ``scores`` is updated in place. Returns ``(winner, turns)``. Busts and
+    holds are counted into ``stats`` when given.
+    """
+    uniform = rng.random
+    turns = 0
+    while turns < max_turns:
+        turns += 1
+        me = current
+        current = 1 - me
+        key = (scores[me], scores[current])
+        tab = samplers[me].tables.get(key) or samplers[me].table(*key)
+        res = tab[1][bisect_right(tab[0], uniform())]
+        if res == BUST:
+            scores[me] = 0
+            if stats is not None:
+                stats.busts += 1
+            continue
+        if stats is not None:
+            stats.hold.add(res)
+        scores[me] += res
+        if scores[me] >= target:
+            return me, turns
+    return -1, turns
+
+
+def simulate_batch(
+    brains: Sequence[Union[Intelligence, TurnSampler]],
+    n: int,
+    target: int = 100,
+    rng: Optional[random.Random] = None,
+    sides: int = 6,
+    max_turns: int = 10_000,
+    seed: Optional[SeedLike] = None,
+    first_index: int = 0,
+    stats: Optional[SimStats] = None,
+) -> BatchResult:
+    """Play ``n`` independent games between ``brains[0]`` and ``brains[1]``.
+
+    Seat 0 always takes the first turn, like ``players[0]`` in :class:`Game`.
+    With ``seed`` each game ``i`` gets its own stream ``seed.child(first_index
+    + i)`` instead of sharing ``rng``, so ``n=1, first_index=i`` replays game
+    ``i`` of a larger batch exactly. Every game is also recorded into
+    ``stats`` when given.
+    """
+    if len(brains) != 2:
+        raise ValueError("simulate_batch needs exactly two brains")
+    rng = rng if rng is not None else random.Random()
+    samplers = []
+    for b in brains:
+        if not isinstance(b, TurnSampler):
+            b = TurnSampler(b, target, sides)
+        elif (b.target, b.sides) != (target, sides):
+            b = TurnSampler(b.brain, target, sides)
+        samplers.append(b)
+    root = as_seed_sequence(seed) if seed is not None else None
+    out = BatchResult()
+    for i in range(first_index, first_index + n):
+        scores = [0, 0]
+        game_rng = root.child(i).random() if root is not None else rng
+        winner, turns = play_out(
+            samplers, scores, 0, target, game_rng, max_turns, stats
+        )
+        if stats is not None:
+            stats.record_game(winner, turns, scores[0], scores[1])
+        out.winners.append(winner)
+        out.turns.append(turns)
+        out.scores0.append(scores[0])
+        out.scores1.append(scores[1])
+    return out
+
+
+def simulate_until(
+    brains: Sequence[Union[Intelligence, TurnSampler]],
+    epsilon: float,
+    quantity: str = "win_rate",
+    z: float = 1.96,
+    target: int = 100,
+    seed: SeedLike = 0,
+    sides: int = 6,
+    min_batch: int = 1_000,
+    max_games: int = 10_000_000,
+    stats: Optional[SimStats] = None,
+) -> SimStats:
+    """Play batches until the confidence interval of ``quantity`` is below ``epsilon``.
+
+    ``quantity`` is one of :meth:`SimStats.spread`'s. After every batch the
+    games still needed are estimated from the spread seen so far; the next
+    batch plays that many, but at least ``min_batch`` and at most as many
+    as have already been played, so a noisy early estimate cannot overshoot
+    by much. The run never stops before ``min_batch`` games. Game ``i``
+    always uses stream ``seed.child(i)``, so the games played do not depend
+    on how they were batched.
+    """
+    stats = stats if stats is not None else SimStats()
+    samplers = [
+        b if isinstance(b, TurnSampler) else TurnSampler(b, target, sides)
+        for b in brains
+    ]
+    root = as_seed_sequence(seed)
+    batch = min_batch
+    while stats.games < max_games:
+        simulate_batch(
+            samplers,
+            batch,
+            target,
+            sides=sides,
+            seed=root,
+            first_index=stats.games,
+            stats=stats,
+        )
+        if stats.games >= min_batch and stats.ci_width(quantity, z) < epsilon:
+            break
+        # margins and holds are not one per game: scale by how often they occur
+        seen = stats.observations(quantity)
+        needed = math.ceil((2.0 * z * stats.spread(quantity) / epsilon) ** 2) - seen
+        if needed > 0:
+            needed = math.ceil(needed * stats.games / seen) if seen else max_games
+        batch = min(max(needed, min_batch), stats.games, max_games - stats.games)
+    return stats
+
+
+def play_game(game: "Game", max_turns: int = 10_000) -> Optional["Player"]:
+    """Drive a started :class:`Game` between two computers until someone wins.
+
+    This is the scalar reference that :func:`simulate_batch` reproduces.
+    """
+    while game.winner() is None and game.turns_taken < max_turns:
+        if game.decide_hold():
+            game.hold_result()
+        else:
+            game.roll_result()
+    return game.winner()
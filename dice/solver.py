@@ -0,0 +1,230 @@
+# dice/solver.py
+"""Optimal roll/hold policy for the two-dice variant, solved by value iteration.
+
+For every state ``(my_score, opp_score, turn_total)`` the solver finds the
+decision that maximises the probability of winning against an opponent who
+also plays optimally. The policy is stored as a bit table (one bit per state,
+``1`` meaning *roll*) behind a small header, so it can be memory-mapped and
+shared read-only by any number of processes.
+
+Generate a table with ``python -m dice.solver --target 100``. The default
+table (target 100) is solved and written on first use if it is missing.
+"""
+from __future__ import annotations
+import argparse
+import mmap
+import os
+import struct
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .computer import Intelligence
+from .simulate import roll_distribution
+
+
+MAGIC = b"PIGP"
+VERSION = 1
+_HEADER = struct.Struct("<4sHHH")  # magic, version, target, sides
+DEFAULT_TABLE = "public/optimal_100.bin"
+
+
+class SolverError(RuntimeError):
+    """Raised when value iteration fails to converge or a table is invalid."""
+
+
+@dataclass
+class Solution:
+    """Converged win probabilities at the start of each turn.
+
+    ``win[i * target + j]`` is the chance that the player about to move with
+    ``i`` points beats an opponent holding ``j`` points.
+    """
+
+    target: int
+    sides: int
+    win: List[float]
+    sweeps: int
+    delta: float
+
+
+def _column(win: List[float], i: int, j: int, target: int, dist, bits=None) -> float:
+    """Solve the turn-total column of ``(i, j)`` given current start-of-turn values.
+
+    Within a turn the turn total only grows, so the column is solved exactly
+    from the top down. When ``bits`` is given the roll decisions are recorded
+    in it. Returns the value at ``turn_total == 0``.
+    """
+    p_bust, p_auto, gains = dist
+    limit = target - i  # turn totals >= limit win by holding
+    row = j * target
+    bust = p_bust * (1.0 - win[row])
+    col = [1.0] * (limit + gains[-1][0] + 1)
+    for k in range(limit - 1, -1, -1):
+        hold = 1.0 - win[row + i + k]
+        roll = bust + p_auto * hold
+        for gain, pg in gains:
+            roll += pg * col[k + gain]
+        if roll > hold:
+            col[k] = roll
+            if bits is not None:
+                idx = (i * target + j) * target + k
+                bits[idx >> 3] |= 1 << (idx & 7)
+        else:
+            col[k] = hold
+    return col[0]
+
+
+def solve(
+    target: int = 100, tol: float = 1e-9, max_sweeps: int = 1000, sides: int = 6
+) -> Solution:
+    """Run in-place value iteration until no value moves by more than ``tol``."""
+    p_bust, p_auto, gains = roll_distribution(sides)
+    dist = (p_bust, p_auto, sorted(gains.items()))
+    win = [0.5] * (target * target)
+    order = sorted(
+        ((i, j) for i in range(target) for j in range(target)),
+        key=lambda s: -(s[0] + s[1]),
+    )
+    for sweep in range(1, max_sweeps + 1):
+        delta = 0.0
+        for i, j in order:
+            new = _column(win, i, j, target, dist)
+            idx = i * target + j
+            if abs(new - win[idx]) > delta:
+                delta = abs(new - win[idx])
+            win[idx] = new
+        if delta < tol:
+            return Solution(target, sides, win, sweep, delta)
+    raise SolverError(
+        f"value iteration did not converge in {max_sweeps} sweeps (delta={delta:.3g})"
+    )
+
+
+def policy_bits(solution: Solution) -> bytearray:
+    """Return the packed roll/hold decisions for ``solution``."""
+    t = solution.target
+    p_bust, p_auto, gains = roll_distribution(solution.sides)
+    dist = (p_bust, p_auto, sorted(gains.items()))
+    bits = bytearray((t * t * t + 7) // 8)
+    for i in range(t):
+        for j in range(t):
+            _column(solution.win, i, j, t, dist, bits)
+    return bits
+
+
+def save_table(path: str, solution: Solution) -> None:
+    """Write the decision table for ``solution`` to ``path``.
+
+    The file is replaced atomically, so readers never map a partial table.
+    """
+    p = Path(path)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = Path(f"{path}.tmp.{os.getpid()}")
+    with tmp.open("wb") as fh:
+        fh.write(_HEADER.pack(MAGIC, VERSION, solution.target, solution.sides))
+        fh.write(policy_bits(solution))
+    os.replace(tmp, p)
+
+
+class PolicyTable:
+    """Read-only, memory-mapped view of a saved decision table."""
+
+    def __init__(self, path: str) -> None:
+        """Map the table saved at ``path``; :class:`SolverError` if it is not one."""
+        with open(path, "rb") as fh:
+            self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, target, sides = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise SolverError(f"{path} is not a policy table")
+        if len(self._mm) < _HEADER.size + (target ** 3 + 7) // 8:
+            raise SolverError(f"{path} is truncated")
+        self.path = path
+        self.target = target
+        self.sides = sides
+
+    def should_roll(self, my_score: int, opp_score: int, turn_total: int) -> bool:
+        """Return the optimal decision; past the target holding always wins."""
+        t = self.target
+        if my_score + turn_total >= t:
+            return False
+        idx = (my_score * t + opp_score) * t + turn_total
+        return bool(self._mm[_HEADER.size + (idx >> 3)] >> (idx & 7) & 1)
+
+    def close(self) -> None:
+        """Unmap the table."""
+        self._mm.close()
+
+
+_TABLES: Dict[str, PolicyTable] = {}
+
+
+def load_table(path: str = DEFAULT_TABLE) -> PolicyTable:
+    """Return the process-wide shared :class:`PolicyTable` for ``path``.
+
+    A missing :data:`DEFAULT_TABLE` is solved and saved first (a few seconds);
+    any other missing path raises :class:`SolverError`.
+    """
+    key = str(Path(path).resolve())
+    table = _TABLES.get(key)
+    if table is None:
+        try:
+            table = PolicyTable(path)
+        except FileNotFoundError:
+            if path != DEFAULT_TABLE:
+                raise SolverError(
+                    f"no policy table at {path}; create it with "
+                    f"python -m dice.solver --target <target> --out {path}"
+                ) from None
+            save_table(path, solve(100))
+            table = PolicyTable(path)
+        _TABLES[key] = table
+    return table
+
+
+@dataclass
+class OptimalIntelligence(Intelligence):
+    """Plays the solved optimal policy from a precomputed table.
+
+    The table is loaded on first use (the default one is solved then if it
+    does not exist yet) and shared by all instances in the process. Games
+    with a different target fall back to the threshold rule.
+    """
+
+    table_path: str = DEFAULT_TABLE
+    _table: Optional[PolicyTable] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def should_hold(
+        self, turn_total: int, my_score: int, opp_score: int, target: int
+    ) -> bool:
+        """Look the decision up in the table, or use the threshold off the table."""
+        if my_score + turn_total >= target:
+            return True
+        if self._table is None:
+            self._table = load_table(self.table_path)
+        if target != self._table.target or max(my_score, opp_score) >= target:
+            return super().should_hold(turn_total, my_score, opp_score, target)
+        return not self._table.should_roll(my_score, opp_score, turn_total)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Solve for ``--target`` and save the decision table."""
+    parser = argparse.ArgumentParser(description="Solve the optimal Pig policy.")
+    parser.add_argument("--target", type=int, default=100)
+    parser.add_argument("--tol", type=float, default=1e-9)
+    parser.add_argument("--max-sweeps", type=int, default=1000)
+    parser.add_argument(
+        "--out", default=None, help="table path (default public/optimal_<target>.bin)"
+    )
+    args = parser.parse_args(argv)
+    solution = solve(args.target, args.tol, args.max_sweeps)
+    out = args.out or f"public/optimal_{args.target}.bin"
+    save_table(out, solution)
+    print(f"Converged after {solution.sweeps} sweeps (delta={solution.delta:.2e}); "
+          f"P(first player wins) = {solution.win[0]:.4f}. Wrote {out}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+# dice/state.py
+"""Compact, fixed-layout snapshots of a game in progress.
+
+A snapshot holds only the numbers needed to continue a game: target, both
+scores, turn total, whose turn it is, the winner seat, turns taken and any
+scripted rolls still queued. Players, dice and the high-score store are not
+included; the host keeps those (or rebuilds them) and restores the numbers
+into a :class:`~dice.game.Game` with the same seating.
+
+Layout (little endian): ``version:u8 target:u16 score0:u16 score1:u16
+turn_total:u16 current:u8 winner:i8 turns_taken:u32 pending:u16`` followed
+by two bytes per pending roll — 19 bytes for a game without scripted rolls.
+"""
+from __future__ import annotations
+import struct
+from typing import TYPE_CHECKING, Iterable, Optional, Tuple
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .game import Game
+
+
+VERSION = 1
+_HEADER = struct.Struct("<BHHHHBbIH")
+
+
+class GameState:
+    """The restorable numbers of a :class:`Game`, without per-instance dicts."""
+
+    __slots__ = (
+        "target", "scores", "turn_total", "current", "winner", "turns_taken", "pending"
+    )
+
+    def __init__(
+        self,
+        target: int,
+        scores: Tuple[int, int],
+        turn_total: int = 0,
+        current: int = 0,
+        winner: Optional[int] = None,
+        turns_taken: int = 0,
+        pending: Iterable[Tuple[int, int]] = (),
+    ) -> None:
+        """Hold the numbers as given; scores and rolls are copied into tuples."""
+        self.target = target
+        self.scores = tuple(scores)
+        self.turn_total = turn_total
+        self.current = current
+        self.winner = winner
+        self.turns_taken = turns_taken
+        self.pending = tuple(tuple(r) for r in pending)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare every slot."""
+        if not isinstance(other, GameState):
+            return NotImplemented
+        return all(getattr(self, s) == getattr(other, s) for s in self.__slots__)
+
+    def __repr__(self) -> str:
+        """Show every slot."""
+        fields = ", ".join(f"{s}={getattr(self, s)!r}" for s in self.__slots__)
+        return f"GameState({fields})"
+
+    @classmethod
+    def from_game(cls, game: "Game") -> "GameState":
+        """Capture the numbers of ``game`` as it stands."""
+        winner = game.winner()
+        return cls(
+            game.target,
+            (game.players[0].score, game.players[1].score),
+            game.turn_total,
+            game._current_idx,
+            None if winner is None else game.players.index(winner),
+            game.turns_taken,
+            game.pending_rolls(),
+        )
+
+    def apply(self, game: "Game") -> None:
+        """Overwrite the state of ``game`` (same two players) with this snapshot."""
+        game.target = self.target
+        for player, score in zip(game.players, self.scores):
+            player.score = score
+        game.turn_total = self.turn_total
+        game._current_idx = self.current
+        game._winner = None if self.winner is None else game.players[self.winner]
+        game.turns_taken = self.turns_taken
+        game.set_cheat(list(self.pending))
+
+    def to_bytes(self) -> bytes:
+        """Pack into the snapshot layout; ``ValueError`` if a number does not fit."""
+        try:
+            head = _HEADER.pack(
+                VERSION,
+                self.target,
+                self.scores[0],
+                self.scores[1],
+                self.turn_total,
+                self.current,
+                -1 if self.winner is None else self.winner,
+                self.turns_taken,
+                len(self.pending),
+            )
+            return head + bytes(v for roll in self.pending for v in roll)
+        except (struct.error, ValueError) as exc:
+            raise ValueError(
+                f"game state does not fit the snapshot layout: {exc}"
+            ) from exc
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "GameState":
+        """Unpack a snapshot; ``ValueError`` if truncated or of another version."""
+        if len(data) < _HEADER.size:
+            raise ValueError("snapshot is truncated")
+        fields = _HEADER.unpack_from(data)
+        version, target, s0, s1, total, current, winner, turns, n = fields
+        if version != VERSION:
+            raise ValueError(f"unsupported snapshot version {version}")
+        body = data[_HEADER.size:]
+        if len(body) != 2 * n:
+            raise ValueError("snapshot is truncated")
+        pending = [(body[i], body[i + 1]) for i in range(0, len(body), 2)]
+        seat = None if winner < 0 else winner
+        return cls(target, (s0, s1), total, current, seat, turns, pending)
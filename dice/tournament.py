@@ -0,0 +1,248 @@
+# dice/tournament.py
+"""Round-robin tournaments between computer strategies on a process pool.
+
+Every pair of strategies plays ``games`` games, half with each side starting
+(the odd game of an odd count goes to the first strategy); games cut off at
+the turn limit count as draws. The games of a pairing are cut into chunks
+that run as independent tasks on a
+:class:`concurrent.futures.ProcessPoolExecutor`; each chunk has its own
+random stream, the child ``(a, b, chunk)`` of the root
+:class:`~dice.seeding.SeedSequence`, so a
+tournament gives the same result regardless of worker count or scheduling.
+
+Run it with, for example::
+
+    python -m dice.tournament 15 20 25 optimal --games 20000 --workers 4
+"""
+from __future__ import annotations
+import argparse
+import importlib
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .computer import EndgameIntelligence, Intelligence
+from .seeding import SeedSequence
+from .simulate import TurnSampler, simulate_batch
+
+
+def parse_strategy(spec: str) -> Intelligence:
+    """Build an :class:`Intelligence` from a command-line spec.
+
+    Accepted forms: ``20`` or ``threshold:20``; ``endgame:<threshold>,<chase>,
+    <race_at>`` (see :class:`~dice.computer.EndgameIntelligence`); ``optimal``
+    or ``optimal:<table path>``; ``package.module:Name`` for any zero-argument
+    callable returning a strategy.
+    """
+    kind, _, arg = spec.partition(":")
+    if kind.isdigit():
+        return Intelligence(int(kind))
+    if kind == "threshold":
+        return Intelligence(int(arg))
+    if kind == "endgame":
+        parts = arg.split(",")
+        return EndgameIntelligence(
+            int(parts[0]),
+            float(parts[1]) if len(parts) > 1 else 0.0,
+            int(parts[2]) if len(parts) > 2 else 0,
+        )
+    if kind == "optimal":
+        from .solver import OptimalIntelligence
+
+        return OptimalIntelligence(table_path=arg) if arg else OptimalIntelligence()
+    if arg:
+        return getattr(importlib.import_module(kind), arg)()
+    raise ValueError(f"unknown strategy spec: {spec!r}")
+
+
+def wilson(wins: int, n: int, z: float = 1.96) -> Tuple[float, float]:
+    """Return the Wilson score interval for ``wins`` successes in ``n`` trials."""
+    if n == 0:
+        return 0.0, 1.0
+    p = wins / n
+    denom = 1 + z * z / n
+    centre = (p + z * z / (2 * n)) / denom
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+    return max(0.0, centre - half), min(1.0, centre + half)
+
+
+@dataclass(frozen=True)
+class Task:
+    """One chunk of games between strategies ``a`` and ``b`` (indices)."""
+
+    a: int
+    b: int
+    a_first: bool
+    chunk: int
+    games: int
+
+
+@dataclass
+class PairResult:
+    """Head-to-head totals of one pairing."""
+
+    wins_a: int = 0
+    wins_b: int = 0
+    draws: int = 0
+
+    @property
+    def games(self) -> int:
+        """Games played, draws included."""
+        return self.wins_a + self.wins_b + self.draws
+
+
+@dataclass
+class TournamentResult:
+    """Pairing totals of a tournament, keyed by strategy indices ``(a, b)``."""
+
+    strategies: List[str]
+    pairs: Dict[Tuple[int, int], PairResult] = field(default_factory=dict)
+
+    def record(self, task: Task, wins_a: int, wins_b: int) -> None:
+        """Add the outcome of one finished chunk."""
+        res = self.pairs.setdefault((task.a, task.b), PairResult())
+        res.wins_a += wins_a
+        res.wins_b += wins_b
+        res.draws += task.games - wins_a - wins_b  # hit the turn limit
+
+    def standings(self) -> List[Tuple[str, int, int, float, Tuple[float, float]]]:
+        """Return ``(strategy, wins, games, win_rate, ci95)`` rows, best first."""
+        wins = [0] * len(self.strategies)
+        games = [0] * len(self.strategies)
+        for (a, b), res in self.pairs.items():
+            wins[a] += res.wins_a
+            wins[b] += res.wins_b
+            games[a] += res.games
+            games[b] += res.games
+        rows = [
+            (s, w, n, w / n if n else 0.0, wilson(w, n))
+            for s, w, n in zip(self.strategies, wins, games)
+        ]
+        rows.sort(key=lambda r: -r[3])
+        return rows
+
+
+def schedule(n_strategies: int, games: int, chunk: int) -> Iterator[Task]:
+    """Yield the chunks of a round robin, alternating who starts.
+
+    Each pairing's games are split evenly by seat before chunking, so both
+    strategies start the same number of games whatever the chunk size.
+    """
+    for a, b in combinations(range(n_strategies), 2):
+        remaining = [(games + 1) // 2, games // 2]  # a starts, b starts
+        c = 0
+        while any(remaining):
+            for seat in (0, 1):
+                size = min(chunk, remaining[seat])
+                if size:
+                    yield Task(a, b, seat == 0, c, size)
+                    remaining[seat] -= size
+                    c += 1
+
+
+_SAMPLERS: Dict[Tuple[str, int], TurnSampler] = {}
+
+
+def _sampler(spec: str, target: int) -> TurnSampler:
+    """Per-process cache so turn tables are built once per strategy."""
+    key = (spec, target)
+    if key not in _SAMPLERS:
+        _SAMPLERS[key] = TurnSampler(parse_strategy(spec), target, 6)
+    return _SAMPLERS[key]
+
+
+def play_chunk(
+    task: Task, specs: Sequence[str], target: int, seed: int
+) -> Tuple[Task, int, int]:
+    """Play one chunk; returns the task with the wins of ``a`` and ``b``."""
+    rng = SeedSequence(seed, (task.a, task.b, task.chunk)).random()
+    first, second = (task.a, task.b) if task.a_first else (task.b, task.a)
+    samplers = [_sampler(specs[first], target), _sampler(specs[second], target)]
+    res = simulate_batch(samplers, task.games, target, rng)
+    wins_first, wins_second = res.wins(0), res.wins(1)
+    if task.a_first:
+        return task, wins_first, wins_second
+    return task, wins_second, wins_first
+
+
+def run_tournament(
+    specs: Sequence[str],
+    games: int = 10_000,
+    target: int = 100,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    chunk: int = 2_000,
+    on_result: Optional[Callable[[Task, int, int], None]] = None,
+) -> TournamentResult:
+    """Play a full round robin between ``specs`` and return the aggregate.
+
+    ``workers=0`` plays everything in the calling process. ``on_result`` is
+    called as each chunk finishes, in completion order.
+    """
+    for spec in specs:
+        parse_strategy(spec)  # fail fast on typos before spawning workers
+    result = TournamentResult(list(specs))
+    tasks = list(schedule(len(specs), games, chunk))
+    if workers == 0:
+        done = (play_chunk(t, specs, target, seed) for t in tasks)
+        for task, wa, wb in done:
+            result.record(task, wa, wb)
+            if on_result:
+                on_result(task, wa, wb)
+        return result
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(play_chunk, t, specs, target, seed) for t in tasks]
+        for fut in as_completed(futures):
+            task, wa, wb = fut.result()
+            result.record(task, wa, wb)
+            if on_result:
+                on_result(task, wa, wb)
+    return result
+
+
+def format_report(result: TournamentResult) -> str:
+    """Render the standings and the head-to-head table."""
+    lines = ["Standings (wins/games, win%, 95% CI):"]
+    for i, (spec, wins, games, rate, (lo, hi)) in enumerate(result.standings(), 1):
+        lines.append(
+            f" {i:>2}. {spec:<20} {wins:>8}/{games:<8} {100 * rate:5.1f}%  "
+            f"[{100 * lo:5.1f}, {100 * hi:5.1f}]"
+        )
+    lines.append("Head to head:")
+    for (a, b), res in sorted(result.pairs.items()):
+        lo, hi = wilson(res.wins_a, res.games)
+        lines.append(
+            f"  {result.strategies[a]:<20} vs {result.strategies[b]:<20} "
+            f"{100 * res.wins_a / res.games:5.1f}%  [{100 * lo:5.1f}, {100 * hi:5.1f}]"
+            + (f"  {res.draws} drawn" if res.draws else "")
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run a tournament from the command line and print the report."""
+    parser = argparse.ArgumentParser(
+        description="Round-robin tournament between AI strategies."
+    )
+    parser.add_argument(
+        "strategies", nargs="+", help="e.g. 15, threshold:20, optimal, pkg.mod:Name"
+    )
+    parser.add_argument("--games", type=int, default=10_000, help="games per pairing")
+    parser.add_argument("--target", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk", type=int, default=2_000)
+    args = parser.parse_args(argv)
+    if len(args.strategies) < 2:
+        parser.error("need at least two strategies")
+    result = run_tournament(
+        args.strategies, args.games, args.target, args.seed, args.workers, args.chunk
+    )
+    print(format_report(result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+# dice/tuner.py
+"""Search strategy parameters for the computer's difficulty tiers.
+
+Every candidate strategy (a :func:`~dice.tournament.parse_strategy` spec)
+plays simulated games against a fixed reference opponent, half of them
+moving first. Games are played in rounds on a process pool. After each
+round a candidate is dropped from a tier once even its most optimistic
+confidence bound is worse than the leader's most pessimistic one. A decided
+tier stops racing, so a candidate that is left in no undecided tier stops
+playing, and the search ends as soon as every tier is decided.
+
+A tier is a target win rate against the reference: ``easy`` and ``medium``
+look for a beatable opponent, ``hard`` (target ``1.0``) simply maximises.
+The report compares the games actually played with a fixed-sample grid
+search that gives every candidate ``max_games`` games.
+
+Run it with ``python -m dice.tuner --workers 4 --out public/tuned.json``.
+"""
+from __future__ import annotations
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .seeding import SeedSequence
+from .simulate import simulate_batch
+from .tournament import _sampler, parse_strategy, wilson
+
+
+TIERS: Dict[str, float] = {"easy": 0.30, "medium": 0.50, "hard": 1.0}
+
+
+def default_grid() -> List[str]:
+    """Endgame-aware candidates around the hand-picked 15/20/25 thresholds."""
+    return [
+        f"endgame:{t},{chase},{race}"
+        for t in (10, 12, 15, 18, 20, 22, 25, 28, 32)
+        for chase in (0.0, 1.0, 2.0)
+        for race in (0, 20)
+    ]
+
+
+@dataclass
+class Candidate:
+    """One strategy spec, its results so far and the tiers it still races in."""
+
+    spec: str
+    wins: int = 0
+    games: int = 0
+    tiers: List[str] = field(default_factory=list)
+
+    @property
+    def rate(self) -> float:
+        """Win rate against the reference so far."""
+        return self.wins / self.games if self.games else 0.0
+
+
+def _distance_bounds(c: Candidate, goal: float, z: float) -> Tuple[float, float]:
+    """Best and worst possible ``|win_rate - goal|`` inside the confidence interval."""
+    lo, hi = wilson(c.wins, c.games, z)
+    best = 0.0 if lo <= goal <= hi else min(abs(lo - goal), abs(hi - goal))
+    return best, max(abs(lo - goal), abs(hi - goal))
+
+
+def play_round(
+    spec: str, reference: str, games: int, target: int, seed: int, key: Tuple[int, ...]
+) -> Tuple[int, float]:
+    """Play ``spec`` against ``reference`` ``games`` times; return wins, CPU s."""
+    start = time.process_time()
+    root = SeedSequence(seed, key)
+    mine, ref = _sampler(spec, target), _sampler(reference, target)
+    first = games // 2
+    wins = simulate_batch([mine, ref], first, target, root.child(0).random()).wins(0)
+    second = simulate_batch([ref, mine], games - first, target, root.child(1).random())
+    wins += second.wins(1)
+    return wins, time.process_time() - start
+
+
+@dataclass
+class TuneResult:
+    """Every candidate's results and the best one per tier."""
+
+    reference: str
+    candidates: List[Candidate]
+    best: Dict[str, Candidate]
+    rounds: int
+    max_games: int
+    cpu_seconds: float
+
+    @property
+    def games_played(self) -> int:
+        """Games the race actually played."""
+        return sum(c.games for c in self.candidates)
+
+    @property
+    def grid_games(self) -> int:
+        """Games a fixed-sample grid search would have played."""
+        return len(self.candidates) * self.max_games
+
+    @property
+    def seconds_saved(self) -> float:
+        """Estimated CPU time a fixed-sample grid search would have needed on top."""
+        per_game = self.cpu_seconds / self.games_played if self.games_played else 0.0
+        return per_game * (self.grid_games - self.games_played)
+
+    def to_json(self, tiers: Dict[str, float] = TIERS) -> Dict:
+        """Return the best spec per tier with its interval, plus the savings."""
+        out = {"reference": self.reference, "tiers": {}}
+        for tier, c in self.best.items():
+            lo, hi = wilson(c.wins, c.games)
+            out["tiers"][tier] = {
+                "spec": c.spec,
+                "strategy": repr(parse_strategy(c.spec)),
+                "goal": tiers.get(tier),
+                "win_rate": c.rate,
+                "ci95": [lo, hi],
+                "games": c.games,
+            }
+        out["games_played"] = self.games_played
+        out["grid_games"] = self.grid_games
+        out["cpu_seconds"] = self.cpu_seconds
+        out["cpu_seconds_saved"] = self.seconds_saved
+        return out
+
+
+def tune(
+    specs: Optional[Sequence[str]] = None,
+    reference: str = "20",
+    tiers: Dict[str, float] = TIERS,
+    batch: int = 500,
+    max_games: int = 20_000,
+    target: int = 100,
+    seed: int = 0,
+    z: float = 2.58,
+    tolerance: float = 0.01,
+    workers: Optional[int] = None,
+) -> TuneResult:
+    """Race the candidates in rounds of ``batch`` games until every tier is decided.
+
+    A tier is decided when one candidate is left in it, or when every
+    remaining candidate's interval is narrower than ``tolerance`` on each
+    side (they are equally good). No candidate plays more than ``max_games``.
+    ``workers=0`` runs everything in the calling process.
+    """
+    specs = list(specs) if specs is not None else default_grid()
+    for spec in [*specs, reference]:
+        parse_strategy(spec)  # fail fast on typos before spawning workers
+    cands = [Candidate(s, tiers=list(tiers)) for s in specs]
+    contenders = {tier: list(cands) for tier in tiers}
+    racing = dict(tiers)
+    cpu = 0.0
+    rounds = 0
+    pool = ProcessPoolExecutor(max_workers=workers) if workers != 0 else None
+    try:
+        while True:
+            todo = [
+                (i, c) for i, c in enumerate(cands) if c.tiers and c.games < max_games
+            ]
+            if not todo:
+                break
+            size = [min(batch, max_games - c.games) for _, c in todo]
+            args = [
+                (c.spec, reference, n, target, seed, (i, rounds))
+                for (i, c), n in zip(todo, size)
+            ]
+            if pool is None:
+                results = [play_round(*a) for a in args]
+            else:
+                futures = [pool.submit(play_round, *a) for a in args]
+                results = [f.result() for f in futures]
+            for (_, c), n, (wins, secs) in zip(todo, size, results):
+                c.wins += wins
+                c.games += n
+                cpu += secs
+            rounds += 1
+            for tier, goal in list(racing.items()):
+                bounds = {
+                    id(c): _distance_bounds(c, goal, z) for c in contenders[tier]
+                }
+                cutoff = min(worst for _, worst in bounds.values()) + tolerance
+                keep = [c for c in contenders[tier] if bounds[id(c)][0] <= cutoff]
+                for c in contenders[tier]:
+                    if bounds[id(c)][0] > cutoff:
+                        c.tiers.remove(tier)
+                contenders[tier] = keep
+                spread = max(bounds[id(c)][1] - bounds[id(c)][0] for c in keep)
+                if len(keep) == 1 or spread <= 2 * tolerance:
+                    # decided: its finalists only keep playing for other tiers
+                    del racing[tier]
+                    for c in keep:
+                        c.tiers.remove(tier)
+            if not racing:
+                break
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    best = {
+        tier: min(contenders[tier], key=lambda c: (abs(c.rate - goal), -c.games))
+        for tier, goal in tiers.items()
+    }
+    return TuneResult(reference, cands, best, rounds, max_games, cpu)
+
+
+def format_report(result: TuneResult) -> str:
+    """Render the best spec per tier and what racing saved over a grid search."""
+    lines = [f"Best configurations vs {result.reference}:"]
+    for tier, c in result.best.items():
+        lo, hi = wilson(c.wins, c.games)
+        lines.append(
+            f"  {tier:<7} {c.spec:<22} {100 * c.rate:5.1f}%  "
+            f"[{100 * lo:5.1f}, {100 * hi:5.1f}]  {c.games} games"
+        )
+    saved = result.grid_games - result.games_played
+    grid_cpu = result.cpu_seconds + result.seconds_saved
+    lines.append(
+        f"Played {result.games_played:,} games in {result.rounds} rounds; "
+        f"a grid search needs {result.grid_games:,} "
+        f"({100 * saved / result.grid_games:.0f}% saved, "
+        f"~{result.seconds_saved:.1f} CPU s of {grid_cpu:.1f})."
+    )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Tune from the command line, print the report and write ``--out``."""
+    parser = argparse.ArgumentParser(
+        description="Tune computer strategies per difficulty tier."
+    )
+    parser.add_argument(
+        "candidates", nargs="*", help="strategy specs (default: an endgame grid)"
+    )
+    parser.add_argument("--reference", default="20")
+    parser.add_argument(
+        "--batch", type=int, default=500, help="games per candidate per round"
+    )
+    parser.add_argument("--max-games", type=int, default=20_000)
+    parser.add_argument("--target", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="public/tuned.json")
+    args = parser.parse_args(argv)
+    result = tune(
+        args.candidates or None, args.reference, TIERS, args.batch, args.max_games,
+        args.target, args.seed, workers=args.workers,
+    )
+    print(format_report(result))
+    Path(args.out).parent.mkdir(parents=True, exist_ok=True)
+    text = json.dumps(result.to_json(), indent=2) + "\n"
+    Path(args.out).write_text(text, encoding="utf-8")
+    print(f"Wrote {args.out}")
+
+
+if __name__ == "__main__":
+    main()
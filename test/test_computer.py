@@ -1,5 +1,5 @@
 import unittest
-from dice.computer import Intelligence, Computer, ComputerError
+from dice.computer import EndgameIntelligence, Intelligence, Computer, ComputerError
 
 
 class TestComputer(unittest.TestCase):
@@ -10,6 +10,16 @@ class TestComputer(unittest.TestCase):
        self.assertTrue(brain.should_hold(12, 90, 0, 100))  # would win
 
 
+   def test_endgame_intelligence_chases_and_races(self):
+       brain = EndgameIntelligence(20, chase=2.0, race_at=15)
+       self.assertFalse(brain.should_hold(20, 30, 50, 100))  # behind by 20 -> holds at 24
+       self.assertTrue(brain.should_hold(24, 30, 50, 100))
+       self.assertTrue(brain.should_hold(16, 50, 30, 100))   # ahead by 20 -> holds at 16
+       self.assertFalse(brain.should_hold(40, 50, 85, 100))  # opponent close: race to 100
+       self.assertTrue(brain.should_hold(50, 50, 85, 100))
+       self.assertEqual(EndgameIntelligence(20), EndgameIntelligence(risk_threshold=20, chase=0.0, race_at=0))
+
+
    def test_computer_decide_hold(self):
        brain = Intelligence(risk_threshold=10)
        bot = Computer("pid-bot", "Computer", brain)
@@ -1,3 +1,4 @@
+import random
 import unittest
 from dice.dice import Die
 
@@ -28,3 +29,29 @@ class TestDie(unittest.TestCase):
        d = Die(sides=8, rng=DummyRng([8, 1]))
        self.assertEqual(d.roll(), 8)
        self.assertEqual(d.roll(), 1)
+
+
+class TestDieRollMany(unittest.TestCase):
+   def test_roll_many_range_and_type(self):
+       buf = Die(rng=random.Random(1)).roll_many(500)
+       self.assertEqual(buf.typecode, "B")
+       self.assertEqual(len(buf), 500)
+       self.assertTrue(all(1 <= v <= 6 for v in buf))
+       self.assertEqual(set(buf), {1, 2, 3, 4, 5, 6})
+
+
+   def test_roll_many_seeded_is_reproducible(self):
+       a = Die(rng=random.Random(5)).roll_many(100)
+       b = Die(rng=random.Random(5)).roll_many(100)
+       self.assertEqual(a, b)
+
+
+   def test_roll_many_falls_back_to_randint(self):
+       d = Die(rng=DummyRng([3, 1, 6]))
+       self.assertEqual(list(d.roll_many(3)), [3, 1, 6])
+
+
+   def test_roll_many_wide_die(self):
+       buf = Die(sides=1000, rng=random.Random(2)).roll_many(50)
+       self.assertEqual(buf.typecode, "H")
+       self.assertTrue(all(1 <= v <= 1000 for v in buf))
@@ -1,3 +1,4 @@
+import random
 import unittest
 from unittest.mock import patch
 from dice import dice_hand as dice_hand_module
@@ -25,3 +26,30 @@ class TestDiceHand(unittest.TestCase):
            self.assertEqual(vals, (3, 5))
 
 
+   def test_roll_many_shape_and_range(self):
+       hand = dice_hand_module.DiceHand(count=3)
+       buf = hand.roll_many(10)
+       self.assertEqual(len(buf), 30)
+       self.assertTrue(all(1 <= v <= 6 for v in buf))
+
+
+   def test_buffered_roll_matches_bulk_draw(self):
+       def seeded_hand(**kw):
+           hand = dice_hand_module.DiceHand(**kw)
+           rng = random.Random(9)
+           for d in hand._dice:
+               d.rng = rng
+           return hand
+       bulk = seeded_hand().roll_many(20)
+       expected = [tuple(bulk[i:i + 2]) for i in range(0, 40, 2)]
+       buffered = seeded_hand(buffer=8)
+       self.assertEqual([buffered.roll() for _ in range(20)], expected)
+
+
+   def test_separate_generators_fill_columns(self):
+       hand = dice_hand_module.DiceHand(count=2)
+       hand._dice[0].rng = random.Random(1)
+       hand._dice[1].rng = random.Random(2)
+       buf = hand.roll_many(5)
+       self.assertEqual(list(buf[0::2]), list(dice_hand_module.Die(rng=random.Random(1)).roll_many(5)))
+       self.assertEqual(list(buf[1::2]), list(dice_hand_module.Die(rng=random.Random(2)).roll_many(5)))
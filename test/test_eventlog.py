@@ -0,0 +1,90 @@
+import random
+import struct
+import tempfile
+import unittest
+from pathlib import Path
+from dice.computer import Computer, Intelligence
+from dice.dice_hand import DiceHand
+from dice.eventlog import (
+   HOLD, ROLL, START, EventLog, ReplayError, read_events, replay, scripted_rolls, verify_highscores,
+)
+from dice.game import Game
+from dice.highscore import HighScore
+from dice.player import Player
+from dice.simulate import play_game
+
+
+def bot_game(td, log, seed):
+   hs = HighScore(path=str(Path(td) / "hs.json"))
+   hand = DiceHand()
+   rng = random.Random(seed)
+   for die in hand._dice:
+       die.rng = rng
+   players = [Computer("bot-a", "A", Intelligence(20)), Computer("bot-é", "B", Intelligence(25))]
+   return Game(players, target=100, dice=hand, highs=hs, events=log)
+
+
+class TestEventLog(unittest.TestCase):
+   def test_players_round_trip_through_padding(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "events.bin")
+           with EventLog(path) as log:
+               log.game_start(50, ["abcde", "wxyz", ""])
+               log.emit(ROLL, 3, 4)
+           events = list(read_events(path, chunk=8))
+           self.assertEqual(events[0], (START, 0, 50, b""))
+           self.assertEqual([e[3] for e in events[1:4]], [b"abcde", b"wxyz", b""])
+           self.assertEqual(events[-1], (ROLL, 3, 4, b""))
+
+
+   def test_replay_matches_highscores(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "events.bin")
+           with EventLog(path) as log:
+               for seed in range(5):
+                   g = bot_game(td, log, seed)
+                   g.start()
+                   play_game(g)
+           res = replay(path)
+           self.assertEqual(res.games, 5)
+           self.assertEqual(res.totals["bot-a"]["games"], 5)
+           hs = HighScore(path=str(Path(td) / "hs.json"))
+           self.assertEqual(verify_highscores(res, hs), [])
+
+
+   def test_scripted_rolls_reproduce_game(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "events.bin")
+           with EventLog(path) as log:
+               for seed in range(3):
+                   g = bot_game(td, log, seed)
+                   g.start()
+                   play_game(g)
+                   if seed == 1:
+                       expected = [p.score for p in g.players]
+           g = bot_game(td, None, 99)
+           g.start()
+           g.set_cheat(scripted_rolls(path, 1))
+           play_game(g)
+           self.assertEqual([p.score for p in g.players], expected)
+
+
+   def test_tampered_log_is_rejected(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "events.bin")
+           with EventLog(path) as log:
+               g = Game([Player("p1", "P1"), Player("p2", "P2")], target=20,
+                        highs=HighScore(path=str(Path(td) / "hs.json")), events=log)
+               g.start()
+               g.set_cheat([(6, 6)])
+               g.roll()
+               g.hold()
+           with open(path, "ab") as fh:
+               fh.write(struct.pack("<BBH", HOLD, 1, 7))
+               fh.write(b"\x03")  # torn tail is ignored
+           with self.assertRaises(ReplayError):
+               replay(path)
+
+
+if __name__ == "__main__":
+   unittest.main()
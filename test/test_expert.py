@@ -0,0 +1,68 @@
+import itertools
+import unittest
+from dice.computer import Computer, Intelligence
+from dice.expert import RolloutIntelligence, turn_endings
+from dice.game import Game
+from dice.highscore import MemoryHighScore
+from dice.simulate import BUST, turn_outcomes
+
+
+class TestTurnEndings(unittest.TestCase):
+   def test_rolling_from_zero_matches_simulator(self):
+       policy = Intelligence(20)
+       ends = turn_endings(policy, 0, 10, 30, 100)
+       expected = turn_outcomes(policy, 10, 30, 100)
+       self.assertEqual(set(ends), set(expected))
+       for k, p in expected.items():
+           self.assertAlmostEqual(ends[k], p)
+
+
+   def test_endings_are_capped_at_the_win(self):
+       ends = turn_endings(Intelligence(20), 10, 90, 0, 100)
+       self.assertAlmostEqual(sum(ends.values()), 1.0)
+       self.assertEqual(max(k for k in ends if k != BUST), 10)
+       self.assertAlmostEqual(ends[BUST], 1 / 36)
+
+
+class TestRolloutIntelligence(unittest.TestCase):
+   def test_clear_decisions(self):
+       brain = RolloutIntelligence(seed=1, budget=0.05)
+       self.assertTrue(brain.should_hold(5, 95, 0, 100))   # holding wins
+       self.assertFalse(brain.should_hold(0, 0, 0, 100))   # nothing to bank
+       self.assertEqual(brain.rollouts, 0)
+       self.assertFalse(brain.should_hold(2, 0, 0, 100))
+       self.assertFalse(brain.should_hold(10, 0, 95, 100))  # opponent is about to win: race
+       self.assertGreater(brain.rollouts, 0)
+
+
+   def test_budget_bounds_each_decision(self):
+       ticks = itertools.count()
+       brain = RolloutIntelligence(seed=2, budget=10, clock=lambda: next(ticks))
+       for tt in (8, 12, 20, 24):
+           before = brain.rollouts
+           brain.should_hold(tt, 30, 40, 100)
+           self.assertLessEqual(brain.rollouts - before, 10)  # one play-out per tick at most
+
+
+   def test_rollouts_are_reused_within_a_turn(self):
+       brain = RolloutIntelligence(seed=3, budget=0.01)
+       brain.should_hold(8, 30, 40, 100)
+       seen = dict((a, list(v)) for a, v in brain._values.items())
+       self.assertIn(30 + 16, seen)  # a single 1 at 16 banks it: already rated
+       brain.should_hold(16, 30, 40, 100)
+       self.assertGreaterEqual(brain._values[46][1], seen[46][1])
+       brain.should_hold(8, 40, 40, 100)  # next turn: fresh statistics
+       self.assertNotIn(46, brain._values)
+
+
+   def test_expert_level(self):
+       g = Game.vs_computer(ai_level="expert", highs=MemoryHighScore())
+       bot = g.players[1]
+       self.assertIsInstance(bot, Computer)
+       self.assertIsInstance(bot.brain, RolloutIntelligence)
+       self.assertEqual(Game.vs_computer(ai_level="hard", highs=MemoryHighScore()).players[1].brain, Intelligence(25))
+       g.start()
+       g.set_cheat([(1, 2)])
+       g.roll()  # the human's turn ends on a single 1
+       self.assertIs(g.current_player(), bot)
+       self.assertFalse(g.decide_hold())
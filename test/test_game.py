@@ -1,9 +1,13 @@
+import os
 import unittest
 import tempfile
 from pathlib import Path
+from dice.computer import Computer, Intelligence
 from dice.game import Game
 from dice.player import Player
-from dice.highscore import HighScore
+from dice.highscore import HighScore, MemoryHighScore
+from dice.rules import Outcome
+from dice.simulate import play_game
 
 
 def make_game(tmpdir, target=100):
@@ -76,6 +80,31 @@ class TestGame(unittest.TestCase):
            self.assertIs(g.winner(), g.players[0])
 
 
+   def test_structured_results_match_messages(self):
+       g = Game.headless([Player("p1", "P1"), Player("p2", "P2")], target=20)
+       g.start()
+       g.set_cheat([(4, 5), (1, 3), (6, 6), (1, 1), (6, 5), (5, 5)])
+       r = g.roll_result()
+       self.assertEqual((r.d1, r.d2, r.outcome, r.gain, r.turn_total, r.seat), (4, 5, Outcome.CONTINUE, 9, 9, 0))
+       self.assertEqual(r.message, "\nRolled 4+5 → +9 this turn (total 9).")
+       r = g.roll_result()
+       self.assertEqual((r.outcome, r.turn_total, r.scores, r.hold.points, r.hold.auto), (Outcome.AUTO_HOLD, 9, (9, 0), 9, True))
+       self.assertEqual(r.message, "\nRolled 1+3 (single 1) → auto-hold 9.")
+       g.roll_result()
+       r = g.roll_result()
+       self.assertEqual((r.outcome, r.turn_total, r.seat, r.scores), (Outcome.BUST_ALL, 12, 1, (9, 0)))
+       g.roll_result()
+       g.roll_result()
+       h = g.hold_result()
+       self.assertEqual((h.points, h.scores, h.winner, h.won), (21, (30, 0), g.players[0], True))
+       self.assertEqual(h.message, "P1 holds 21. New score: 30.\n \nP1 wins!")
+       over = g.roll_result()
+       self.assertIsNone(over.outcome)
+       self.assertEqual(over.message, "Game over. P1 already won.")
+       self.assertTrue(g.hold_result().over)
+       self.assertEqual(g.hold(), "\nGame over. P1 already won.")
+
+
    def test_cheat_queue_in_order(self):
        with tempfile.TemporaryDirectory() as td:
            g = make_game(td)
@@ -83,3 +112,64 @@ class TestGame(unittest.TestCase):
            self.assertEqual(g._roll_dice(), (2, 3))
            self.assertEqual(g._roll_dice(), (4, 5))
            self.assertEqual(g._roll_dice(), (6, 6))
+
+
+   def test_snapshot_restore_roundtrip(self):
+       with tempfile.TemporaryDirectory() as td:
+           g = make_game(td, target=50)
+           g.set_cheat([(6, 6), (3, 4), (1, 2), (5, 5), (2, 2)])
+           g.roll()
+           g.roll()
+           blob = g.snapshot()
+           self.assertLessEqual(len(blob), 32)
+
+
+           h = make_game(td, target=100)
+           h.restore(blob)
+           self.assertEqual(h.target, 50)
+           self.assertEqual(h.turn_total, 19)
+           self.assertEqual(h.pending_rolls(), [(1, 2), (5, 5), (2, 2)])
+           for game in (g, h):
+               game.roll()  # single 1 -> auto-hold 19
+           self.assertEqual([p.score for p in h.players], [p.score for p in g.players])
+           self.assertIs(h.current_player(), h.players[1])
+           self.assertEqual(h.turns_taken, g.turns_taken)
+
+
+   def test_snapshot_keeps_winner(self):
+       with tempfile.TemporaryDirectory() as td:
+           g = make_game(td, target=10)
+           g.set_cheat([(6, 6)])
+           g.roll()
+           g.hold()
+           h = make_game(td)
+           h.restore(g.snapshot())
+           self.assertIs(h.winner(), h.players[0])
+           self.assertEqual(h.players[0].score, 12)
+
+
+   def test_restore_rejects_bad_data(self):
+       with tempfile.TemporaryDirectory() as td:
+           g = make_game(td)
+           with self.assertRaises(ValueError):
+               g.restore(b"\x01\x02")
+           with self.assertRaises(ValueError):
+               g.restore(b"\x09" + g.snapshot()[1:])
+
+
+   def test_headless_games_never_touch_disk(self):
+       with tempfile.TemporaryDirectory() as td:
+           old = os.getcwd()
+           os.chdir(td)
+           try:
+               mem = MemoryHighScore()
+               for _ in range(3):
+                   bots = [Computer("a", "A", Intelligence(20)), Computer("b", "B", Intelligence(25))]
+                   g = Game.headless(bots, target=50, highs=mem)
+                   g.start()
+                   play_game(g)
+               self.assertEqual(os.listdir(td), [])
+           finally:
+               os.chdir(old)
+           self.assertEqual(mem.stats_for("a")["games"], 3)
+           self.assertIsInstance(Game.headless([Player("p1", "P1"), Player("p2", "P2")]).highs, MemoryHighScore)
@@ -1,7 +1,19 @@
+import multiprocessing
+import subprocess
+import sys
 import unittest
 import tempfile
 from pathlib import Path
-from dice.highscore import HighScore
+from dice.highscore import HighScore, MemoryHighScore, NullHighScore, merge_shards
+
+
+def _play(path, worker, games, shard):
+    hs = HighScore(path=path, compact_every=25, shard=shard)
+    for i in range(games):
+        hs.record_game(f"w{worker}", f"W{worker}", i % 2 == 0, turns=1, total_points=1)
+        hs.record_game("shared", "Shared", False, turns=1, total_points=1)
+    hs.close()
+
 
 class TestHighScore(unittest.TestCase):
     def test_persist_and_rename(self):
@@ -24,3 +36,288 @@ class TestHighScore(unittest.TestCase):
             self.assertEqual(len(top), 1)
             self.assertEqual(top[0]["name"], "Mikaela")
             self.assertEqual(top[0]["wins"], 1)
+
+    def test_store_is_read_on_first_use(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p))
+            self.assertFalse(p.exists())
+            p.write_text('{"pid1": {"name": "Late", "games": 2, "wins": 1, "turns": 9, "points": 80}}')
+            self.assertEqual(hs.stats_for("pid1")["name"], "Late")
+            hs.close()
+
+
+class TestHighScoreJournal(unittest.TestCase):
+    def test_records_survive_without_close(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p))
+            hs.record_game("a", "A", True, turns=3, total_points=50)
+            self.assertEqual(p.read_text(encoding="utf-8"), "{}")  # snapshot untouched
+            self.assertEqual(HighScore(path=str(p)).stats_for("a")["points"], 50)
+
+    def test_close_compacts_journal_into_snapshot(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            with HighScore(path=str(p)) as hs:
+                hs.record_game("a", "A", True, turns=3, total_points=50)
+                hs.record_game("a", "A", False, turns=4, total_points=20)
+            self.assertFalse(hs.journal_path.exists())
+            stats = HighScore(path=str(p)).stats_for("a")
+            self.assertEqual((stats["games"], stats["wins"], stats["points"]), (2, 1, 70))
+
+    def test_flush_every_batches_writes(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p), flush_every=3)
+            hs.record_game("a", "A", True, turns=1, total_points=10)
+            hs.record_game("b", "B", False, turns=1, total_points=5)
+            self.assertFalse(hs.journal_path.exists())
+            hs.record_game("a", "A", True, turns=1, total_points=10)
+            self.assertEqual(HighScore(path=str(p)).stats_for("a")["wins"], 2)
+
+    def test_waiting_batch_is_flushed_at_exit(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            script = (
+                "from dice.highscore import HighScore\n"
+                f"hs = HighScore(path={p!r}, flush_every=10, flush_interval=3600)\n"
+                "hs.record_game('a', 'A', True, turns=1, total_points=10)\n"
+            )
+            subprocess.run([sys.executable, "-c", script], check=True)
+            self.assertEqual(HighScore(path=p).stats_for("a")["games"], 1)
+
+    def test_compact_every_folds_automatically(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p), compact_every=2)
+            hs.record_game("a", "A", True, turns=1, total_points=10)
+            hs.record_game("a", "A", True, turns=1, total_points=10)
+            self.assertFalse(hs.journal_path.exists())
+            self.assertEqual(HighScore(path=str(p)).stats_for("a")["games"], 2)
+
+    def test_torn_tail_is_ignored_and_trimmed(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p))
+            hs.record_game("a", "A", True, turns=1, total_points=10)
+            with hs.journal_path.open("a", encoding="utf-8") as fh:
+                fh.write('{"op": "game", "pid": "a"')  # crash mid-append
+            hs2 = HighScore(path=str(p))
+            self.assertEqual(hs2.stats_for("a")["games"], 1)
+            hs2.record_game("a", "A", False, turns=1, total_points=1)
+            self.assertEqual(HighScore(path=str(p)).stats_for("a")["games"], 2)
+
+    def test_crash_after_snapshot_does_not_double_count(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p))
+            hs.record_game("a", "A", True, turns=1, total_points=10)
+            journal = hs.journal_path.read_bytes()
+            hs.compact()
+            hs.journal_path.write_bytes(journal)  # as if unlink never happened
+            hs2 = HighScore(path=str(p))
+            self.assertEqual(hs2.stats_for("a")["games"], 1)
+            hs2.record_game("a", "A", True, turns=1, total_points=10)
+            self.assertEqual(HighScore(path=str(p)).stats_for("a")["games"], 2)
+
+    def test_ensure_skips_unchanged_names(self):
+        with tempfile.TemporaryDirectory() as td:
+            hs = HighScore(path=str(Path(td) / "hs.json"))
+            hs.ensure("a", "A")
+            size = hs.journal_path.stat().st_size
+            hs.ensure("a", "A")
+            self.assertEqual(hs.journal_path.stat().st_size, size)
+
+
+class TestHighScoreRanking(unittest.TestCase):
+    def test_top_and_rank_follow_updates(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p))
+            hs.ensure("z", "Zero")
+            hs.record_game("a", "A", True, 3, 30)
+            hs.record_game("b", "B", True, 3, 40)
+            hs.record_game("a", "A", False, 3, 10)
+            self.assertEqual([r["pid"] for r in hs.top(10)], ["b", "a", "z"])
+            self.assertEqual(hs.rank_of("a"), 2)
+            self.assertIsNone(hs.rank_of("nobody"))
+
+            hs.record_game("a", "A", True, 3, 50)
+            self.assertEqual(hs.rank_of("a"), 1)
+            self.assertEqual(hs.rank_of("b"), 2)
+            hs.rename("a", "Ace")
+            self.assertEqual(hs.top(1)[0]["name"], "Ace")
+            self.assertEqual(hs.top(0), [])
+
+            hs.close()
+            hs2 = HighScore(path=str(p))
+            self.assertEqual(hs2.top(10), hs.top(10))
+            self.assertEqual(hs2.rank_of("z"), 3)
+
+    def test_ties_keep_insertion_order(self):
+        with tempfile.TemporaryDirectory() as td:
+            hs = HighScore(path=str(Path(td) / "hs.json"))
+            for pid in ("c", "a", "b"):
+                hs.record_game(pid, pid, True, 1, 10)
+            self.assertEqual([r["pid"] for r in hs.top()], ["c", "a", "b"])
+            self.assertEqual([hs.rank_of(p) for p in ("c", "a", "b")], [1, 2, 3])
+
+
+class TestInMemoryStores(unittest.TestCase):
+    def test_memory_store_flushes_totals_in_one_batch(self):
+        mem = MemoryHighScore()
+        for won in (True, False, True):
+            mem.record_game("a", "A", won, 4, 30)
+        mem.record_game("b", "B", True, 2, 100)
+        self.assertEqual(mem.stats_for("a"), {"name": "A", "games": 3, "wins": 2, "turns": 12, "points": 90})
+        self.assertEqual([r["pid"] for r in mem.top()], ["a", "b"])
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p), flush_every=10**6)
+            hs.record_game("a", "A", False, 1, 5)
+            mem.flush_to(hs)
+            self.assertEqual(mem.top(), [])
+            self.assertEqual(hs.stats_for("a")["games"], 4)
+            self.assertEqual(hs.rank_of("a"), 1)
+            reread = HighScore(path=str(p))
+            self.assertEqual(reread.stats_for("a"), hs.stats_for("a"))
+            self.assertEqual(reread.top(), hs.top())
+            self.assertEqual(sorted(f.name for f in Path(td).iterdir()), ["hs.json", "hs.json.journal", "hs.json.lock"])
+
+    def test_null_store_discards(self):
+        null = NullHighScore()
+        null.record_game("a", "A", True, 1, 10)
+        self.assertEqual(null.stats_for("a"), {})
+        self.assertEqual(null.top(), [])
+
+    def test_record_games_aggregates_into_one_write(self):
+        results = [
+            {"pid": "a", "name": "A", "won": True, "turns": 5, "points": 100},
+            {"pid": "b", "name": "B", "won": False, "turns": 5, "points": 40},
+            {"pid": "a", "name": "Ace", "won": False, "turns": 7, "points": -3},
+        ]
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            hs = HighScore(path=str(p))
+            self.assertEqual(hs.record_games(iter(results)), 3)
+            self.assertEqual(hs.stats_for("a"), {"name": "Ace", "games": 2, "wins": 1, "turns": 12, "points": 100})
+            lines = hs.journal_path.read_text().splitlines()
+            self.assertEqual(len(lines), 3)  # header plus one entry per player
+            self.assertEqual(HighScore(path=str(p)).top(), hs.top())
+
+
+class TestConcurrentWriters(unittest.TestCase):
+    def _run(self, shard):
+        if "fork" not in multiprocessing.get_all_start_methods():
+            self.skipTest("needs fork")
+        ctx = multiprocessing.get_context("fork")
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            procs = [ctx.Process(target=_play, args=(p, w, 200, shard)) for w in range(4)]
+            for proc in procs:
+                proc.start()
+            for proc in procs:
+                proc.join()
+                self.assertEqual(proc.exitcode, 0)
+            merge_shards(p)
+            hs = HighScore(path=p)
+            self.assertEqual(hs.stats_for("shared")["games"], 800)
+            for w in range(4):
+                self.assertEqual((hs.stats_for(f"w{w}")["games"], hs.stats_for(f"w{w}")["wins"]), (200, 100))
+            self.assertEqual(sorted(f.name for f in Path(td).iterdir()), ["hs.json", "hs.json.lock"])
+
+    def test_processes_sharing_the_journal_lose_nothing(self):
+        self._run(shard=False)
+
+    def test_shards_are_merged_and_removed(self):
+        self._run(shard=True)
+
+    def test_stale_view_does_not_overwrite_other_writers(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            a, b = HighScore(path=p), HighScore(path=p)
+            a.load()
+            b.record_game("b", "B", True, 1, 10)
+            b.compact()
+            a.record_game("a", "A", True, 1, 10)
+            a.compact()  # a never saw b's game but must keep it
+            self.assertEqual(a.stats_for("b")["games"], 1)
+            self.assertEqual(HighScore(path=p).stats_for("b")["games"], 1)
+
+    def test_open_shard_is_visible_before_merge(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            writer = HighScore(path=p, shard=True)
+            writer.record_game("a", "A", True, 1, 10)
+            self.assertEqual(HighScore(path=p).stats_for("a")["games"], 1)
+            merge_shards(p)
+            writer.record_game("a", "A", True, 1, 10)  # still open: kept, read from its offset
+            self.assertEqual(len(list(Path(td).glob("hs.json.shard.*"))), 1)
+            writer.close()
+            merge_shards(p)
+            self.assertEqual(HighScore(path=p).stats_for("a")["games"], 2)
+            self.assertEqual(list(Path(td).glob("hs.json.shard.*")), [])
+
+    def test_own_shard_is_not_counted_twice(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            hs = HighScore(path=p, shard=True)
+            hs.record_game("a", "A", True, 1, 10)
+            hs.refresh()
+            self.assertEqual(hs.stats_for("a")["games"], 1)
+            hs.record_game("a", "A", True, 1, 10)
+            hs.compact()
+            hs.refresh()
+            self.assertEqual(hs.stats_for("a")["games"], 2)
+            hs.close()
+            merge_shards(p)
+            self.assertEqual(HighScore(path=p).stats_for("a"), {"name": "A", "games": 2, "wins": 2, "turns": 2, "points": 20})
+            self.assertEqual(list(Path(td).glob("hs.json.shard.*")), [])
+
+    def test_shard_compactions_with_pending_entries_keep_each_other(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            a = HighScore(path=p, shard=True, flush_every=10)
+            b = HighScore(path=p, shard=True, flush_every=10)
+            c = HighScore(path=p)  # a journal writer folds its games straight into the snapshot
+            a.load()
+            a.record_game("a", "A", True, 1, 10)
+            c.record_game("c", "C", True, 1, 10)
+            c.close()
+            b.record_game("b", "B", True, 1, 10)
+            b.compact()
+            a.record_game("a", "A", False, 1, 5)
+            a.compact()  # a has pending entries and never saw b's or c's games
+            self.assertEqual(a.stats_for("b")["games"], 1)
+            self.assertEqual(a.stats_for("c")["games"], 1)
+            self.assertEqual(HighScore(path=p).stats_for("c")["games"], 1)
+            b.record_game("b", "B", False, 1, 5)
+            b.compact()
+            self.assertEqual(b.stats_for("a")["games"], 2)
+            a.close()
+            b.close()
+            merge_shards(p)
+            final = HighScore(path=p)
+            self.assertEqual([final.stats_for(pid)["games"] for pid in "abc"], [2, 2, 1])
+            self.assertEqual(list(Path(td).glob("hs.json.shard.*")), [])
+
+    def test_corrupt_snapshot_is_kept_aside(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = Path(td) / "hs.json"
+            p.write_text('{"a": {"name": "A", "ga', encoding="utf-8")
+            hs = HighScore(path=str(p))
+            self.assertEqual(hs.top(), [])
+            backups = list(Path(td).glob("hs.json.corrupt-*"))
+            self.assertEqual(len(backups), 1)
+            self.assertEqual(backups[0].read_text(encoding="utf-8"), '{"a": {"name": "A", "ga')
+
+    def test_append_after_interrupted_compaction(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.json")
+            hs = HighScore(path=p)
+            hs.record_game("a", "A", True, 1, 10)
+            with hs.journal_path.open("ab") as fh:
+                fh.write(b'{"sealed":true}\n')  # died before the snapshot was written
+            hs.record_game("a", "A", True, 1, 10)
+            self.assertEqual(HighScore(path=p).stats_for("a")["games"], 2)
@@ -0,0 +1,94 @@
+import unittest
+import tempfile
+from pathlib import Path
+from dice.highscore import HighScore, MemoryHighScore
+from dice.highscore_sqlite import SQLiteHighScore
+
+
+class TestSQLiteHighScore(unittest.TestCase):
+    def test_persist_and_rename(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.db")
+            with SQLiteHighScore(path=p) as hs:
+                hs.ensure("pid1", "Mikael")
+                hs.record_game("pid1", "Mikael", True, turns=5, total_points=100)
+                hs.rename("pid1", "Mikaela")
+
+            with SQLiteHighScore(path=p) as hs2:
+                stats = hs2.stats_for("pid1")
+                self.assertEqual(stats, {"name": "Mikaela", "games": 1, "wins": 1, "turns": 5, "points": 100})
+                top = hs2.top(10)
+                self.assertEqual(len(top), 1)
+                self.assertEqual(top[0]["name"], "Mikaela")
+                self.assertEqual(top[0]["win_rate"], 1.0)
+                self.assertEqual(hs2.stats_for("nobody"), {})
+
+    def test_top_matches_json_store_order(self):
+        with tempfile.TemporaryDirectory() as td:
+            js = HighScore(path=str(Path(td) / "hs.json"))
+            db = SQLiteHighScore(path=str(Path(td) / "hs.db"), batch_size=50)
+            games = [("a", True, 30), ("b", True, 40), ("a", False, 10), ("c", True, 40),
+                     ("b", False, 5), ("d", False, 0), ("c", True, 60), ("e", True, 40)]
+            for pid, won, pts in games:
+                js.record_game(pid, pid.upper(), won, 3, pts)
+                db.record_game(pid, pid.upper(), won, 3, pts)
+            self.assertEqual(db.top(3), js.top(3))
+            self.assertEqual(db.top(10), js.top(10))
+            for pid in "abcde":
+                self.assertEqual(db.rank_of(pid), js.rank_of(pid))
+            self.assertIsNone(db.rank_of("nobody"))
+            db.close()
+
+    def test_batched_writes_commit_on_flush(self):
+        with tempfile.TemporaryDirectory() as td:
+            p = str(Path(td) / "hs.db")
+            hs = SQLiteHighScore(path=p, batch_size=100)
+            hs.record_game("a", "A", True, 1, 10)
+            with SQLiteHighScore(path=p) as other:
+                self.assertEqual(other.stats_for("a"), {})
+            hs.flush()
+            with SQLiteHighScore(path=p) as other:
+                self.assertEqual(other.stats_for("a")["wins"], 1)
+            hs.close()
+
+    def test_migrate_json_once(self):
+        with tempfile.TemporaryDirectory() as td:
+            jp = str(Path(td) / "hs.json")
+            js = HighScore(path=jp)
+            js.record_game("a", "A", True, 4, 100)
+            js.record_game("b", "B", False, 4, 60)
+            with SQLiteHighScore(path=str(Path(td) / "hs.db")) as db:
+                self.assertEqual(db.migrate_json(jp), 2)
+                self.assertEqual(db.migrate_json(jp), 0)
+                self.assertEqual(db.stats_for("a"), js.stats_for("a"))
+                self.assertEqual(db.top(), js.top())
+
+    def test_migrate_json_keeps_rows_and_leaves_the_source_alone(self):
+        with tempfile.TemporaryDirectory() as td:
+            jp = str(Path(td) / "hs.json")
+            js = HighScore(path=jp, compact_every=10)
+            js.record_game("a", "A", True, 4, 100)
+            js.record_game("b", "B", False, 4, 60)
+            with open(jp + ".journal", "ab") as fh:
+                fh.write(b'{"pid": "c", "na')  # a writer mid-append
+            files = {p.name: p.read_bytes() for p in Path(td).glob("hs.json*")}
+            with SQLiteHighScore(path=str(Path(td) / "hs.db")) as db:
+                db.record_game("a", "A", False, 2, 10)
+                self.assertEqual(db.migrate_json(jp), 1)
+                self.assertEqual(db.stats_for("a"), {"name": "A", "games": 1, "wins": 0, "turns": 2, "points": 10})
+                self.assertEqual(db.stats_for("b"), js.stats_for("b"))
+                self.assertEqual(db.stats_for("c"), {})
+            self.assertEqual({p.name: p.read_bytes() for p in Path(td).glob("hs.json*")}, files)
+
+    def test_apply_totals_adds_to_existing_rows(self):
+        mem = MemoryHighScore()
+        mem.record_game("a", "A", True, 4, 100)
+        mem.record_game("a", "A", False, 3, 20)
+        mem.record_game("b", "B", False, 5, 0)
+        with tempfile.TemporaryDirectory() as td:
+            with SQLiteHighScore(path=str(Path(td) / "hs.db")) as db:
+                db.record_game("a", "A", True, 1, 50)
+                mem.flush_to(db)
+                self.assertEqual(db.stats_for("a"), {"name": "A", "games": 3, "wins": 2, "turns": 8, "points": 170})
+                self.assertEqual(db.top(1)[0]["win_rate"], 2 / 3)
+                self.assertEqual(db.stats_for("b")["games"], 1)
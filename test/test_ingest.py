@@ -0,0 +1,49 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from dice.highscore import HighScore, MemoryHighScore
+from dice.highscore_sqlite import SQLiteHighScore
+from dice.ingest import import_jsonl, read_batches
+
+
+def results_file(n):
+   lines = [
+       json.dumps({"pid": f"p{i % 7}", "name": f"P{i % 7}", "won": i % 3 == 0, "turns": i % 11, "points": i % 50})
+       for i in range(n)
+   ]
+   return io.StringIO("\n".join(lines[: n // 2]) + "\n\n" + "\n".join(lines[n // 2:]) + "\n")
+
+
+class TestIngest(unittest.TestCase):
+   def test_import_matches_record_game(self):
+       direct = MemoryHighScore()
+       for line in results_file(500).getvalue().splitlines():
+           if line:
+               r = json.loads(line)
+               direct.record_game(r["pid"], r["name"], r["won"], r["turns"], r["points"])
+       with tempfile.TemporaryDirectory() as td:
+           hs = HighScore(path=str(Path(td) / "hs.json"))
+           self.assertEqual(import_jsonl(hs, results_file(500)), 500)
+           self.assertEqual(hs.top(), direct.top())
+           with SQLiteHighScore(path=str(Path(td) / "hs.db")) as db:
+               import_jsonl(db, results_file(500), max_players=3)
+               self.assertEqual(db.top(), direct.top())
+
+
+   def test_batches_are_bounded_and_bad_lines_are_located(self):
+       batches = list(read_batches(results_file(1000), block_bytes=4096))
+       self.assertGreater(len(batches), 1)
+       self.assertEqual(sum(len(b) for b in batches), 1000)
+       bad = io.StringIO('{"pid": "a", "name": "A", "won": true, "turns": 1, "points": 2}\n{"pid": oops}\n')
+       with self.assertRaisesRegex(ValueError, "line 2"):
+           list(read_batches(bad))
+       row = '{"pid": "a", "name": "A", "won": true, "turns": 1, "points": 2}'
+       for line in (f"{row},{row}", f"[{row}]", "7"):
+           with self.assertRaisesRegex(ValueError, "line 3"):
+               list(read_batches(io.StringIO(f"{row}\n\n{line}\n{row}\n")))
+
+
+if __name__ == "__main__":
+   unittest.main()
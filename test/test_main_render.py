@@ -1,10 +1,14 @@
+import contextlib
+import io
+import json
+import os
 import unittest
 import tempfile
 from pathlib import Path
 from dice.game import Game
 from dice.player import Player
 from dice.highscore import HighScore
-from dice.main import render
+from dice.main import PigDiceGame, render, run_batch
 
 
 class TestRender(unittest.TestCase):
@@ -17,3 +21,51 @@ class TestRender(unittest.TestCase):
            self.assertIn("Turn: Mikael", text)
            self.assertIn("Scores → Mikael: 0 | Bot: 0", text)
            self.assertIn("Turn total:", text)
+
+
+   def test_shell_shares_one_lazily_loaded_store(self):
+       with tempfile.TemporaryDirectory() as td:
+           hs = HighScore(path=str(Path(td) / "hs.json"))
+           shell = PigDiceGame(highs=hs, stdout=io.StringIO())
+           self.assertIs(shell.game.highs, hs)
+           self.assertFalse(os.path.exists(hs.path))
+           shell.onecmd("start")
+           shell.onecmd("quit")
+           self.assertIs(shell.game.highs, hs)
+
+
+class TestBatch(unittest.TestCase):
+   def test_batch_writes_one_json_line_per_game(self):
+       script = ["# soak", "start 30 ai=easy", "roll", "roll", "hold"]
+       out, echo = io.StringIO(), io.StringIO()
+       played = run_batch(script, games=5, out=out, echo=echo, seed=3)
+       results = [json.loads(line) for line in out.getvalue().splitlines()]
+       self.assertEqual(played, 5)
+       self.assertEqual([r["game"] for r in results], list(range(5)))
+       for r in results:
+           self.assertIn(r["winner_seat"], (0, 1))
+           self.assertGreaterEqual(max(r["scores"]), 30)
+       self.assertIn("(pig) roll", echo.getvalue())
+       self.assertNotIn("Turn total:", echo.getvalue())
+       again = io.StringIO()
+       run_batch(script, games=5, out=again, seed=3)
+       strip = lambda text: [{k: v for k, v in json.loads(l).items() if k != "seconds"} for l in text.splitlines()]
+       self.assertEqual(strip(again.getvalue()), strip(out.getvalue()))
+
+
+   def test_batch_stops_at_quit_and_caps_commands(self):
+       out = io.StringIO()
+       self.assertEqual(run_batch(["cheat 2 2", "quit"], games=3, out=out), 1)
+       out = io.StringIO()
+       run_batch(["show"], games=1, out=out, max_commands=4)
+       self.assertIn('"winner": null', out.getvalue())
+       self.assertIn('"commands": 4', out.getvalue())
+       with self.assertRaises(ValueError):
+           run_batch(["start"], out=io.StringIO())
+
+
+   def test_batch_writes_to_the_current_stdout(self):
+       captured = io.StringIO()
+       with contextlib.redirect_stdout(captured):
+           run_batch(["cheat 2 2", "quit"])
+       self.assertEqual(json.loads(captured.getvalue())["game"], 0)
@@ -0,0 +1,64 @@
+import unittest
+import tempfile
+from pathlib import Path
+from dice.game import Game
+from dice.player import Player
+from dice.highscore import HighScore
+from dice.metrics import Histogram, Metrics
+
+
+class TestMetrics(unittest.TestCase):
+   def test_histogram_quantiles(self):
+       h = Histogram()
+       for _ in range(99):
+           h.observe(3e-6)
+       h.observe(0.5)
+       self.assertEqual(h.count, 100)
+       self.assertEqual(h.quantile(0.5), 4e-6)
+       self.assertGreaterEqual(h.quantile(1.0), 0.5)
+
+
+   def test_snapshot_and_prometheus(self):
+       m = Metrics()
+       m.inc("game.rolls", 3)
+       m.observe("game.roll", 1e-5)
+       snap = m.snapshot()
+       self.assertEqual(snap["counters"], {"game.rolls": 3})
+       self.assertEqual(snap["latency"]["game.roll"]["count"], 1)
+       text = m.to_prometheus()
+       self.assertIn("pig_game_rolls_total 3", text)
+       self.assertIn('pig_game_roll_seconds_bucket{le="+Inf"} 1', text)
+       self.assertIn("pig_game_roll_seconds_count 1", text)
+
+
+   def test_game_counts_outcomes(self):
+       with tempfile.TemporaryDirectory() as td:
+           m = Metrics()
+           hs = HighScore(path=str(Path(td) / "hs.json"), metrics=m)
+           g = Game([Player("p1", "P1"), Player("p2", "P2")], target=10, highs=hs, metrics=m)
+           g.start()
+           g.set_cheat([(4, 5), (1, 3), (1, 1), (6, 6)])
+           g.roll()   # +9
+           g.roll()   # auto-hold 9
+           g.roll()   # P2 busts
+           g.roll()   # P1 +12
+           g.hold()   # P1 wins with 21
+           c = m.snapshot()["counters"]
+           self.assertEqual(c["game.rolls"], 4)
+           self.assertEqual(c["game.auto_holds"], 1)
+           self.assertEqual(c["game.busts"], 1)
+           self.assertEqual(c["game.holds"], 1)
+           self.assertEqual(c["game.wins"], 1)
+           self.assertEqual(c["highscore.journal_entries"], 2)
+           self.assertIn("game.hold", m.histograms)
+           hs.close()
+           self.assertEqual(m.histograms["highscore.save"].count, 1)
+
+
+   def test_disabled_by_default(self):
+       with tempfile.TemporaryDirectory() as td:
+           g = Game([Player("p1", "P1"), Player("p2", "P2")], highs=HighScore(path=str(Path(td) / "hs.json")))
+           g.start()
+           g.set_cheat([(2, 2)])
+           self.assertEqual(g.roll()[:2], (2, 2))
+           self.assertIsNone(g.metrics)
@@ -0,0 +1,62 @@
+import io
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from dice.computer import Intelligence
+from dice.highscore import HighScore, MemoryHighScore
+from dice.main import PigDiceGame
+from dice.odds import OddsTable, odds_table
+from dice.simulate import simulate_batch
+
+
+class TestOdds(unittest.TestCase):
+   def test_matches_simulation(self):
+       odds = OddsTable((Intelligence(8), Intelligence(12)), target=30)
+       res = simulate_batch([Intelligence(8), Intelligence(12)], 40_000, target=30, rng=random.Random(5))
+       self.assertAlmostEqual(odds.probability(0, 0), res.win_rate(0), delta=0.01)
+
+
+   def test_columns_agree_with_turn_starts(self):
+       odds = OddsTable((Intelligence(8), Intelligence(12)), target=30)
+       for seat, i, j in [(0, 0, 0), (1, 12, 25), (0, 29, 3)]:
+           self.assertAlmostEqual(odds._column(seat, i, j)[0], odds.probability(i, j, seat=seat))
+       self.assertEqual(odds.probability(20, 5, turn_total=10), 1.0)
+       self.assertEqual(odds.probability(5, 30), 0.0)
+
+
+   def test_symmetric_policies_favour_the_starter(self):
+       odds = OddsTable((Intelligence(10), Intelligence(10)), target=30)
+       self.assertGreater(odds.probability(0, 0), 0.5)
+       self.assertAlmostEqual(odds.probability(7, 19, seat=0), odds.probability(7, 19, seat=1))
+
+
+   def test_tables_are_cached_per_pair(self):
+       a = odds_table(Intelligence(9), Intelligence(11), target=25)
+       self.assertIs(a, odds_table(Intelligence(9), Intelligence(11), target=25))
+       self.assertIsNot(a, odds_table(Intelligence(11), Intelligence(9), target=25))
+
+
+   def test_odds_command(self):
+       with tempfile.TemporaryDirectory() as td:
+           out = io.StringIO()
+           shell = PigDiceGame(highs=HighScore(path=str(Path(td) / "hs.json")), stdout=out)
+           shell.onecmd("start 30")
+           shell.onecmd("odds 10")
+           self.assertRegex(out.getvalue(), r"wins \d+\.\d% of the time holding at 10")
+           shell.onecmd("odds ten")
+           self.assertIn("Usage: odds", out.getvalue())
+
+
+
+   def test_odds_command_against_expert_uses_its_threshold(self):
+       out = io.StringIO()
+       shell = PigDiceGame(highs=MemoryHighScore(), stdout=out)
+       shell.onecmd("start 30 ai=expert")
+       shell.onecmd("odds 10")  # tabulating the rollout brain itself would take minutes
+       self.assertIn("approximating Computer as holding at 20", out.getvalue())
+       self.assertRegex(out.getvalue(), r"wins \d+\.\d% of the time holding at 10")
+
+
+if __name__ == "__main__":
+   unittest.main()
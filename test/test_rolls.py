@@ -0,0 +1,95 @@
+import io
+import tempfile
+import unittest
+from pathlib import Path
+from dice.game import Game
+from dice.highscore import MemoryHighScore
+from dice.main import PigDiceGame
+from dice.player import Player
+from dice.rolls import IteratorSource, QueueSource, RollFile, write_roll_file
+
+
+def make_game():
+   g = Game.headless([Player("p1", "P1"), Player("p2", "P2")], target=1000)
+   g.start()
+   return g
+
+
+class TestRollSources(unittest.TestCase):
+   def test_queue_source_then_real_dice(self):
+       g = make_game()
+       g.set_roll_source(QueueSource([(2, 3), (4, 4)]))
+       self.assertEqual(g.pending_rolls(), [(2, 3), (4, 4)])
+       self.assertEqual(g.roll()[:2], (2, 3))
+       self.assertEqual(g.pending_rolls(), [(4, 4)])
+       g.roll()
+       d1, d2, _ = g.roll()
+       self.assertTrue(1 <= d1 <= 6 and 1 <= d2 <= 6)
+
+
+   def test_iterator_source_is_lazy(self):
+       pulled = []
+
+
+       def gen():
+           for i in range(10**9):
+               pulled.append(i)
+               yield (3, 4)
+
+
+       g = make_game()
+       g.set_roll_source(IteratorSource(gen()))
+       for _ in range(5):
+           g.roll()
+       self.assertEqual(len(pulled), 5)
+       self.assertEqual(g.turn_total, 35)
+       self.assertEqual(g.pending_rolls(), [])
+
+
+   def test_roll_file_round_trip(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "rolls.bin")
+           rolls = [(i % 6 + 1, (i * 5) % 6 + 1) for i in range(1000)]
+           self.assertEqual(write_roll_file(path, iter(rolls), chunk=64), 1000)
+           src = RollFile(path)
+           self.assertEqual(len(src), 1000)
+           self.assertEqual([src.next_roll() for _ in range(1000)], rolls)
+           self.assertIsNone(src.next_roll())
+           src.close()
+           Path(path).write_bytes(b"nope")
+           with self.assertRaises(ValueError):
+               RollFile(path)
+
+
+   def test_replaced_roll_file_is_closed(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "rolls.bin")
+           write_roll_file(path, [(6, 6)] * 10)
+           g = make_game()
+           first, second = RollFile(path), RollFile(path)
+           g.set_roll_source(first)
+           g.set_roll_source(first)  # setting it again keeps it open
+           self.assertEqual(g.roll()[:2], (6, 6))
+           g.set_cheat([(2, 2)])
+           self.assertTrue(first._mm.closed)
+           g.set_roll_source(second)
+           g.start()
+           self.assertTrue(second._mm.closed)
+           self.assertEqual(g.pending_rolls(), [])
+
+
+   def test_cheat_command_loads_roll_file(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "rolls.bin")
+           write_roll_file(path, [(6, 6), (5, 5)])
+           out = io.StringIO()
+           shell = PigDiceGame(highs=MemoryHighScore(), stdout=out)
+           shell.onecmd(f"cheat file {path}")
+           self.assertIn("Streaming 2 scripted rolls", out.getvalue())
+           shell.onecmd("roll")
+           shell.onecmd("roll")
+           self.assertEqual(shell.game.turn_total, 22)
+
+
+if __name__ == "__main__":
+   unittest.main()
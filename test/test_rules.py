@@ -1,5 +1,6 @@
 import unittest
-from dice.rules import Outcome, evaluate_roll, turn_points_gain
+from array import array
+from dice.rules import Outcome, evaluate, evaluate_many, evaluate_roll, outcome_table, turn_points_gain
 
 class TestRules(unittest.TestCase):
     def test_double_ones_is_bust_all(self):
@@ -17,4 +18,27 @@ class TestRules(unittest.TestCase):
         for d1 in range(2, 7):
             for d2 in range(2, 7):
                 self.assertEqual(evaluate_roll(d1, d2), Outcome.CONTINUE)
-                self.assertEqual(turn_points_gain(d1, d2), d1 + d2)
\ No newline at end of file
+                self.assertEqual(turn_points_gain(d1, d2), d1 + d2)
+
+class TestRuleTables(unittest.TestCase):
+    def test_table_agrees_with_scalar_rules(self):
+        for sides in (4, 6, 8):
+            for d1 in range(1, sides + 1):
+                for d2 in range(1, sides + 1):
+                    self.assertEqual(evaluate(d1, d2, sides), (evaluate_roll(d1, d2), turn_points_gain(d1, d2)))
+            self.assertEqual(len(outcome_table(sides)), sides * sides)
+
+    def test_out_of_range_values_fall_back(self):
+        self.assertEqual(evaluate(7, 9), (Outcome.CONTINUE, 16))
+        self.assertEqual(evaluate(1, 9), (Outcome.AUTO_HOLD, 0))
+
+    def test_evaluate_many_on_flat_buffer(self):
+        outcomes, gains = evaluate_many(array("B", [1, 1, 1, 4, 3, 5, 6, 6]))
+        self.assertEqual(outcomes, [Outcome.BUST_ALL, Outcome.AUTO_HOLD, Outcome.CONTINUE, Outcome.CONTINUE])
+        self.assertEqual(list(gains), [0, 0, 8, 12])
+
+    def test_evaluate_many_out_of_range_values_fall_back(self):
+        outcomes, gains = evaluate_many([2, 7, 1, 9, 0, 3], sides=6)
+        self.assertEqual(outcomes, [Outcome.CONTINUE, Outcome.AUTO_HOLD, Outcome.CONTINUE])
+        self.assertEqual(list(gains), [9, 0, 3])
+        self.assertEqual(evaluate_many([5, 5], sides=4), ([Outcome.CONTINUE], array("H", [10])))
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from dice.computer import Computer, Intelligence
+from dice.dice import Die
+from dice.dice_hand import DiceHand
+from dice.game import Game
+from dice.highscore import HighScore
+from dice.seeding import SeedSequence
+from dice.simulate import play_game, simulate_batch
+
+
+class TestSeeding(unittest.TestCase):
+   def test_children_are_stable_and_distinct(self):
+       root = SeedSequence(42)
+       a, b = root.spawn(2)
+       self.assertEqual(a, root.child(0))
+       self.assertEqual(root.spawn(1)[0].spawn_key, (2,))
+       draws = lambda s: [s.random().random() for _ in range(3)]
+       self.assertEqual(draws(a), draws(SeedSequence(42, (0,))))
+       self.assertNotEqual(a.random().random(), b.random().random())
+       self.assertNotEqual(root.random().random(), a.random().random())
+
+
+   def test_seeded_dice_share_one_stream(self):
+       hand = DiceHand(seed=7)
+       self.assertIs(hand._dice[0].rng, hand._dice[1].rng)
+       self.assertEqual(hand.roll_many(50), DiceHand(seed=7).roll_many(50))
+       self.assertEqual(Die(seed=3).roll_many(20), Die(seed=SeedSequence(3)).roll_many(20))
+
+
+   def test_game_rerun_by_index(self):
+       root = SeedSequence(2024)
+
+
+       def play(i, td_highs):
+           bots = [Computer("a", "A", Intelligence(20)), Computer("b", "B", Intelligence(25))]
+           g = Game(bots, highs=td_highs, seed=root.child(i))
+           g.start()
+           play_game(g)
+           return [p.score for p in g.players], g.turns_taken
+
+
+       with tempfile.TemporaryDirectory() as td:
+           hs = HighScore(path=f"{td}/hs.json")
+           runs = [play(i, hs) for i in range(4)]
+           self.assertEqual(play(2, hs), runs[2])
+
+
+   def test_seed_and_dice_together_are_rejected(self):
+       bots = [Computer("a", "A", Intelligence(20)), Computer("b", "B", Intelligence(25))]
+       with self.assertRaises(ValueError):
+           Game.headless(bots, dice=DiceHand(seed=1), seed=2)
+       hand = DiceHand(seed=1)
+       self.assertIs(Game.headless(bots, dice=hand).dice, hand)
+
+
+   def test_batch_game_rerun_by_index(self):
+       brains = [Intelligence(20), Intelligence(25)]
+       full = simulate_batch(brains, 50, target=50, seed=11)
+       one = simulate_batch(brains, 1, target=50, seed=11, first_index=37)
+       self.assertEqual(one.turns[0], full.turns[37])
+       self.assertEqual((one.scores0[0], one.scores1[0]), (full.scores0[37], full.scores1[37]))
+
+
+if __name__ == "__main__":
+   unittest.main()
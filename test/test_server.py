@@ -0,0 +1,117 @@
+import asyncio
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from dice.highscore import HighScore
+from dice.loadgen import _read_reply, run_load
+from dice.server import GameServer
+
+
+class TestGameServer(unittest.IsolatedAsyncioTestCase):
+   async def asyncSetUp(self):
+       self.td = tempfile.TemporaryDirectory()
+       self.hs_path = str(Path(self.td.name) / "hs.json")
+       self.server = GameServer("127.0.0.1", 0, HighScore(self.hs_path), idle_timeout=0.2)
+       await self.server.start()
+
+
+   async def asyncTearDown(self):
+       await self.server.close()
+       self.td.cleanup()
+
+
+   async def _command(self, reader, writer, line):
+       writer.write(f"{line}\n".encode())
+       await writer.drain()
+       return "\n".join(await _read_reply(reader))
+
+
+   async def test_session_plays_commands(self):
+       reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+       self.assertIn("Welcome", "\n".join(await _read_reply(reader)))
+       self.assertIn("Hello, Ada!", await self._command(reader, writer, "name Ada"))
+       self.assertIn("New game started!", await self._command(reader, writer, "start 20"))
+       self.assertIn("Turn total", await self._command(reader, writer, "show"))
+       self.assertIn("Unknown command", await self._command(reader, writer, "cheat 6 6"))
+       self.assertIn("Leaderboard", await self._command(reader, writer, "highscore"))
+       self.assertEqual(await self._command(reader, writer, "quit"), "Bye!")
+       writer.close()
+
+
+   async def test_idle_sessions_are_evicted(self):
+       reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+       await _read_reply(reader)
+       self.assertEqual(await reader.read(), b"")  # server hung up
+       self.assertEqual(self.server.metrics.counters["server.evicted"], 1)
+       self.assertFalse(self.server.sessions)
+       writer.close()
+
+
+   async def test_load_generator(self):
+       script = ("start 10", "roll", "roll", "roll", "hold", "show", "quit")
+       report = await run_load("127.0.0.1", self.server.port, sessions=30, concurrency=10, script=script)
+       self.assertEqual(report.sessions, 30)
+       self.assertEqual(len(report.latencies), 30 * len(script))
+       self.assertGreater(report.sessions_per_sec, 0)
+       self.assertIn("p99", report.format())
+
+
+   async def test_highscore_writes_run_off_the_loop(self):
+       threads = []
+       real = self.server.highs.highs.record_game
+
+
+       def spy(*args):
+           threads.append(threading.current_thread().name)
+           real(*args)
+
+
+       self.server.highs.highs.record_game = spy
+       self.server.highs.record_game("pid", "Ada", True, 5, 100)
+       await self.server.close()
+       self.assertTrue(threads[0].startswith("highscore"))
+       self.assertEqual(HighScore(self.hs_path).stats_for("pid")["wins"], 1)
+       self.server = GameServer("127.0.0.1", 0, HighScore(self.hs_path))
+       await self.server.start()
+
+
+   async def test_failed_highscore_writes_are_counted(self):
+       def broken(*args):
+           raise OSError("disk full")
+
+
+       self.server.highs.highs.record_game = broken
+       reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+       await _read_reply(reader)
+       with self.assertLogs("dice.server", "ERROR"):
+           self.server.highs.record_game("pid", "Ada", True, 5, 100)
+           await asyncio.get_running_loop().run_in_executor(self.server._io, lambda: None)
+       await self._command(reader, writer, "show")
+       self.assertEqual(self.server.metrics.counters["server.highscore_errors"], 1)
+       self.assertIsInstance(self.server.highs.errors[0], OSError)
+       writer.close()
+
+
+   async def test_expert_turns_run_off_the_loop(self):
+       reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+       await _read_reply(reader)
+       await self._command(reader, writer, "start 20 ai=expert")
+       (session,) = self.server.sessions
+       brain = session.shell.game.players[1].brain
+       threads = []
+       real = brain.should_hold
+
+
+       def spy(*args):
+           threads.append(threading.current_thread().name)
+           return real(*args)
+
+
+       brain.should_hold = spy
+       session.shell.game.set_cheat([(1, 2), (3, 3)])  # our turn ends on a single 1
+       await self._command(reader, writer, "roll")
+       self.assertTrue(threads)
+       self.assertTrue(all(name.startswith("expert") for name in threads))
+       self.assertIn("game.rolls", self.server.metrics.counters)
+       writer.close()
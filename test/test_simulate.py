@@ -0,0 +1,62 @@
+import math
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from dice.computer import Computer, Intelligence
+from dice.game import Game
+from dice.highscore import HighScore
+from dice.simulate import BUST, play_game, simulate_batch, turn_outcomes
+
+
+class TestSimulate(unittest.TestCase):
+   def test_turn_outcomes_sum_to_one(self):
+       dist = turn_outcomes(Intelligence(20), 0, 0, 100)
+       self.assertAlmostEqual(sum(dist.values()), 1.0)
+       self.assertTrue(all(k in (BUST, 0) or k >= 4 for k in dist))
+
+
+   def test_single_roll_strategy_is_exact(self):
+       dist = turn_outcomes(Intelligence(1), 0, 0, 100)  # rolls once, then holds
+       self.assertAlmostEqual(dist[BUST], 1 / 36)
+       self.assertAlmostEqual(dist[0], 10 / 36)
+       self.assertAlmostEqual(dist[4], 1 / 36)
+       self.assertAlmostEqual(dist[8], 5 / 36)
+       self.assertAlmostEqual(dist[12], 1 / 36)
+
+
+   def test_batch_result_shapes(self):
+       res = simulate_batch([Intelligence(20), Intelligence(25)], 200, target=50, rng=random.Random(7))
+       self.assertEqual(len(res), 200)
+       self.assertEqual(res.wins(0) + res.wins(1), 200)
+       for w, a, b in zip(res.winners, res.scores0, res.scores1):
+           self.assertGreaterEqual((a, b)[w], 50)
+           self.assertLess((a, b)[1 - w], 50)
+
+
+   def test_seeded_batches_are_reproducible(self):
+       brains = [Intelligence(20), Intelligence(20)]
+       a = simulate_batch(brains, 300, rng=random.Random(3))
+       b = simulate_batch(brains, 300, rng=random.Random(3))
+       self.assertEqual(a, b)
+
+
+   def test_matches_scalar_engine(self):
+       random.seed(11)
+       n_scalar = 1500
+       wins = turns = 0
+       with tempfile.TemporaryDirectory() as td:
+           hs = HighScore(path=str(Path(td) / "hs.json"))
+           for _ in range(n_scalar):
+               bots = [Computer("a", "A", Intelligence(15)), Computer("b", "B", Intelligence(25))]
+               g = Game(bots, target=60, highs=hs)
+               g.start()
+               play_game(g)
+               wins += g.winner() is g.players[0]
+               turns += g.turns_taken
+       res = simulate_batch([Intelligence(15), Intelligence(25)], 20000, target=60, rng=random.Random(11))
+       p = res.win_rate(0)
+       sigma = math.sqrt(p * (1 - p) / n_scalar)
+       self.assertLess(abs(wins / n_scalar - p), 4 * sigma)
+       mean_turns = sum(res.turns) / len(res)
+       self.assertLess(abs(turns / n_scalar - mean_turns), 0.1 * mean_turns)
@@ -0,0 +1,76 @@
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from dice.computer import Intelligence
+from dice.simulate import simulate_batch
+from dice.solver import DEFAULT_TABLE, OptimalIntelligence, PolicyTable, SolverError, save_table, solve
+
+
+class TestSolver(unittest.TestCase):
+   def test_converges_and_first_player_is_favoured(self):
+       sol = solve(target=20, tol=1e-10)
+       self.assertLess(sol.delta, 1e-10)
+       self.assertGreater(sol.win[0], 0.5)
+       self.assertTrue(all(0.0 <= w <= 1.0 for w in sol.win))
+
+
+   def test_non_convergence_raises(self):
+       with self.assertRaises(SolverError):
+           solve(target=20, tol=0.0, max_sweeps=2)
+
+
+   def test_table_roundtrip_and_optimal_beats_threshold(self):
+       sol = solve(target=30)
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "policy.bin")
+           save_table(path, sol)
+           table = PolicyTable(path)
+           self.assertEqual(table.target, 30)
+           self.assertTrue(table.should_roll(0, 0, 0))
+           self.assertFalse(table.should_roll(25, 0, 5))  # holding wins
+           table.close()
+
+
+           best = OptimalIntelligence(table_path=path)
+           self.assertTrue(best.should_hold(10, 20, 0, 30))
+           self.assertFalse(best.should_hold(0, 0, 0, 30))
+           # other targets fall back to the threshold rule
+           self.assertEqual(best.should_hold(19, 0, 0, 100), Intelligence().should_hold(19, 0, 0, 100))
+
+
+           n = 4000
+           a = simulate_batch([best, Intelligence(20)], n, target=30, rng=random.Random(1))
+           b = simulate_batch([Intelligence(20), best], n, target=30, rng=random.Random(2))
+           self.assertGreater((a.wins(0) + b.wins(1)) / (2 * n), 0.5)
+
+
+   def test_rejects_foreign_file(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = Path(td) / "junk.bin"
+           path.write_bytes(b"not a table at all")
+           with self.assertRaises(SolverError):
+               PolicyTable(str(path))
+
+
+   def test_default_table_is_solved_on_first_use(self):
+       cwd = os.getcwd()
+       with tempfile.TemporaryDirectory() as td:
+           os.chdir(td)
+           try:
+               best = OptimalIntelligence()
+               self.assertFalse(best.should_hold(0, 0, 0, 100))
+               self.assertFalse(best.should_hold(40, 50, 0, 100))  # a single 1 would bank it anyway
+               table = PolicyTable(DEFAULT_TABLE)
+               self.assertEqual(table.target, 100)
+               table.close()
+           finally:
+               os.chdir(cwd)
+
+
+   def test_missing_custom_table_names_the_command(self):
+       with tempfile.TemporaryDirectory() as td:
+           path = str(Path(td) / "missing.bin")
+           with self.assertRaisesRegex(SolverError, "python -m dice.solver"):
+               OptimalIntelligence(table_path=path).should_hold(5, 0, 0, 100)
@@ -0,0 +1,121 @@
+import math
+import random
+import statistics
+import unittest
+from dice.computer import Intelligence
+from dice.simulate import simulate_batch, simulate_until
+from dice.stats import FixedHistogram, Moments, QuantileSketch, SimStats
+
+
+class TestSummaries(unittest.TestCase):
+   def test_moments_match_statistics_and_merge(self):
+       rng = random.Random(1)
+       data = [rng.gauss(50, 12) for _ in range(2000)]
+       whole, a, b = Moments(), Moments(), Moments()
+       for x in data:
+           whole.add(x)
+       for x in data[:700]:
+           a.add(x)
+       for x in data[700:]:
+           b.add(x)
+       a.merge(b)
+       for m in (whole, a):
+           self.assertEqual(m.count, 2000)
+           self.assertAlmostEqual(m.mean, statistics.fmean(data))
+           self.assertAlmostEqual(m.variance, statistics.variance(data), places=6)
+           self.assertEqual((m.minimum, m.maximum), (min(data), max(data)))
+       self.assertEqual(Moments().merge(whole).count, 2000)
+
+
+   def test_histogram_bins_and_overflow(self):
+       h = FixedHistogram(0, 10, 3)
+       for x in (-1, 0, 9.9, 10, 29, 30, 500):
+           h.add(x)
+       self.assertEqual(h.counts, [1, 2, 1, 1, 2])
+       self.assertEqual(h.edges(), [0, 10, 20, 30])
+       self.assertEqual(h.quantile(0.5), 20)
+       self.assertEqual(h.quantile(1.0), math.inf)
+       with self.assertRaises(ValueError):
+           h.merge(FixedHistogram(0, 5, 3))
+
+
+   def test_sketch_quantiles_have_bounded_relative_error(self):
+       rng = random.Random(2)
+       data = [rng.lognormvariate(3, 1) for _ in range(5000)] + [0.0] * 50 + [-rng.expovariate(0.1) for _ in range(500)]
+       sketch, a, b = QuantileSketch(0.01), QuantileSketch(0.01), QuantileSketch(0.01)
+       for i, x in enumerate(data):
+           sketch.add(x)
+           (a if i % 2 else b).add(x)
+       a.merge(b)
+       self.assertEqual((a.positive, a.negative, a.zeros), (sketch.positive, sketch.negative, sketch.zeros))
+       ordered = sorted(data)
+       for q in (0.01, 0.05, 0.2, 0.5, 0.9, 0.99):
+           exact = ordered[int(q * (len(data) - 1))]
+           self.assertLessEqual(abs(sketch.quantile(q) - exact), 0.01 * abs(exact) + 1e-12, q)
+
+
+   def test_sketch_collapses_past_max_bins(self):
+       sketch = QuantileSketch(0.01, max_bins=10)
+       for i in range(1, 1000):
+           sketch.add(float(i))
+       self.assertEqual(len(sketch.positive), 10)
+       self.assertEqual(sum(sketch.positive.values()), 999)
+       self.assertAlmostEqual(sketch.quantile(1.0), 999, delta=10)
+
+
+class TestSimStats(unittest.TestCase):
+   def test_batch_records_every_game(self):
+       stats = SimStats()
+       res = simulate_batch([Intelligence(20), Intelligence(25)], 300, seed=4, stats=stats)
+       self.assertEqual(stats.games, 300)
+       self.assertEqual(stats.wins, [res.wins(0), res.wins(1)])
+       self.assertAlmostEqual(stats.turns.moments.mean, sum(res.turns) / 300)
+       self.assertEqual(stats.margin.moments.maximum, max(abs(a - b) for a, b in zip(res.scores0, res.scores1)))
+       self.assertTrue(0.0 < stats.bust_rate < 0.2)
+       self.assertLessEqual(stats.hold.moments.maximum, 25 + 12)
+
+
+   def test_parallel_parts_merge_into_the_whole(self):
+       brains = [Intelligence(20), Intelligence(20)]
+       whole, a, b = SimStats(), SimStats(), SimStats()
+       simulate_batch(brains, 400, seed=9, stats=whole)
+       simulate_batch(brains, 150, seed=9, stats=a)
+       simulate_batch(brains, 250, seed=9, first_index=150, stats=b)
+       merged = a.merge(b).to_dict()
+       expected = whole.to_dict()
+       self.assertEqual(merged["wins"], expected["wins"])
+       self.assertEqual(merged["bust_rate"], expected["bust_rate"])
+       for key in ("turns", "margin", "hold"):
+           for stat in ("count", "min", "max", "p50", "p99"):
+               self.assertEqual(merged[key][stat], expected[key][stat])
+           self.assertAlmostEqual(merged[key]["mean"], expected[key]["mean"])
+           self.assertAlmostEqual(merged[key]["stddev"], expected[key]["stddev"])
+
+
+   def test_run_until_interval_is_narrow_enough(self):
+       brains = [Intelligence(20), Intelligence(25)]
+       stats = simulate_until(brains, 0.05, seed=1, min_batch=100)
+       self.assertLess(stats.ci_width(), 0.05)
+       self.assertGreater(stats.games, 100)
+       again = simulate_until(brains, 0.05, seed=1, min_batch=100)
+       self.assertEqual(again.to_dict(), stats.to_dict())
+       turns = simulate_until(brains, 1.0, quantity="turns", seed=1, min_batch=100)
+       self.assertLess(turns.ci_width("turns"), 1.0)
+       capped = simulate_until(brains, 1e-6, seed=1, min_batch=100, max_games=250)
+       self.assertEqual(capped.games, 250)
+       with self.assertRaises(ValueError):
+           SimStats().spread("luck")
+
+
+   def test_one_sided_start_does_not_stop_the_run(self):
+       brains = [Intelligence(20), Intelligence(20)]
+       stats = simulate_until(brains, 0.05, seed=2, min_batch=2)
+       self.assertGreater(stats.games, 1000)
+       self.assertLess(stats.ci_width(), 0.05)
+       swept = SimStats()
+       swept.record_game(0, 10, 100, 40)
+       swept.record_game(0, 12, 100, 60)
+       self.assertGreater(swept.spread(), 0.0)
+       holds = simulate_until(brains, 0.5, quantity="hold", seed=2, min_batch=50)
+       self.assertLess(holds.ci_width("hold"), 0.5)
+       self.assertGreater(holds.observations("hold"), holds.games)
@@ -0,0 +1,52 @@
+import unittest
+from dice.computer import Intelligence
+from dice.tournament import Task, TournamentResult, format_report, parse_strategy, run_tournament, schedule, wilson
+
+
+class TestTournament(unittest.TestCase):
+   def test_parse_strategy(self):
+       self.assertEqual(parse_strategy("15"), Intelligence(15))
+       self.assertEqual(parse_strategy("threshold:25"), Intelligence(25))
+       self.assertEqual(parse_strategy("dice.computer:Intelligence"), Intelligence())
+       with self.assertRaises(ValueError):
+           parse_strategy("bogus")
+
+
+   def test_schedule_alternates_starts(self):
+       tasks = list(schedule(3, games=5, chunk=2))
+       self.assertEqual(len(tasks), 3 * 3)
+       self.assertEqual(sum(t.games for t in tasks if (t.a, t.b) == (0, 1)), 5)
+       self.assertEqual([(t.a_first, t.games) for t in tasks[:3]], [(True, 2), (False, 2), (True, 1)])
+       self.assertEqual([t.chunk for t in tasks[:3]], [0, 1, 2])
+
+
+   def test_schedule_splits_starts_evenly(self):
+       tasks = list(schedule(2, games=10_000, chunk=2_000))
+       self.assertEqual(sum(t.games for t in tasks if t.a_first), 5_000)
+       self.assertEqual(sum(t.games for t in tasks if not t.a_first), 5_000)
+
+
+   def test_unfinished_games_are_draws(self):
+       result = TournamentResult(["15", "20"])
+       result.record(Task(0, 1, True, 0, 10), 6, 3)
+       self.assertEqual((result.pairs[0, 1].draws, result.pairs[0, 1].games), (1, 10))
+       self.assertEqual([r[2] for r in result.standings()], [10, 10])
+       self.assertIn("1 drawn", format_report(result))
+
+
+   def test_wilson_interval(self):
+       lo, hi = wilson(50, 100)
+       self.assertLess(lo, 0.5)
+       self.assertGreater(hi, 0.5)
+       self.assertAlmostEqual(lo + hi, 1.0)
+       self.assertEqual(wilson(0, 0), (0.0, 1.0))
+
+
+   def test_deterministic_across_worker_counts(self):
+       specs = ["15", "20", "25"]
+       inline = run_tournament(specs, games=400, target=50, seed=3, workers=0, chunk=150)
+       pooled = run_tournament(specs, games=400, target=50, seed=3, workers=2, chunk=150)
+       self.assertEqual(inline.pairs, pooled.pairs)
+       standings = inline.standings()
+       self.assertEqual(sum(r[1] for r in standings), 3 * 400)
+       self.assertTrue(all(r[2] == 800 for r in standings))
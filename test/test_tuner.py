@@ -0,0 +1,41 @@
+import unittest
+from dice.tournament import parse_strategy
+from dice.computer import EndgameIntelligence
+from dice.tuner import default_grid, format_report, tune
+
+
+class TestTuner(unittest.TestCase):
+   def test_parse_endgame_spec(self):
+       self.assertEqual(parse_strategy("endgame:18,1.5,20"), EndgameIntelligence(18, 1.5, 20))
+       self.assertEqual(parse_strategy("endgame:18"), EndgameIntelligence(18))
+       for spec in default_grid():
+           parse_strategy(spec)
+
+
+   def test_racing_drops_clear_losers_early(self):
+       specs = ["2", "8", "12", "endgame:12,1.0,10"]
+       tiers = {"weak": 0.25, "hard": 1.0}
+       res = tune(specs, reference="10", tiers=tiers, batch=200, max_games=3000, target=40, seed=1, workers=0)
+       games = {c.spec: c.games for c in res.candidates}
+       self.assertLess(games["2"], 3000)
+       self.assertNotEqual(res.best["hard"].spec, "2")
+       self.assertLess(res.games_played, res.grid_games)
+       self.assertGreater(res.seconds_saved, 0.0)
+       data = res.to_json(tiers)
+       self.assertEqual(set(data["tiers"]), {"weak", "hard"})
+       self.assertIn("saved", format_report(res))
+       again = tune(specs, reference="10", tiers=tiers, batch=200, max_games=3000, target=40, seed=1, workers=0)
+       self.assertEqual([(c.wins, c.games) for c in again.candidates], [(c.wins, c.games) for c in res.candidates])
+
+
+   def test_decided_tiers_stop_racing(self):
+       tiers = {"weak": 0.0, "hard": 1.0}
+       res = tune(["1", "18", "20", "22"], reference="20", tiers=tiers, batch=200, max_games=2000, target=40, seed=1, workers=0)
+       games = {c.spec: c.games for c in res.candidates}
+       self.assertEqual(res.best["weak"].spec, "1")
+       self.assertEqual(games["1"], 200)  # alone in "weak" after one round
+       self.assertGreater(res.rounds, 1)
+
+
+if __name__ == "__main__":
+   unittest.main()